@@ -0,0 +1,26 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Load workbooks and read worksheets without blocking an asyncio event loop.
+
+Parsing is done in other threads, so the event loop stays responsive, but
+it still competes for the interpreter with other Python code.
+"""
+import asyncio
+from functools import partial
+
+from openpyxl.reader.excel import load_workbook
+from openpyxl.worksheet._async import aiter_rows
+
+
+async def aload_workbook(filename, *args, executor=None, **kw):
+    """
+    Open a workbook in another thread, or in the thread pool `executor` if
+    one is given, and return it. Takes the same arguments as
+    :func:`openpyxl.reader.excel.load_workbook`.
+
+    Read-only worksheets can be read with `ws.aiter_rows()`.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, partial(load_workbook, filename, *args, **kw)
+    )
@@ -0,0 +1,5 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Synthetic benchmarks. Run a module directly, e.g.
+python -m openpyxl.benchmarks.reader
+"""
@@ -0,0 +1,64 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Measure how many cells per second can be read in standard and read-only mode
+"""
+import argparse
+import time
+from io import BytesIO
+
+from openpyxl import Workbook
+from openpyxl import load_workbook
+
+
+def make_workbook(rows, cols):
+    """
+    Create a workbook containing a mixture of numbers and strings
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for idx in range(rows):
+        ws.append([idx * col if col % 4 else f"s{idx % 100}" for col in range(cols)])
+    out = BytesIO()
+    wb.save(out)
+    return out
+
+
+def read_only(src):
+    wb = load_workbook(src, read_only=True)
+    for row in wb.active.iter_rows():
+        pass
+    wb.close()
+
+
+def values_only(src):
+    wb = load_workbook(src, read_only=True)
+    for row in wb.active.iter_rows(values_only=True):
+        pass
+    wb.close()
+
+
+def standard(src):
+    load_workbook(src)
+
+
+def run(rows=20000, cols=20, repeat=3):
+    src = make_workbook(rows, cols)
+    cells = rows * cols
+    for func in (standard, read_only, values_only):
+        timings = []
+        for _ in range(repeat):
+            src.seek(0)
+            start = time.perf_counter()
+            func(src)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(f"{func.__name__:<12} {best:6.2f}s {cells / best:12,.0f} cells/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.cols, args.repeat)
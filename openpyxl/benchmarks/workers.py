@@ -0,0 +1,53 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Measure how loading a workbook with many worksheets scales with the number
+of processes used to parse them
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from openpyxl import Workbook
+from openpyxl import load_workbook
+
+
+def make_workbook(path, sheets, rows, cols):
+    """
+    Create a workbook with several worksheets containing a mixture of numbers
+    and strings
+    """
+    wb = Workbook(write_only=True)
+    for _ in range(sheets):
+        ws = wb.create_sheet()
+        for idx in range(rows):
+            ws.append(
+                [idx * col if col % 4 else f"s{idx % 100}" for col in range(cols)]
+            )
+    wb.save(path)
+
+
+def run(sheets=16, rows=5000, cols=20, workers=(1, 2, 4, 8), repeat=3):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "workers.xlsx")
+        make_workbook(path, sheets, rows, cols)
+        cells = sheets * rows * cols
+        for n in workers:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                load_workbook(path, workers=n if n > 1 else None)
+                timings.append(time.perf_counter() - start)
+            best = min(timings)
+            print(f"workers={n:<3} {best:6.2f}s {cells / best:12,.0f} cells/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sheets", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sheets, args.rows, args.cols, args.workers, args.repeat)
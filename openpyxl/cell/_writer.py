@@ -1,12 +1,17 @@
 # Copyright (c) 2010-2024 openpyxl
 from datetime import timedelta
+from math import isinf
+from math import isnan
 
 from lxml.etree import Element
 from lxml.etree import SubElement
 
 from openpyxl import LXML
+from openpyxl.cell.cell import ERROR_CODES
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from openpyxl.cell.rich_text import CellRichText
 from openpyxl.compat import safe_string
+from openpyxl.utils.exceptions import IllegalCharacterError
 from openpyxl.utils.datetime import to_excel
 from openpyxl.utils.datetime import to_ISO8601
 from openpyxl.worksheet.formula import ArrayFormula
@@ -44,6 +49,15 @@ def _set_attributes(cell, styled=None):
             attrs["t"] = "n"
             value = to_excel(value, cell.parent.parent.epoch)
 
+    elif cell.data_type == "s" and value.__class__ is str and value:
+        # rich text is always written inline
+        strings = getattr(cell.parent.parent, "_string_table", None)
+        if strings is not None:
+            idx = strings.add(value)
+            if idx is not None:
+                attrs["t"] = "s"
+                value = idx
+
     if cell.hyperlink:
         cell.parent._hyperlinks.append(cell.hyperlink)
 
@@ -74,7 +88,7 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == "s":
+    if attributes.get("t") == "inlineStr":
         if isinstance(value, CellRichText):
             el.append(value.to_tree())
         else:
@@ -117,7 +131,7 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == "s":
+        if attributes.get("t") == "inlineStr":
             if isinstance(value, CellRichText):
                 el = value.to_tree()
                 xf.write(el)
@@ -137,6 +151,107 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(safe_string(value))
 
 
+def _escape(value):
+    """
+    Escape text as lxml does
+    """
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    return value
+
+
+# Markup for cells holding plain values, which is the same as that written
+# for them by write_cell(). Non-ASCII characters are replaced when the
+# markup is encoded. Only lxml writes empty elements in full.
+
+if LXML:
+    EMPTY_STRING = 't="inlineStr"></c>'
+    EMPTY_VALUE = "<v></v>"
+else:
+    EMPTY_STRING = 't="inlineStr"/>'
+    EMPTY_VALUE = "<v/>"
+
+
+def raw_int(ref, value):
+    return f'<c r="{ref}" t="n"><v>{value:.16g}</v></c>'
+
+
+def raw_float(ref, value):
+    if isnan(value) or isinf(value):
+        return f'<c r="{ref}" t="n"><v></v></c>'
+    return f'<c r="{ref}" t="n"><v>{value:.16g}</v></c>'
+
+
+def raw_number(ref, value):
+    return f'<c r="{ref}" t="n"><v>{safe_string(value)}</v></c>'
+
+
+def raw_bool(ref, value):
+    return f'<c r="{ref}" t="b"><v>{value:d}</v></c>'
+
+
+def raw_string(ref, value):
+    value = value[:32767]
+    if ILLEGAL_CHARACTERS_RE.search(value):
+        raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+    if not value:
+        return f'<c r="{ref}" {EMPTY_STRING}'
+    if len(value) > 1 and value[0] == "=":
+        return f'<c r="{ref}"><f>{_escape(value[1:])}</f>{EMPTY_VALUE}</c>'
+    if value in ERROR_CODES:
+        return f'<c r="{ref}" t="e"><v>{value}</v></c>'
+    space = ""
+    if value != value.strip():
+        space = ' xml:space="preserve"'
+    return f'<c r="{ref}" t="inlineStr"><is><t{space}>{_escape(value)}</t></is></c>'
+
+
+def raw_shared_string_writer(strings):
+    """
+    Return a function for the markup of strings which are added to a shared
+    string table, or written inline if it is full
+    """
+
+    def raw_shared_string(ref, value):
+        value = value[:32767]
+        if not value or value in ERROR_CODES or (len(value) > 1 and value[0] == "="):
+            return raw_string(ref, value)
+        if ILLEGAL_CHARACTERS_RE.search(value):
+            raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+        idx = strings.add(value)
+        if idx is None:
+            return raw_string(ref, value)
+        return f'<c r="{ref}" t="s"><v>{idx}</v></c>'
+
+    return raw_shared_string
+
+
+def raw_date_writer(style_id, epoch, iso_dates=False):
+    """
+    Return a function for the markup of dates, times and timedeltas with
+    the style given
+    """
+
+    def raw_date(ref, value):
+        if getattr(value, "tzinfo", None) is not None:
+            raise TypeError(
+                "Excel does not support timezones in datetimes. "
+                "The tzinfo in the datetime/time object must be set to None."
+            )
+        if iso_dates and not isinstance(value, timedelta):
+            return f'<c r="{ref}" s="{style_id}" t="d"><v>{to_ISO8601(value)}</v></c>'
+        value = safe_string(to_excel(value, epoch))
+        return f'<c r="{ref}" s="{style_id}" t="n"><v>{value}</v></c>'
+
+    return raw_date
+
+
 if LXML:
     write_cell = lxml_write_cell
 else:
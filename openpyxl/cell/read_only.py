@@ -5,20 +5,49 @@ from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE
 from openpyxl.utils import get_column_letter
 
 
+class RawValue:
+    """
+    The text of a cell's value, or the element of an inline string, as it was
+    read, to be converted by the parser when it is first used. Formulae shared
+    with an earlier cell are kept as the translator and offsets.
+    """
+
+    __slots__ = ("parser", "text", "data_type", "style_id", "coordinate", "formula")
+
+    def __init__(self, parser, text, data_type, style_id, coordinate, formula=None):
+        self.parser = parser
+        self.text = text
+        self.data_type = data_type
+        self.style_id = style_id
+        self.coordinate = coordinate
+        self.formula = formula
+
+    def decode(self):
+        """
+        Return the value and its data type
+        """
+        if self.formula is not None:
+            trans, row_delta, col_delta = self.formula
+            return trans.translate_formula(row_delta=row_delta, col_delta=col_delta), "f"
+        return self.parser.decode_value(
+            self.text, self.data_type, self.style_id, self.coordinate
+        )
+
+
 class ReadOnlyCell:
-    __slots__ = ("parent", "row", "column", "_value", "data_type", "_style_id")
+    __slots__ = ("parent", "row", "column", "_value", "_data_type", "_style_id")
 
     def __init__(self, sheet, row, column, value, data_type="n", style_id=0):
         self.parent = sheet
         self._value = None
         self.row = row
         self.column = column
-        self.data_type = data_type
+        self._data_type = data_type
         self.value = value
         self._style_id = style_id
 
     def __eq__(self, other):
-        for a in self.__slots__:
+        for a in ("parent", "row", "column", "value", "data_type", "_style_id"):
             if getattr(self, a) != getattr(other, a):
                 return
         return True
@@ -87,13 +116,27 @@ class ReadOnlyCell:
     def is_date(self):
         return Cell.is_date.__get__(self)
 
+    @property
+    def data_type(self):
+        if self._value.__class__ is RawValue:
+            self._value, self._data_type = self._value.decode()
+        return self._data_type
+
+    @data_type.setter
+    def data_type(self, value):
+        self._data_type = value
+
     @property
     def internal_value(self):
-        return self._value
+        return self.value
 
     @property
     def value(self):
-        return self._value
+        value = self._value
+        if value.__class__ is RawValue:
+            value, self._data_type = value.decode()
+            self._value = value
+        return value
 
     @value.setter
     def value(self, value):
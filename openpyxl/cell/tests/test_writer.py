@@ -327,3 +327,29 @@ def test_rich_text(worksheet, write_cell_implementation):
     xml = out.getvalue()
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+def test_write_shared_string(worksheet, write_cell_implementation):
+    from openpyxl.writer.strings import SharedStringWriter
+
+    write_cell = write_cell_implementation
+    ws = worksheet
+    ws.parent._string_table = SharedStringWriter(max_strings=1)
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        with xf.element("row"):
+            for value in ["Hello", "Hello", "World"]:
+                cell = ws["A1"]
+                cell.value = value
+                write_cell(xf, ws, cell)
+
+    xml = out.getvalue()
+    expected = """
+    <row>
+    <c r="A1" t="s"><v>0</v></c>
+    <c r="A1" t="s"><v>0</v></c>
+    <c r="A1" t="inlineStr"><is><t>World</t></is></c>
+    </row>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
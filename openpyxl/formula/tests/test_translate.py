@@ -224,6 +224,7 @@ class TestTranslator:
             ("$DEF:$FOV", 25, 25, "$DEF:$FOV"),
             ("HA:$JA", -5, -15, "GL:$JA"),
             ("named1", -33, 33, "named1"),
+            ("Sheet1!named1", 1, 1, "Sheet1!named1"),
             ("A15", -3, 4, "E12"),
             ("$AB303", 3, 2, "$AB306"),
             ("YY$101", 4, 2, "ZA$101"),
@@ -282,7 +283,49 @@ class TestTranslator:
         trans = Translator(formula, origin)
         assert trans.translate_formula(dest) == result
 
+    def test_translate_qualified_name(self, Translator):
+        trans = Translator("=Sheet1!name+1", "A1")
+        assert trans.translate_formula("B2") == "=Sheet1!name+1"
+        assert trans.expand(1, 1) == "=Sheet1!name+1"
+
     def test_translate_formula_coordinates(self, Translator):
         trans = Translator("='Summary slices'!C3", "A1")
         result = trans.translate_formula(row_delta=2, col_delta=3)
         assert result == "='Summary slices'!F5"
+
+    def test_compile(self, Translator):
+        from ..translate import COLUMN
+        from ..translate import ROW
+
+        trans = Translator("=SUM(A1:$B2)+Sheet2!C$3", "A1")
+        assert trans.compile() == [
+            "=SUM(",
+            (COLUMN, 1),
+            (ROW, 1),
+            ":$B",
+            (ROW, 2),
+            ")+Sheet2!",
+            (COLUMN, 3),
+            "$3",
+        ]
+
+    def test_expand(self, Translator):
+        from ..tokenizer import Token
+
+        trans = Translator("=SUM(A1:$B2)+Sheet2!C$3+named+Sheet1!name", "A1")
+        for row_delta, col_delta in [(0, 0), (5, 0), (5, 2), (0, 2), (1, 0)]:
+            tokens = trans.get_tokens()
+            expected = "=" + "".join(
+                Translator.translate_range(t.value, row_delta, col_delta)
+                if t.subtype == Token.RANGE
+                else t.value
+                for t in tokens
+            )
+            assert trans.expand(row_delta, col_delta) == expected
+        assert sorted(trans._columns) == [0, 2]
+
+    @pytest.mark.parametrize("row_delta, col_delta", [(-2, 0), (0, -2), (0, 18278)])
+    def test_expand_out_of_range(self, Translator, TranslatorError, row_delta, col_delta):
+        trans = Translator("=B2", "B2")
+        with pytest.raises(TranslatorError):
+            trans.expand(row_delta, col_delta)
@@ -16,6 +16,11 @@ from openpyxl.utils import coordinate_to_tuple
 from openpyxl.utils import get_column_letter
 
 
+# the kinds of reference in compiled formulae
+ROW = "row"
+COLUMN = "column"
+
+
 class TranslatorError(Exception):
     """
     Raised when a formula can't be translated across cells.
@@ -48,6 +53,8 @@ class Translator:
         # formulae stored in the workbook must be in A1 notation.
         self.row, self.col = coordinate_to_tuple(origin)
         self.tokenizer = Tokenizer(formula)
+        self._template = None
+        self._columns = {}
 
     def get_tokens(self):
         "Returns a list with the tokens comprising the formula."
@@ -137,13 +144,130 @@ class Translator:
             )
         match = cls.CELL_REF_RE.match(range_str)
         if match is None:  # Must be a named range
-            return range_str
+            return ws_part + range_str
         return (
             ws_part
             + cls.translate_col(match.group(1), cdelta)
             + cls.translate_row(match.group(2), rdelta)
         )
 
+    @classmethod
+    def compile_row(cls, row_str):
+        if row_str.startswith("$"):
+            return [row_str]
+        return [(ROW, int(row_str))]
+
+    @classmethod
+    def compile_col(cls, col_str):
+        if col_str.startswith("$"):
+            return [col_str]
+        try:
+            return [(COLUMN, column_index_from_string(col_str))]
+        except ValueError:
+            raise TranslatorError("Formula out of range")
+
+    @classmethod
+    def compile_range(cls, range_str):
+        """
+        Split a range reference into fixed text and the rows and columns
+        which change when it is translated, as translate_range() would
+        """
+        ws_part, range_str = cls.strip_ws_name(range_str)
+        parts = [ws_part]
+        match = cls.ROW_RANGE_RE.match(range_str)
+        if match is not None:
+            parts += cls.compile_row(match.group(1))
+            parts.append(":")
+            parts += cls.compile_row(match.group(2))
+            return parts
+        match = cls.COL_RANGE_RE.match(range_str)
+        if match is not None:
+            parts += cls.compile_col(match.group(1))
+            parts.append(":")
+            parts += cls.compile_col(match.group(2))
+            return parts
+        if ":" in range_str:
+            for idx, piece in enumerate(range_str.split(":")):
+                if idx:
+                    parts.append(":")
+                parts += cls.compile_range(piece)
+            return parts
+        match = cls.CELL_REF_RE.match(range_str)
+        if match is None:
+            parts.append(range_str)
+            return parts
+        parts += cls.compile_col(match.group(1))
+        parts += cls.compile_row(match.group(2))
+        return parts
+
+    def compile(self):
+        """
+        Compile the formula into a template of fixed text, and the relative
+        rows and columns of its references, so that it can be translated
+        without going through the tokens again
+        """
+        tokens = self.get_tokens()
+        if not tokens:
+            return [""]
+        elif tokens[0].type == Token.LITERAL:
+            return [tokens[0].value]
+        parts = ["="]
+        for token in tokens:
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                parts += self.compile_range(token.value)
+            else:
+                parts.append(token.value)
+
+        # join adjacent text
+        template = []
+        for part in parts:
+            if isinstance(part, str) and template and isinstance(template[-1], str):
+                template[-1] += part
+            else:
+                template.append(part)
+        return template
+
+    def _resolve_columns(self, col_delta):
+        """
+        Translate the columns of the template, leaving the rows as numbers
+        """
+        if self._template is None:
+            self._template = self.compile()
+        template = []
+        for part in self._template:
+            if isinstance(part, tuple):
+                kind, value = part
+                if kind == ROW:
+                    template.append(value)
+                    continue
+                try:
+                    part = get_column_letter(value + col_delta)
+                except ValueError:
+                    raise TranslatorError("Formula out of range")
+            if template and isinstance(part, str) and isinstance(template[-1], str):
+                template[-1] += part
+            else:
+                template.append(part)
+        return template
+
+    def expand(self, row_delta, col_delta):
+        """
+        Translate the formula by the given number of rows and columns using
+        its template. The columns are only translated once for each offset.
+        """
+        template = self._columns.get(col_delta)
+        if template is None:
+            template = self._columns[col_delta] = self._resolve_columns(col_delta)
+        out = []
+        for part in template:
+            if part.__class__ is int:
+                part += row_delta
+                if part <= 0:
+                    raise TranslatorError("Formula out of range")
+                part = str(part)
+            out.append(part)
+        return "".join(out)
+
     def translate_formula(self, dest=None, row_delta=0, col_delta=0):
         """
         Convert the formula into A1 notation, or as row and column coordinates
@@ -152,12 +276,6 @@ class Translator:
         whose address is `dest` (no worksheet name).
 
         """
-        tokens = self.get_tokens()
-        if not tokens:
-            return ""
-        elif tokens[0].type == Token.LITERAL:
-            return tokens[0].value
-        out = ["="]
         # per the spec:
         # A compliant producer or consumer considers a defined name in the
         # range A1-XFD1048576 to be an error. All other names outside this
@@ -167,9 +285,4 @@ class Translator:
             row, col = coordinate_to_tuple(dest)
             row_delta = row - self.row
             col_delta = col - self.col
-        for token in tokens:
-            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
-                out.append(self.translate_range(token.value, row_delta, col_delta))
-            else:
-                out.append(token.value)
-        return "".join(out)
+        return self.expand(row_delta, col_delta)
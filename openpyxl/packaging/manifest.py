@@ -106,10 +106,11 @@ class Manifest(Serialisable):
         """
         Custom serialisation method to allow setting a default namespace
         """
-        defaults = [t.Extension for t in self.Default]
-        for ext, mime in self.extensions:
-            if ext not in defaults:
-                mime = FileExtension(ext, mime)
+        defaults = self._default_extensions()
+        exts = {os.path.splitext(part.PartName)[-1] for part in self.Override}
+        for ext in sorted(exts):
+            if ext and ext[1:].lower() not in defaults:
+                mime = FileExtension(ext[1:], mimetypes.types_map[True][ext])
                 self.Default.append(mime)
         tree = super().to_tree()
         tree.set("xmlns", CONTYPES_NS)
@@ -161,13 +162,29 @@ class Manifest(Serialisable):
         """
         Make sure that the mime type for all file extensions is registered
         """
+        defaults = self._default_extensions()
         for fn in filenames:
             ext = os.path.splitext(fn)[-1]
-            if not ext:
+            if not ext or ext[1:].lower() in defaults:
                 continue
             mime = mimetypes.types_map[True][ext]
             fe = FileExtension(ext[1:], mime)
             self.Default.append(fe)
+            defaults.add(ext[1:].lower())
+
+    def _default_extensions(self):
+        """
+        The extensions which already have a default content type
+        """
+        return {t.Extension.lower() for t in self.Default}
+
+    def add_default(self, extension, content_type):
+        """
+        Add the content type of an extension which is not known, unless the
+        extension already has one
+        """
+        if extension.lower() not in self._default_extensions():
+            self.Default.append(FileExtension(extension, content_type))
 
     def _write_vba(self, workbook):
         """
@@ -216,6 +216,21 @@ class TestManifest:
             ("xml", "application/xml"),
         ]
 
+    def test_add_default(self, Manifest):
+        from ..manifest import mimetypes
+
+        manifest = Manifest()
+        manifest.add_default("foo", "application/x-foo")
+        manifest.add_default("FOO", "application/x-other")
+        manifest.add_default("xml", "text/xml")
+        manifest._register_mimetypes(["xl/extra.foo"])
+        assert [(t.Extension, t.ContentType) for t in manifest.Default] == [
+            ("rels", "application/vnd.openxmlformats-package.relationships+xml"),
+            ("xml", "application/xml"),
+            ("foo", "application/x-foo"),
+        ]
+        assert ".foo" not in mimetypes.types_map[True]
+
     def test_no_dupe_overrides(self, Manifest):
         manifest = Manifest()
         assert len(manifest.Override) == 4
@@ -0,0 +1,178 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Parse worksheets in other processes. Each process opens the archive itself
+and sends back the cells as records, which are bound to the workbook in the
+parent.
+
+Single large worksheets in read-only mode can also be split into partitions
+of rows, which are parsed in other processes.
+"""
+import mmap
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+from openpyxl.worksheet._partition import split_rows
+from openpyxl.worksheet._reader import WorkSheetParser
+from openpyxl.worksheet._row_index import CHUNK_SIZE
+
+from .strings import SharedStringTable
+
+# the shared strings of the workbook being read by this process
+_shared_strings = None
+
+
+def _init(filename, shared_strings, strings_path=None, rich_text=False):
+    global _shared_strings
+    if shared_strings is None and strings_path is not None:
+        with ZipFile(filename) as archive:
+            with archive.open(strings_path) as src:
+                shared_strings = SharedStringTable(src, rich_text)
+    _shared_strings = shared_strings
+
+
+def parse_worksheet(filename, worksheet_path, options):
+    """
+    Parse a worksheet and return its rows and the parser, which holds
+    everything else found in the worksheet
+    """
+    with ZipFile(filename) as archive:
+        with archive.open(worksheet_path) as src:
+            parser = WorkSheetParser(src, _shared_strings, **options)
+            rows = list(parser.parse())
+    parser.source = parser.shared_strings = None
+    return rows, parser
+
+
+def parse_worksheets(
+    filename, worksheet_paths, shared_strings, strings_path, options, workers
+):
+    """
+    Parse worksheets in a pool of processes and yield the results in the
+    same order
+    """
+    args = (filename, shared_strings)
+    if isinstance(shared_strings, SharedStringTable):
+        # lazy tables cannot be sent to other processes so each reads its own
+        args = (filename, None, strings_path, shared_strings.rich_text)
+    n = len(worksheet_paths)
+    with ProcessPoolExecutor(workers, initializer=_init, initargs=args) as executor:
+        yield from executor.map(
+            parse_worksheet, [filename] * n, worksheet_paths, [options] * n
+        )
+
+
+def _values(row, min_col, max_col):
+    # as ReadOnlyWorksheet._get_row with values only
+    if not row and not max_col:
+        return ()
+    max_col = max_col or row[-1][1]
+    values = [None] * (max_col + 1 - min_col)
+    for cell in row:
+        column = cell[1]
+        if min_col <= column <= max_col:
+            values[column - min_col] = cell[2]
+    return tuple(values)
+
+
+def map_partition(func, path, header, footer, partition, options, window):
+    """
+    Parse a partition of a worksheet and apply a function to the values of
+    each row. Return the results with their row numbers and the number of
+    the last row parsed.
+    """
+    min_row, max_row, min_col, max_col = window
+    with open(path, "rb") as src:
+        src.seek(partition.start)
+        rows = src.read(partition.end - partition.start)
+    parser = WorkSheetParser(BytesIO(header + rows + footer), _shared_strings, **options)
+    parser.shared_formulae = partition.shared_formulae
+    if min_col > 1:
+        parser.min_col = min_col
+    parser.max_col = max_col
+
+    results = []
+    idx = 0
+    for idx, row in parser.parse():
+        if max_row is not None and idx > max_row:
+            break
+        if idx >= min_row:
+            results.append((idx, func(_values(row, min_col, max_col))))
+    return results, idx
+
+
+def map_worksheet(ws, func, workers, min_row, max_row, min_col, max_col):
+    """
+    Apply a function to the values of each row of a read-only worksheet in a
+    pool of processes and yield the results in row order
+    """
+    wb = ws.parent
+    options = dict(
+        data_only=wb.data_only,
+        epoch=wb.epoch,
+        date_formats=wb._date_formats,
+        timedelta_formats=wb._timedelta_formats,
+        engine=ws._engine,
+    )
+    window = (min_row, max_row, min_col, max_col)
+    empty_row = []
+    if max_col is not None:
+        empty_row = (None,) * (max_col + 1 - min_col)
+
+    counter = min_row
+    with TemporaryDirectory(prefix="openpyxl.") as tmp:
+        path = os.path.join(tmp, "worksheet.xml")
+        with ws._get_source() as src, open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        if not os.path.getsize(path):
+            return
+
+        parts = (workers or os.cpu_count() or 1) * 4
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header, footer, partitions = split_rows(data, parts, not wb.data_only)
+
+        # partitions outside the rows wanted are not needed
+        beyond = False
+        wanted = []
+        for p, following in zip(partitions, partitions[1:] + [None]):
+            if p.row is not None and max_row is not None and p.row > max_row:
+                beyond = True
+            elif following is None or following.row is None or following.row > min_row:
+                wanted.append(p)
+        partitions = wanted
+
+        n = len(partitions)
+        args = (None, ws._shared_strings)
+        with ProcessPoolExecutor(workers, initializer=_init, initargs=args) as executor:
+            results = executor.map(
+                map_partition,
+                [func] * n,
+                [path] * n,
+                [header] * n,
+                [footer] * n,
+                partitions,
+                [options] * n,
+                [window] * n,
+            )
+            for rows, last in results:
+                for idx, value in rows:
+                    if idx < counter:
+                        continue
+                    # some rows are missing
+                    for _ in range(counter, idx):
+                        yield func(empty_row)
+                    counter = idx + 1
+                    yield value
+                if max_row is not None and last > max_row:
+                    beyond = True
+                    break
+
+    # as with iter_rows, rows up to max_row are only returned if the
+    # worksheet goes beyond it
+    if beyond:
+        for _ in range(counter, max_row + 1):
+            yield func(empty_row)
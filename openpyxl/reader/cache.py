@@ -0,0 +1,238 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+An on-disk cache for the parts of a workbook that are expensive to read
+but only change when the file does: the shared strings, the stylesheet,
+the dimensions of worksheets and any row indexes.
+
+Entries are keyed on the names, CRCs and sizes of the members of the
+archive. They are stored with pickle so the cache must be kept in a
+directory that only trusted users can write to.
+"""
+import hashlib
+import os
+import pickle
+import shutil
+import time
+import warnings
+from tempfile import mkstemp
+
+from openpyxl._constants import __version__
+from openpyxl.worksheet._row_index import Checkpoint
+from openpyxl.worksheet._row_index import RowIndex
+
+META = "meta.pickle"
+
+
+def archive_key(archive, *options):
+    """
+    Identify the contents of an archive from its members and any options
+    that change what is read from it
+    """
+    key = hashlib.sha256(__version__.encode())
+    key.update(repr(options).encode())
+    for info in archive.infolist():
+        key.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\n".encode())
+    return key.hexdigest()
+
+
+def _sheet_key(path):
+    return hashlib.sha1(path.encode()).hexdigest()[:16]
+
+
+def _write(path, write):
+    """
+    Write a file so that readers only ever see it complete
+    """
+    fd, tmp = mkstemp(prefix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class CacheEntry:
+    """
+    Cached data for one workbook. Shared strings and the stylesheet are
+    None until they have been read.
+    """
+
+    def __init__(self, cache, path):
+        self.cache = cache
+        self.path = path
+        self.shared_strings = None
+        self.stylesheet = None
+        self.dimensions = {}
+        self.new = True
+
+    def load(self):
+        """
+        Read the entry from disk if it exists
+        """
+        meta = os.path.join(self.path, META)
+        try:
+            with open(meta, "rb") as src:
+                data = pickle.load(src)
+            os.utime(meta)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+        self.shared_strings = data["shared_strings"]
+        self.stylesheet = data["stylesheet"]
+        self.dimensions = data["dimensions"]
+        self.new = False
+
+    def get_stylesheet(self):
+        return pickle.loads(self.stylesheet)
+
+    def set_stylesheet(self, stylesheet):
+        # pickled straight away because applying it binds it to the workbook
+        self.stylesheet = pickle.dumps(stylesheet, pickle.HIGHEST_PROTOCOL)
+
+    def set_dimensions(self, sheet_path, dimensions):
+        """
+        Remember the dimensions of a worksheet. An entry that is already on
+        disk is written again if they have changed, for instance after the
+        worksheet has been scanned for its real size.
+        """
+        if self.dimensions.get(sheet_path) == dimensions:
+            return
+        self.dimensions[sheet_path] = dimensions
+        if not self.new:
+            self.new = True
+            self.save()
+
+    def save(self):
+        """
+        Write the entry to disk if it was not read from there
+        """
+        if not self.new:
+            return
+        data = {
+            "shared_strings": self.shared_strings,
+            "stylesheet": self.stylesheet,
+            "dimensions": self.dimensions,
+        }
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            _write(
+                os.path.join(self.path, META),
+                lambda f: pickle.dump(data, f, pickle.HIGHEST_PROTOCOL),
+            )
+        except OSError as e:
+            warnings.warn(f"Unable to write to the read cache: {e}")
+            return
+        self.new = False
+        self.cache.prune()
+
+    def save_index(self, sheet_path, index):
+        """
+        Keep a copy of a row index and its spill file
+        """
+        if self.new:
+            return
+        name = os.path.join(self.path, f"index-{_sheet_key(sheet_path)}")
+        checkpoints = [
+            (cp.row, cp.previous, cp.offset, cp.shared_formulae)
+            for cp in index.checkpoints
+        ]
+        data = {"step": index.step, "header": index.header, "checkpoints": checkpoints}
+
+        def copy_spill(f):
+            index.spill.seek(0)
+            shutil.copyfileobj(index.spill, f)
+
+        try:
+            _write(name + ".xml", copy_spill)
+            _write(
+                name + ".pickle",
+                lambda f: pickle.dump(data, f, pickle.HIGHEST_PROTOCOL),
+            )
+        except (OSError, pickle.PicklingError) as e:
+            warnings.warn(f"Unable to write to the read cache: {e}")
+            return
+        self.cache.prune()
+
+    def load_index(self, sheet_path):
+        """
+        Return a cached row index for a worksheet or None
+        """
+        name = os.path.join(self.path, f"index-{_sheet_key(sheet_path)}")
+        try:
+            with open(name + ".pickle", "rb") as src:
+                data = pickle.load(src)
+            spill = open(name + ".xml", "rb")
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+        index = RowIndex(data["step"])
+        index.spill = spill
+        index.header = data["header"]
+        index.checkpoints = [Checkpoint(*cp) for cp in data["checkpoints"]]
+        return index
+
+
+class ReadCache:
+    """
+    A directory of cached workbook data.
+
+    Entries that have not been used for `max_age` seconds are removed and
+    the least recently used ones are removed whenever the cache grows
+    beyond `max_size` bytes.
+    """
+
+    def __init__(self, path, max_size=1024**3, max_age=7 * 24 * 60 * 60):
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        self.max_age = max_age
+        os.makedirs(self.path, exist_ok=True)
+
+    def open(self, archive, *options):
+        """
+        Return the entry for an archive, loading it if it exists
+        """
+        entry = CacheEntry(self, os.path.join(self.path, archive_key(archive, *options)))
+        entry.load()
+        return entry
+
+    def _entries(self):
+        """
+        Return the last use, size and path of every entry
+        """
+        entries = []
+        for d in os.scandir(self.path):
+            if not d.is_dir():
+                continue
+            try:
+                used = os.stat(os.path.join(d.path, META)).st_mtime
+                size = sum(f.stat().st_size for f in os.scandir(d.path))
+            except OSError:
+                # incomplete or being removed
+                continue
+            entries.append((used, size, d.path))
+        return entries
+
+    @property
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def prune(self):
+        """
+        Remove old entries and the least recently used ones above the size
+        limit
+        """
+        now = time.time()
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for used, size, path in entries:
+            if now - used <= self.max_age and total <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """
+        Remove all entries
+        """
+        for _, _, path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
@@ -26,10 +26,13 @@ from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.packaging.relationship import get_dependents
 from openpyxl.packaging.relationship import get_rels_path
 from openpyxl.styles.stylesheet import apply_stylesheet
+from openpyxl.styles.stylesheet import read_stylesheet
 from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.worksheet._lazy import LazyWorksheet
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._reader import WorksheetReader
 from openpyxl.worksheet.table import Table
+from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.xml.constants import ARC_CONTENT_TYPES
 from openpyxl.xml.constants import ARC_CORE
 from openpyxl.xml.constants import ARC_CUSTOM
@@ -42,15 +45,22 @@ from openpyxl.xml.constants import XLSX
 from openpyxl.xml.constants import XLTM
 from openpyxl.xml.constants import XLTX
 from openpyxl.xml.functions import fromstring
+from openpyxl.xml.functions import get_engine
 
+from ._parallel import parse_worksheets
+from .cache import ReadCache
 from .drawings import find_images
+from .mapped import MappedArchive
+from .pool import ArchivePool
+from .stream import StreamSpool
+from .strings import SharedStringTable
 from .strings import read_rich_text, read_string_table
 from .workbook import WorkbookParser
 
 SUPPORTED_FORMATS = (".xlsx", ".xlsm", ".xltx", ".xltm")
 
 
-def _validate_archive(filename):
+def _validate_archive(filename, memory_map=False):
     """
     Does a first check whether filename is a string or a file-like
     object. If it is a string representing a filename, a check is done
@@ -58,8 +68,15 @@ def _validate_archive(filename):
     file-extension is not in SUPPORTED_FORMATS an InvalidFileException
     will raised. Otherwise the filename (resp. file-like object) will
     forwarded to zipfile.ZipFile returning a ZipFile-Instance.
+
+    Streams that cannot seek are copied to a temporary file first. Files
+    opened by name can be read through a memory map.
     """
+    if isinstance(filename, StreamSpool):
+        filename = filename.spool()
     is_file_like = hasattr(filename, "read")
+    if is_file_like and hasattr(filename, "seekable") and not filename.seekable():
+        filename = StreamSpool(filename).spool()
     if not is_file_like:
         file_format = os.path.splitext(filename)[-1].lower()
         if file_format not in SUPPORTED_FORMATS:
@@ -84,6 +101,8 @@ def _validate_archive(filename):
                 )
             raise InvalidFileException(msg)
 
+    if memory_map and not is_file_like:
+        return MappedArchive(filename)
     archive = ZipFile(filename, "r")
     return archive
 
@@ -117,30 +136,72 @@ class ExcelReader:
         data_only=False,
         keep_links=True,
         rich_text=False,
+        engine=None,
+        cache=None,
+        lazy_strings=False,
+        sheets=None,
+        lazy_sheets=False,
+        workers=None,
+        memory_map=False,
     ):
-        self.archive = _validate_archive(fn)
+        self.archive = _validate_archive(fn, memory_map)
+        # other processes can only read the archive if it is a file
+        self.filename = None
+        if isinstance(fn, (str, os.PathLike)):
+            self.filename = os.fspath(fn)
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
         self.keep_vba = keep_vba
         self.data_only = data_only
         self.keep_links = keep_links
         self.rich_text = rich_text
+        self.engine = get_engine(engine)
+        self.lazy_strings = lazy_strings
+        if isinstance(sheets, str):
+            sheets = [sheets]
+        if sheets is not None:
+            sheets = set(sheets)
+        self.sheets = sheets
+        self.lazy_sheets = lazy_sheets
+        self.workers = workers
         self.shared_strings = []
+        self.strings_path = None
+        if cache is not None and not isinstance(cache, ReadCache):
+            cache = ReadCache(cache)
+        self.cache = cache
+        self.cached = None
 
     def read_manifest(self):
         src = self.archive.read(ARC_CONTENT_TYPES)
         root = fromstring(src)
         self.package = Manifest.from_tree(root)
 
+    def open_cache(self):
+        if self.cache is not None:
+            self.cached = self.cache.open(
+                self.archive, self.data_only, self.rich_text, self.lazy_strings
+            )
+
     def read_strings(self):
+        cached = self.cached
+        if cached is not None and cached.shared_strings is not None:
+            self.shared_strings = cached.shared_strings
+            return
+
         ct = self.package.find(SHARED_STRINGS)
         reader = read_string_table
         if self.rich_text:
             reader = read_rich_text
         if ct is not None:
-            strings_path = ct.PartName[1:]
-            with self.archive.open(strings_path) as src:
-                self.shared_strings = reader(src)
+            self.strings_path = ct.PartName[1:]
+            with self.archive.open(self.strings_path) as src:
+                if self.lazy_strings:
+                    self.shared_strings = SharedStringTable(src, self.rich_text)
+                else:
+                    self.shared_strings = reader(src, self.engine)
+        # lazy tables are only valid while they are open
+        if cached is not None and isinstance(self.shared_strings, list):
+            cached.shared_strings = self.shared_strings
 
     def read_workbook(self):
         wb_part = _find_workbook_part(self.package)
@@ -165,6 +226,8 @@ class ExcelReader:
 
         if self.read_only:
             wb._archive = self.archive
+            if self.filename is not None:
+                wb._archive_pool = ArchivePool(self.archive, self.filename)
 
         self.wb = wb
 
@@ -182,6 +245,16 @@ class ExcelReader:
         if ARC_THEME in self.valid_files:
             self.wb.loaded_theme = self.archive.read(ARC_THEME)
 
+    def read_stylesheet(self):
+        cached = self.cached
+        if cached is not None and cached.stylesheet is not None:
+            stylesheet = cached.get_stylesheet()
+        else:
+            stylesheet = read_stylesheet(self.archive)
+            if cached is not None:
+                cached.set_stylesheet(stylesheet)
+        apply_stylesheet(self.archive, self.wb, stylesheet)
+
     def read_chartsheet(self, sheet, rel):
         sheet_path = rel.target
         rels_path = get_rels_path(sheet_path)
@@ -203,99 +276,189 @@ class ExcelReader:
             for c in charts:
                 cs.add_chart(c)
 
-    def read_worksheets(self):
+    def read_worksheet(self, sheet, rel, parsed=None):
+        """
+        Read a worksheet and everything that belongs to it.
+        `parsed` holds the rows and parser of a worksheet that has already
+        been parsed in another process.
+        """
         comment_warning = "Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."
-        for sheet, rel in self.parser.find_sheets():
-            if rel.target not in self.valid_files:
+
+        rels_path = get_rels_path(rel.target)
+        rels = RelationshipList()
+        if rels_path in self.valid_files:
+            rels = get_dependents(self.archive, rels_path)
+
+        ws = Worksheet(self.wb, sheet.name)
+        ws._rels = rels
+        if parsed is not None:
+            rows, parser = parsed
+            ws_parser = WorksheetReader(
+                ws, None, None, self.data_only, self.rich_text, self.engine
+            )
+            ws_parser.parser = parser
+            ws_parser.bind_all(rows)
+        else:
+            fh = self.archive.open(rel.target)
+            ws_parser = WorksheetReader(
+                ws,
+                fh,
+                self.shared_strings,
+                self.data_only,
+                self.rich_text,
+                self.engine,
+            )
+            ws_parser.bind_all()
+            fh.close()
+
+        # assign any comments to cells
+        for r in rels.find(COMMENTS_NS):
+            src = self.archive.read(r.target)
+            comment_sheet = CommentSheet.from_tree(fromstring(src))
+            for ref, comment in comment_sheet.comments:
+                try:
+                    ws[ref].comment = comment
+                except AttributeError:
+                    c = ws[ref]
+                    if isinstance(c, MergedCell):
+                        msg = comment_warning.format(ws.title, c.coordinate)
+                        warnings.warn(msg)
+                        continue
+
+        # preserve link to VML file if VBA
+        if self.wb.vba_archive and ws.legacy_drawing:
+            ws.legacy_drawing = rels.get(ws.legacy_drawing).target
+        else:
+            ws.legacy_drawing = None
+
+        for t in ws_parser.tables:
+            src = self.archive.read(t)
+            xml = fromstring(src)
+            table = Table.from_tree(xml)
+            ws.add_table(table)
+
+        drawings = rels.find(SpreadsheetDrawing._rel_type)
+        for rel in drawings:
+            charts, images = find_images(self.archive, rel.target)
+            for c in charts:
+                ws.add_chart(c, c.anchor)
+            for im in images:
+                ws.add_image(im, im.anchor)
+
+        pivot_rel = rels.find(TableDefinition.rel_type)
+        pivot_caches = self.parser.pivot_caches
+        for r in pivot_rel:
+            pivot_path = r.Target
+            src = self.archive.read(pivot_path)
+            tree = fromstring(src)
+            pivot = TableDefinition.from_tree(tree)
+            pivot.cache = pivot_caches[pivot.cacheId]
+            ws.add_pivot(pivot)
+
+        ws.sheet_state = sheet.state
+        return ws
+
+    def parse_worksheets(self, sheets):
+        """
+        Parse worksheets in other processes if asked to. Return the parsed
+        worksheets by path.
+        """
+        if (
+            not self.workers
+            or self.filename is None
+            or self.read_only
+            or self.lazy_sheets
+        ):
+            return {}
+        paths = [
+            rel.target
+            for sheet, rel in sheets
+            if "chartsheet" not in rel.Type
+            and rel.target in self.valid_files
+            and (self.sheets is None or sheet.name in self.sheets)
+        ]
+        if len(paths) < 2:
+            return {}
+
+        options = dict(
+            data_only=self.data_only,
+            epoch=self.wb.epoch,
+            date_formats=self.wb._date_formats,
+            timedelta_formats=self.wb._timedelta_formats,
+            rich_text=self.rich_text,
+            engine=self.engine,
+        )
+        parsed = parse_worksheets(
+            self.filename,
+            paths,
+            self.shared_strings,
+            self.strings_path,
+            options,
+            self.workers,
+        )
+        return dict(zip(paths, parsed))
+
+    def read_worksheets(self):
+        sheets = list(self.parser.find_sheets())
+        parsed = self.parse_worksheets(sheets)
+        # the sheets in the order of the source with None for those not read
+        self.sheet_map = []
+        for sheet, rel in sheets:
+            if rel.target not in self.valid_files or (
+                self.sheets is not None and sheet.name not in self.sheets
+            ):
+                self.sheet_map.append(None)
                 continue
 
             if "chartsheet" in rel.Type:
                 self.read_chartsheet(sheet, rel)
+                self.sheet_map.append(self.wb._sheets[-1])
                 continue
 
-            rels_path = get_rels_path(rel.target)
-            rels = RelationshipList()
-            if rels_path in self.valid_files:
-                rels = get_dependents(self.archive, rels_path)
-
             if self.read_only:
                 ws = ReadOnlyWorksheet(
                     self.wb,
                     sheet.name,
                     rel.target,
                     self.shared_strings,
+                    self.engine,
+                    self.cached,
                 )
-                ws.sheet_state = sheet.state
-                self.wb._sheets.append(ws)
-                continue
-            else:
-                fh = self.archive.open(rel.target)
-                ws = self.wb.create_sheet(sheet.name)
-                ws._rels = rels
-                ws_parser = WorksheetReader(
-                    ws,
-                    fh,
-                    self.shared_strings,
-                    self.data_only,
-                    self.rich_text,
-                )
-                ws_parser.bind_all()
-                fh.close()
-
-            # assign any comments to cells
-            for r in rels.find(COMMENTS_NS):
-                src = self.archive.read(r.target)
-                comment_sheet = CommentSheet.from_tree(fromstring(src))
-                for ref, comment in comment_sheet.comments:
-                    try:
-                        ws[ref].comment = comment
-                    except AttributeError:
-                        c = ws[ref]
-                        if isinstance(c, MergedCell):
-                            msg = comment_warning.format(ws.title, c.coordinate)
-                            warnings.warn(msg)
-                            continue
-
-            # preserve link to VML file if VBA
-            if self.wb.vba_archive and ws.legacy_drawing:
-                ws.legacy_drawing = rels.get(ws.legacy_drawing).target
+            elif self.lazy_sheets:
+                ws = LazyWorksheet(self.wb, sheet.name, self, sheet, rel)
             else:
-                ws.legacy_drawing = None
-
-            for t in ws_parser.tables:
-                src = self.archive.read(t)
-                xml = fromstring(src)
-                table = Table.from_tree(xml)
-                ws.add_table(table)
-
-            drawings = rels.find(SpreadsheetDrawing._rel_type)
-            for rel in drawings:
-                charts, images = find_images(self.archive, rel.target)
-                for c in charts:
-                    ws.add_chart(c, c.anchor)
-                for im in images:
-                    ws.add_image(im, im.anchor)
-
-            pivot_rel = rels.find(TableDefinition.rel_type)
-            pivot_caches = self.parser.pivot_caches
-            for r in pivot_rel:
-                pivot_path = r.Target
-                src = self.archive.read(pivot_path)
-                tree = fromstring(src)
-                pivot = TableDefinition.from_tree(tree)
-                pivot.cache = pivot_caches[pivot.cacheId]
-                ws.add_pivot(pivot)
-
+                ws = self.read_worksheet(sheet, rel, parsed.get(rel.target))
             ws.sheet_state = sheet.state
+            self.wb._sheets.append(ws)
+            self.sheet_map.append(ws)
+
+        if self.sheets is not None:
+            idx = self.wb._active_sheet_index
+            active = None
+            if idx < len(self.sheet_map):
+                active = self.sheet_map[idx]
+            self.wb._active_sheet_index = 0
+            if active is not None:
+                self.wb._active_sheet_index = self.wb._sheets.index(active)
+
+    def check_sheets(self):
+        if self.sheets is None:
+            return
+        names = {sheet.name for sheet in self.parser.sheets}
+        for name in self.sheets:
+            if name not in names:
+                raise KeyError(f"Worksheet {name} does not exist.")
 
     def read(self):
         action = "read manifest"
         try:
             self.read_manifest()
+            self.open_cache()
             action = "read strings"
             self.read_strings()
             action = "read workbook"
             self.read_workbook()
+            self.check_sheets()
             action = "read properties"
             self.read_properties()
             action = "read custom properties"
@@ -303,13 +466,21 @@ class ExcelReader:
             action = "read theme"
             self.read_theme()
             action = "read stylesheet"
-            apply_stylesheet(self.archive, self.wb)
+            self.read_stylesheet()
             action = "read worksheets"
             self.read_worksheets()
             action = "assign names"
-            self.parser.assign_names()
-            if not self.read_only:
+            self.parser.assign_names(self.sheet_map)
+            if self.cached is not None:
+                self.cached.save()
+            if isinstance(self.shared_strings, SharedStringTable):
+                self.wb._lazy_strings = self.shared_strings
+            if any(isinstance(ws, LazyWorksheet) for ws in self.wb._sheets):
+                self.wb._archive = self.archive
+            elif not self.read_only:
                 self.archive.close()
+                # nothing else refers to a lazy string table
+                self.wb.close()
         except ValueError as e:
             raise ValueError(
                 f"Unable to read workbook: could not {action} from {self.archive.filename}.\n"
@@ -325,6 +496,13 @@ def load_workbook(
     data_only=False,
     keep_links=True,
     rich_text=False,
+    engine=None,
+    cache=None,
+    lazy_strings=False,
+    sheets=None,
+    lazy_sheets=False,
+    workers=None,
+    memory_map=False,
 ):
     """Open the given filename and return the workbook
 
@@ -346,6 +524,27 @@ def load_workbook(
     :param rich_text: if set to True openpyxl will preserve any rich text formatting in cells. The default is False
     :type rich_text: bool
 
+    :param engine: the XML parser used to read worksheets and shared strings, either "lxml" or "etree". The default is to use lxml if it is available
+    :type engine: string
+
+    :param cache: a directory or :class:`openpyxl.reader.cache.ReadCache` in which to keep shared strings and styles between opens of the same file, and in read-only mode the dimensions and row indexes of worksheets. Dimensions found by scanning a worksheet replace those in the cache
+    :type cache: string, path-like or :class:`openpyxl.reader.cache.ReadCache`
+
+    :param lazy_strings: keep shared strings in a temporary file and only decode those which are used. Useful with large string tables in read-only mode
+    :type lazy_strings: bool
+
+    :param sheets: the names of the sheets to read. Other sheets are left out of the workbook
+    :type sheets: string or iterable of strings
+
+    :param lazy_sheets: only read worksheets when they are first used. Worksheets that are never used are copied unchanged when the workbook is saved. The workbook must be closed after use
+    :type lazy_sheets: bool
+
+    :param workers: the number of processes used to parse worksheets. Only used when reading a file by name without `read_only` or `lazy_sheets`
+    :type workers: int
+
+    :param memory_map: read the archive through a memory map. Stored members are read directly from the map and deflated members that are read more than once are decompressed to a mapped temporary file. Only used when reading a file by name
+    :type memory_map: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -361,6 +560,13 @@ def load_workbook(
         data_only,
         keep_links,
         rich_text,
+        engine,
+        cache,
+        lazy_strings,
+        sheets,
+        lazy_sheets,
+        workers,
+        memory_map,
     )
     reader.read()
     return reader.wb
@@ -0,0 +1,229 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Read the members of an archive on disk through a memory map.
+
+Stored members are read straight from the map without going through the
+buffers of the file or checking their CRCs. `read()` still returns a copy
+of the data, because lxml only parses bytes, but `readinto()` copies it
+into the buffer given without any other copy. Deflated members are read as
+usual the first time, but when they are opened again they are decompressed
+into a temporary file, which is mapped in turn, so that later reads are as
+cheap as for stored members. Handles on the same file in other threads can
+share these copies.
+"""
+import io
+import mmap
+import os
+import struct
+import threading
+from tempfile import TemporaryDirectory
+from zipfile import ZIP_STORED
+from zipfile import ZipFile
+
+LOCAL_HEADER_SIZE = 30
+# the lengths of the filename and extra field, 26 bytes into a local header
+NAME_LENGTHS = struct.Struct("<2H")
+CHUNK_SIZE = 1024**2
+
+
+class MappedMember(io.RawIOBase):
+    """
+    A read-only file for a range of a memory map
+    """
+
+    def __init__(self, data, start, end):
+        self._data = data
+        self._start = start
+        self._end = end
+        self._pos = start
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos - self._start
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._pos - self._start
+        elif whence == os.SEEK_END:
+            offset += self._end - self._start
+        self._pos = self._start + min(max(offset, 0), self._end - self._start)
+        return self.tell()
+
+    def read(self, size=-1):
+        # a slice of the map is a copy; lxml does not accept memoryviews
+        end = self._end
+        if size is not None and size >= 0:
+            end = min(self._pos + size, end)
+        data = self._data[self._pos : end]
+        self._pos = max(end, self._pos)
+        return data
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._end - self._pos)
+        if size <= 0:
+            return 0
+        with memoryview(self._data) as view:
+            buffer[:size] = view[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+    def close(self):
+        self._data = None
+        super().close()
+
+
+class InflateCache:
+    """
+    Decompressed copies of members that have been read more than once,
+    which can be shared by several handles on the same archive
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._opened = set()
+        self._members = {}
+        self._tmp = None
+        self._copies = 0
+
+    def get(self, name):
+        with self._lock:
+            return self._members.get(name)
+
+    def first_open(self, name):
+        """
+        Note that a member is opened and return whether it is the first time
+        """
+        with self._lock:
+            if name in self._opened:
+                return False
+            self._opened.add(name)
+            return True
+
+    def new_path(self):
+        """
+        A path for another copy
+        """
+        with self._lock:
+            if self._tmp is None:
+                self._tmp = TemporaryDirectory(prefix="openpyxl.")
+            self._copies += 1
+            return os.path.join(self._tmp.name, str(self._copies))
+
+    def add(self, name, path):
+        with open(path, "rb") as f:
+            data = b""
+            if os.fstat(f.fileno()).st_size:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with self._lock:
+            if name not in self._members:
+                self._members[name] = data
+                return
+        # another thread finished a copy first
+        if isinstance(data, mmap.mmap):
+            data.close()
+        os.unlink(path)
+
+    def close(self):
+        with self._lock:
+            members, self._members = self._members, {}
+            tmp, self._tmp = self._tmp, None
+        for data in members.values():
+            if isinstance(data, mmap.mmap):
+                data.close()
+        if tmp is not None:
+            tmp.cleanup()
+
+
+class _CachingReader(io.RawIOBase):
+    """
+    Copy the decompressed contents of a member to a file as they are read,
+    and add the file to the cache once all of it has been
+    """
+
+    def __init__(self, cache, name, src, path):
+        self._cache = cache
+        self._name = name
+        self._src = src
+        self._path = path
+        self._dst = open(path, "wb")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = self._src.readinto(buffer)
+        if self._dst is not None:
+            if size:
+                self._dst.write(buffer[:size])
+            else:
+                self._dst.close()
+                self._dst = None
+                self._cache.add(self._name, self._path)
+        return size
+
+    def close(self):
+        if self._dst is not None:
+            # only complete copies are kept
+            self._dst.close()
+            self._dst = None
+            os.unlink(self._path)
+        self._src.close()
+        super().close()
+
+
+class MappedArchive(ZipFile):
+    """
+    A read-only ZipFile for an archive on disk which reads members through a
+    memory map. Handles on the same file can be given the cache of another
+    so that members are only decompressed once between them.
+    """
+
+    def __init__(self, file, cache=None):
+        self._map = None
+        self._owns_cache = cache is None
+        if cache is None:
+            cache = InflateCache()
+        self._cache = cache
+        super().__init__(file, "r")
+        if os.fstat(self.fp.fileno()).st_size:
+            self._map = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def open(self, name, mode="r", pwd=None, *, force_zip64=False):
+        if mode != "r" or pwd is not None or self._map is None:
+            return super().open(name, mode, pwd, force_zip64=force_zip64)
+
+        info = name if not isinstance(name, str) else self.getinfo(name)
+        if info.flag_bits & 0x1:
+            # encrypted
+            return super().open(name, mode, pwd)
+
+        data = self._cache.get(info.filename)
+        if data is not None:
+            return MappedMember(data, 0, len(data))
+
+        if info.compress_type == ZIP_STORED:
+            pos = info.header_offset
+            name_length, extra_length = NAME_LENGTHS.unpack_from(self._map, pos + 26)
+            start = pos + LOCAL_HEADER_SIZE + name_length + extra_length
+            return MappedMember(self._map, start, start + info.compress_size)
+
+        src = super().open(info, mode)
+        if self._cache.first_open(info.filename):
+            return src
+        # members read more than once are decompressed to a file
+        path = self._cache.new_path()
+        reader = _CachingReader(self._cache, info.filename, src, path)
+        return io.BufferedReader(reader, CHUNK_SIZE)
+
+    def close(self):
+        if self._owns_cache:
+            self._cache.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        super().close()
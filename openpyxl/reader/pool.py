@@ -0,0 +1,50 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Separate handles on the archive of a read-only workbook for each thread, so
+that worksheets can be read in several threads at once without sharing the
+position of a single file. Archives read through a memory map share their
+decompressed copies of members, so that each member is only decompressed
+again once between all threads.
+"""
+import threading
+
+from .mapped import MappedArchive
+
+
+class ArchivePool:
+    """
+    Open the archive again for each thread that reads from it. The thread
+    that opened the workbook uses the original archive.
+    """
+
+    def __init__(self, archive, filename):
+        self.archive = archive
+        self.filename = filename
+        self.owner = threading.get_ident()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles = []
+
+    def get(self):
+        """
+        The archive for the current thread
+        """
+        if threading.get_ident() == self.owner:
+            return self.archive
+        handle = getattr(self._local, "archive", None)
+        if handle is None:
+            if isinstance(self.archive, MappedArchive):
+                handle = MappedArchive(self.filename, self.archive._cache)
+            else:
+                handle = type(self.archive)(self.filename)
+            with self._lock:
+                self._handles.append(handle)
+            self._local.archive = handle
+        return handle
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, []
+        for handle in handles:
+            handle.close()
+        self._local = threading.local()
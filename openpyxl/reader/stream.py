@@ -0,0 +1,347 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Read workbooks from streams that cannot seek, such as sockets and pipes.
+
+The bytes are copied into a temporary file, which is kept in memory up to a
+limit and moved to disk beyond it, and hashed on the way. Members of the
+archive can be opened from their local headers as soon as they have arrived,
+before the central directory at the end of the archive has been read.
+"""
+import hashlib
+import io
+import struct
+import zlib
+from tempfile import SpooledTemporaryFile
+from zipfile import BadZipFile
+from zipfile import ZIP_DEFLATED
+from zipfile import ZIP_STORED
+
+# bytes kept in memory before spooling to disk
+SPOOL_SIZE = 16 * 1024**2
+CHUNK_SIZE = 64 * 1024
+
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_SIGNATURE = b"PK\x03\x04"
+DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+HAS_DESCRIPTOR = 0x08
+ZIP64_EXTRA = 0x0001
+
+
+class LocalEntry:
+    """
+    A member of an archive as described by its local header. The CRC and
+    sizes are None if they are given in a data descriptor after the data.
+    """
+
+    __slots__ = (
+        "filename",
+        "compress_type",
+        "flag_bits",
+        "compress_size",
+        "file_size",
+        "header_offset",
+        "data_offset",
+        "zip64",
+        "crc",
+    )
+
+    def __init__(
+        self,
+        filename,
+        compress_type,
+        flag_bits,
+        compress_size,
+        file_size,
+        header_offset,
+        data_offset,
+        zip64=False,
+        crc=None,
+    ):
+        self.filename = filename
+        self.compress_type = compress_type
+        self.flag_bits = flag_bits
+        self.compress_size = compress_size
+        self.file_size = file_size
+        self.header_offset = header_offset
+        self.data_offset = data_offset
+        self.zip64 = zip64
+        self.crc = crc
+
+    def __repr__(self):
+        return f"<LocalEntry {self.filename!r}>"
+
+
+def _zip64_sizes(extra, file_size, compress_size):
+    pos = 0
+    while pos + 4 <= len(extra):
+        tag, size = struct.unpack_from("<2H", extra, pos)
+        if tag == ZIP64_EXTRA:
+            values = iter(struct.unpack_from(f"<{size // 8}Q", extra, pos + 4))
+            if file_size == 0xFFFFFFFF:
+                file_size = next(values)
+            if compress_size == 0xFFFFFFFF:
+                compress_size = next(values)
+            return file_size, compress_size, True
+        pos += 4 + size
+    return file_size, compress_size, False
+
+
+class StreamSpool:
+    """
+    Copy a stream into a SpooledTemporaryFile, hashing the bytes as they
+    arrive.
+
+    `spool()` returns the copy, which can be read like any file. Before that,
+    `entries()` and `open()` read the members of the archive from their
+    local headers as far as the stream has got.
+    """
+
+    def __init__(self, stream, max_size=SPOOL_SIZE, algorithm="sha256"):
+        self.stream = stream
+        self.file = SpooledTemporaryFile(max_size=max_size)
+        self.hash = hashlib.new(algorithm)
+        self.size = 0
+        self.complete = False
+        self._entries = []
+        self._next_header = 0
+        self._last = None
+
+    def _fill(self, end=None):
+        """
+        Read from the stream until at least `end` bytes have arrived, or all
+        of them if `end` is None. Return whether they are available.
+        """
+        while not self.complete and (end is None or self.size < end):
+            chunk = self.stream.read(CHUNK_SIZE)
+            if not chunk:
+                self.complete = True
+                break
+            self.hash.update(chunk)
+            self.file.seek(self.size)
+            self.file.write(chunk)
+            self.size += len(chunk)
+        return end is None or self.size >= end
+
+    def _read(self, pos, size):
+        """
+        Read up to `size` bytes from `pos`, waiting for them to arrive
+        """
+        self._fill(pos + size)
+        self.file.seek(pos)
+        return self.file.read(size)
+
+    def spool(self):
+        """
+        Read the rest of the stream and return the copy of it
+        """
+        self._fill()
+        self.file.seek(0)
+        return self.file
+
+    def hexdigest(self):
+        """
+        The hash of the stream, once all of it has been read
+        """
+        if not self.complete:
+            raise ValueError("The stream has not been read completely")
+        return self.hash.hexdigest()
+
+    def _read_header(self, pos):
+        header = self._read(pos, LOCAL_HEADER.size)
+        if len(header) < LOCAL_HEADER.size or header[:4] != LOCAL_SIGNATURE:
+            return
+        (
+            _,
+            _,
+            _,
+            flags,
+            method,
+            _,
+            _,
+            crc,
+            compress_size,
+            file_size,
+            name_length,
+            extra_length,
+        ) = LOCAL_HEADER.unpack(header)
+        pos += LOCAL_HEADER.size
+        name = self._read(pos, name_length)
+        extra = self._read(pos + name_length, extra_length)
+        encoding = "utf-8" if flags & 0x800 else "cp437"
+        file_size, compress_size, zip64 = _zip64_sizes(extra, file_size, compress_size)
+        if flags & HAS_DESCRIPTOR:
+            file_size = compress_size = crc = None
+        return LocalEntry(
+            name.decode(encoding),
+            method,
+            flags,
+            compress_size,
+            file_size,
+            pos - LOCAL_HEADER.size,
+            pos + name_length + extra_length,
+            zip64,
+            crc,
+        )
+
+    def _compressed_size(self, entry):
+        """
+        Find the end of the data of an entry that is followed by a data
+        descriptor by decompressing it
+        """
+        if entry.compress_type != ZIP_DEFLATED:
+            raise ValueError(
+                f"The size of {entry.filename} is not known until the archive is complete"
+            )
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        pos = entry.data_offset
+        while not decompressor.eof:
+            chunk = self._read(pos, CHUNK_SIZE)
+            if not chunk:
+                raise EOFError(f"The stream ended in {entry.filename}")
+            decompressor.decompress(chunk)
+            pos += len(chunk)
+        return pos - len(decompressor.unused_data) - entry.data_offset
+
+    def _descriptor_crc(self, end):
+        """
+        The CRC in the data descriptor after data which ends at `end`
+        """
+        if self._read(end, 4) == DESCRIPTOR_SIGNATURE:
+            end += 4
+        data = self._read(end, 4)
+        if len(data) < 4:
+            raise EOFError("The stream ended in a data descriptor")
+        return struct.unpack("<L", data)[0]
+
+    def _end(self, entry):
+        """
+        The offset of the header after an entry
+        """
+        if entry.compress_size is not None:
+            return entry.data_offset + entry.compress_size
+        end = entry.data_offset + self._compressed_size(entry)
+        size = 20 if entry.zip64 else 12
+        if self._read(end, 4) == DESCRIPTOR_SIGNATURE:
+            size += 4
+        return end + size
+
+    def _next_entry(self):
+        """
+        Read the next local header. The end of the previous entry is only
+        looked for now, so that it can be opened while it is arriving.
+        """
+        if self._last is not None:
+            self._next_header = self._end(self._last)
+            self._last = None
+        if self._next_header is None:
+            return
+        entry = self._read_header(self._next_header)
+        if entry is None:
+            self._next_header = None
+            return
+        self._entries.append(entry)
+        self._last = entry
+        return entry
+
+    def entries(self):
+        """
+        Yield the members of the archive in the order in which they arrive
+        """
+        idx = 0
+        while True:
+            if idx < len(self._entries):
+                entry = self._entries[idx]
+            else:
+                entry = self._next_entry()
+                if entry is None:
+                    return
+            idx += 1
+            yield entry
+
+    def _find(self, name):
+        for entry in self.entries():
+            if entry.filename == name:
+                return entry
+        raise KeyError(f"There is no item named {name!r} in the archive")
+
+    def open(self, name):
+        """
+        Return a file-like object for a member of the archive, which can be
+        read while the rest of the member is arriving
+        """
+        entry = self._find(name)
+        if entry.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            raise NotImplementedError("That compression method is not supported")
+        if entry.compress_type == ZIP_STORED and entry.compress_size is None:
+            raise ValueError(
+                f"The size of {name} is not known until the archive is complete"
+            )
+        return io.BufferedReader(_MemberReader(self, entry), CHUNK_SIZE)
+
+
+class _MemberReader(io.RawIOBase):
+    """
+    Read and decompress a member of a spooled archive. Only as much is
+    decompressed as is asked for, and the CRC is checked at the end.
+    """
+
+    def __init__(self, spool, entry):
+        self.spool = spool
+        self.entry = entry
+        self.pos = entry.data_offset
+        self.end = None
+        if entry.compress_size is not None:
+            self.end = entry.data_offset + entry.compress_size
+        self.decompressor = None
+        if entry.compress_type == ZIP_DEFLATED:
+            self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self.crc = 0
+        self.eof = False
+
+    def readable(self):
+        return True
+
+    def _next_chunk(self, size=CHUNK_SIZE):
+        if self.end is not None:
+            size = min(size, self.end - self.pos)
+            if size <= 0:
+                return b""
+        chunk = self.spool._read(self.pos, size)
+        if not chunk:
+            raise EOFError(f"The stream ended in {self.entry.filename}")
+        self.pos += len(chunk)
+        return chunk
+
+    def _read(self, size):
+        decompressor = self.decompressor
+        if decompressor is None:
+            return self._next_chunk(size)
+        while not decompressor.eof:
+            chunk = decompressor.unconsumed_tail or self._next_chunk()
+            data = decompressor.decompress(chunk, size)
+            if data:
+                return data
+        return b""
+
+    def _check_crc(self):
+        crc = self.entry.crc
+        if crc is None:
+            end = self.pos
+            if self.decompressor is not None:
+                end -= len(self.decompressor.unused_data)
+            crc = self.spool._descriptor_crc(end)
+        if self.crc != crc:
+            raise BadZipFile(f"Bad CRC-32 for file {self.entry.filename!r}")
+
+    def readinto(self, buffer):
+        if self.eof or not len(buffer):
+            return 0
+        data = self._read(len(buffer))
+        if not data:
+            self.eof = True
+            self._check_crc()
+            return 0
+        self.crc = zlib.crc32(data, self.crc)
+        size = len(data)
+        buffer[:size] = data
+        return size
@@ -1,43 +1,141 @@
 # Copyright (c) 2010-2024 openpyxl
-from xml.etree.ElementTree import iterparse
+import mmap
+import re
+import shutil
+import weakref
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+from io import BytesIO
+from tempfile import TemporaryFile
 
 from openpyxl.cell.rich_text import CellRichText
 from openpyxl.cell.text import Text
 from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import fromstring
+from openpyxl.xml.functions import iterelements
 
+STRING_TAG = f"{{{SHEET_MAIN_NS}}}si"
 
-def read_string_table(xml_source):
+SI_START = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?si[\s/>]")
+SST_START = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?sst[\s/>]")
+SST_END = re.compile(rb"</(?:[A-Za-z_][\w.-]*:)?sst\s*>")
+
+
+def _text(node):
+    return Text.from_tree(node).content.replace("x005F_", "")
+
+
+def _rich_text(node):
+    text = CellRichText.from_tree(node)
+    if len(text) == 0:
+        text = ""
+    elif len(text) == 1 and isinstance(text[0], str):
+        text = text[0]
+    return text
+
+
+def read_string_table(xml_source, engine=None):
     """Read in all shared strings in the table"""
 
     strings = []
-    STRING_TAG = f"{{{SHEET_MAIN_NS}}}si"
 
-    for _, node in iterparse(xml_source):
-        if node.tag == STRING_TAG:
-            text = Text.from_tree(node).content
-            text = text.replace("x005F_", "")
-            node.clear()
+    for node in iterelements(xml_source, (STRING_TAG,), engine, prune=(STRING_TAG,)):
+        text = _text(node)
+        node.clear()
 
-            strings.append(text)
+        strings.append(text)
 
     return strings
 
 
-def read_rich_text(xml_source):
+def read_rich_text(xml_source, engine=None):
     """Read in all shared strings in the table"""
 
     strings = []
-    STRING_TAG = f"{{{SHEET_MAIN_NS}}}si"
 
-    for _, node in iterparse(xml_source):
-        if node.tag == STRING_TAG:
-            text = CellRichText.from_tree(node)
-            if len(text) == 0:
-                text = ""
-            elif len(text) == 1 and isinstance(text[0], str):
-                text = text[0]
-            node.clear()
+    for node in iterelements(xml_source, (STRING_TAG,), engine, prune=(STRING_TAG,)):
+        text = _rich_text(node)
+        node.clear()
 
-            strings.append(text)
+        strings.append(text)
 
     return strings
+
+
+def _close(spill, data):
+    if data is not None:
+        data.close()
+    spill.close()
+
+
+class SharedStringTable(Sequence):
+    """
+    Shared strings that are only decoded when they are looked up.
+
+    The table is copied into a temporary file and only the offset of each
+    string is kept in memory. The most recently used `cache_size` strings
+    are kept once decoded.
+    """
+
+    def __init__(self, xml_source, rich_text=False, cache_size=16384):
+        self.rich_text = rich_text
+        self._spill = TemporaryFile(prefix="openpyxl.")
+        shutil.copyfileobj(xml_source, self._spill)
+        self._spill.flush()
+
+        self._data = None
+        self._offsets = array("q")
+        if self._spill.tell():
+            self._data = mmap.mmap(self._spill.fileno(), 0, access=mmap.ACCESS_READ)
+            self._scan()
+        self._finalizer = weakref.finalize(self, _close, self._spill, self._data)
+        self._get = lru_cache(cache_size)(self._decode)
+
+    def _scan(self):
+        data = self._data
+        match = SST_START.search(data)
+        if match is None:
+            return
+        start = data.find(b">", match.start()) + 1
+        self._header = data[:start]
+
+        offsets = self._offsets
+        offsets.extend(m.start() for m in SI_START.finditer(data, start))
+        if offsets:
+            match = SST_END.search(data, offsets[-1])
+            end = match.start() if match is not None else len(data)
+            self._footer = data[end:]
+            offsets.append(end)
+
+    def _decode(self, idx):
+        offsets = self._offsets
+        fragment = self._data[offsets[idx] : offsets[idx + 1]]
+        node = fromstring(self._header + fragment + self._footer)[0]
+        if self.rich_text:
+            return _rich_text(node)
+        return _text(node)
+
+    def __len__(self):
+        return max(len(self._offsets) - 1, 0)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Shared string index out of range")
+        return self._get(idx)
+
+    def __reduce__(self):
+        # a copy for another process, which keeps it in its own file
+        data = b""
+        if self._data is not None:
+            data = self._data[:]
+        cache_size = self._get.cache_info().maxsize
+        return self.__class__, (BytesIO(data), self.rich_text, cache_size)
+
+    def close(self):
+        self._get.cache_clear()
+        self._finalizer()
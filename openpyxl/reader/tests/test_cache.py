@@ -0,0 +1,170 @@
+# Copyright (c) 2010-2024 openpyxl
+import os
+import time
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl import Workbook
+
+
+@pytest.fixture
+def ReadCache():
+    from ..cache import ReadCache
+
+    return ReadCache
+
+
+@pytest.fixture
+def load_workbook():
+    from ..excel import load_workbook
+
+    return load_workbook
+
+
+@pytest.fixture
+def sample(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(1, 21):
+        ws.append([idx, f"s{idx}"])
+    path = tmp_path / "sample.xlsx"
+    wb.save(path)
+    return path
+
+
+class TestReadCache:
+    def test_cold_open(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache")
+        wb = load_workbook(sample, read_only=True, cache=cache)
+        wb.close()
+        entries = cache._entries()
+        assert len(entries) == 1
+        assert cache.size == entries[0][1]
+
+    def test_warm_open(self, ReadCache, load_workbook, sample, tmp_path, monkeypatch):
+        cache = ReadCache(tmp_path / "cache")
+        load_workbook(sample, read_only=True, cache=cache).close()
+
+        def fail(*args):
+            raise AssertionError("Should be cached")
+
+        monkeypatch.setattr("openpyxl.reader.excel.read_string_table", fail)
+        monkeypatch.setattr("openpyxl.reader.excel.read_stylesheet", fail)
+        monkeypatch.setattr("openpyxl.worksheet._read_only.WorkSheetParser.parse_dimensions", fail)
+        wb = load_workbook(sample, read_only=True, cache=cache)
+        ws = wb.active
+        assert ws.calculate_dimension() == "A1:B20"
+        assert ws["B3"].value == "s3"
+        wb.close()
+
+    def test_scanned_dimensions(self, ReadCache, load_workbook, sample, tmp_path):
+        # the worksheet claims to be smaller than it is
+        path = tmp_path / "wrong.xlsx"
+        with ZipFile(sample) as src, ZipFile(path, "w") as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b'ref="A1:B20"', b'ref="A1:B5"')
+                dst.writestr(info, data)
+
+        cache = ReadCache(tmp_path / "cache")
+        wb = load_workbook(path, read_only=True, cache=cache)
+        ws = wb.active
+        assert ws.max_row == 5
+        ws.reset_dimensions()
+        assert ws.calculate_dimension(force=True) == "A1:B20"
+        wb.close()
+
+        wb = load_workbook(path, read_only=True, cache=cache)
+        assert wb.active.max_row == 20
+        wb.close()
+
+    def test_path(self, load_workbook, sample, tmp_path):
+        wb = load_workbook(sample, read_only=True, cache=tmp_path / "cache")
+        wb.close()
+        assert len(os.listdir(tmp_path / "cache")) == 1
+
+    def test_options(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache")
+        load_workbook(sample, read_only=True, cache=cache).close()
+        load_workbook(sample, read_only=True, rich_text=True, cache=cache).close()
+        assert len(cache._entries()) == 2
+
+    def test_changed_file(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache")
+        load_workbook(sample, read_only=True, cache=cache).close()
+        wb = load_workbook(sample)
+        wb.active["B3"] = "changed"
+        wb.save(sample)
+        wb = load_workbook(sample, read_only=True, cache=cache)
+        assert wb.active["B3"].value == "changed"
+        wb.close()
+        assert len(cache._entries()) == 2
+
+    def test_row_index(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache")
+        wb = load_workbook(sample, read_only=True, cache=cache)
+        ws = wb.active
+        ws.enable_row_index(step=5)
+        rows = list(ws.values)
+        wb.close()
+
+        wb = load_workbook(sample, read_only=True, cache=cache)
+        ws = wb.active
+        index = ws._row_index
+        assert index.built
+        assert [cp.row for cp in index.checkpoints] == [6, 11, 16]
+        ws.enable_row_index(step=5)
+        assert ws._row_index is index
+        assert ws["B17"].value == "s17"
+        assert list(ws.values) == rows
+        wb.close()
+
+    def test_prune_age(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache", max_age=60)
+        load_workbook(sample, read_only=True, cache=cache).close()
+        (used, size, path), = cache._entries()
+        past = time.time() - 120
+        os.utime(os.path.join(path, "meta.pickle"), (past, past))
+        cache.prune()
+        assert cache._entries() == []
+
+    def test_prune_size(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache")
+        load_workbook(sample, read_only=True, cache=cache).close()
+        (used, size, path), = cache._entries()
+        past = time.time() - 120
+        os.utime(os.path.join(path, "meta.pickle"), (past, past))
+
+        cache.max_size = size + 1
+        load_workbook(sample, read_only=True, rich_text=True, cache=cache).close()
+        entries = cache._entries()
+        assert len(entries) == 1
+        assert entries[0][2] != path
+
+    def test_clear(self, ReadCache, load_workbook, sample, tmp_path):
+        cache = ReadCache(tmp_path / "cache")
+        load_workbook(sample, read_only=True, cache=cache).close()
+        cache.clear()
+        assert cache.size == 0
+
+
+def test_archive_key(sample):
+    from ..cache import archive_key
+
+    with ZipFile(sample) as archive:
+        key = archive_key(archive, False)
+        assert archive_key(archive, False) == key
+        assert archive_key(archive, True) != key
+
+    out = BytesIO()
+    with ZipFile(sample) as src, ZipFile(out, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b">s1<", b">t1<")
+            dst.writestr(info, data)
+    with ZipFile(out) as archive:
+        assert archive_key(archive, False) != key
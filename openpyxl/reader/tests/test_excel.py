@@ -43,6 +43,43 @@ def test_load_workbook_from_fileobj(datadir, load_workbook):
         load_workbook(f)
 
 
+@pytest.mark.parametrize("read_only", [True, False])
+def test_load_workbook_from_stream(datadir, load_workbook, read_only):
+    from ..stream import StreamSpool
+
+    datadir.chdir()
+    with open("empty_with_no_properties.xlsx", "rb") as f:
+        data = f.read()
+
+    class Pipe(BytesIO):
+        def seekable(self):
+            return False
+
+    wb = load_workbook(Pipe(data), read_only=read_only)
+    assert len(wb.sheetnames) == 4
+
+    spool = StreamSpool(Pipe(data))
+    wb = load_workbook(spool, read_only=read_only)
+    assert len(wb.sheetnames) == 4
+    assert spool.complete
+
+
+@pytest.mark.parametrize("read_only", [True, False])
+@pytest.mark.parametrize("engine", ["lxml", "etree"])
+def test_load_workbook_engine(datadir, load_workbook, engine, read_only):
+    datadir.chdir()
+    wb = load_workbook("complex-styles.xlsx", read_only=read_only, engine=engine)
+    ws = wb.active
+    assert ws["A2"].value == "Arial Font, 10"
+    wb.close()
+
+
+def test_load_workbook_invalid_engine(datadir, load_workbook):
+    datadir.chdir()
+    with pytest.raises(ValueError):
+        load_workbook("complex-styles.xlsx", engine="sax")
+
+
 @pytest.mark.parametrize(
     "wb_type, wb_name",
     [
@@ -245,3 +282,83 @@ class TestExcelReader:
 
         reader.read_chartsheet(sheet, rel)
         assert reader.wb["chart"].title == "chart"
+
+
+@pytest.mark.parametrize("read_only", [True, False])
+def test_load_workbook_lazy_strings(datadir, load_workbook, read_only):
+    datadir.chdir()
+    wb = load_workbook("complex-styles.xlsx", read_only=read_only, lazy_strings=True)
+    ws = wb.active
+    assert ws["A2"].value == "Arial Font, 10"
+    wb.close()
+
+
+@pytest.mark.parametrize("read_only, lazy_sheets", [(True, False), (False, True)])
+def test_close_lazy_strings(datadir, load_workbook, read_only, lazy_sheets):
+    datadir.chdir()
+    wb = load_workbook(
+        "complex-styles.xlsx",
+        read_only=read_only,
+        lazy_sheets=lazy_sheets,
+        lazy_strings=True,
+    )
+    strings = wb._lazy_strings
+    assert wb.active["A2"].value == "Arial Font, 10"
+    wb.close()
+    assert wb._lazy_strings is None
+    assert not strings._finalizer.alive
+
+
+class TestSheetFilter:
+    @pytest.mark.parametrize("read_only", [True, False])
+    def test_sheets(self, datadir, load_workbook, read_only):
+        datadir.chdir()
+        wb = load_workbook("hidden_sheets.xlsx", read_only=read_only, sheets=["Hidden"])
+        assert wb.sheetnames == ["Hidden"]
+        assert wb.active.title == "Hidden"
+        wb.close()
+
+    def test_name(self, datadir, load_workbook):
+        datadir.chdir()
+        wb = load_workbook("contains_chartsheets.xlsx", sheets="moredata")
+        assert wb.sheetnames == ["moredata"]
+
+    def test_unknown(self, datadir, load_workbook):
+        datadir.chdir()
+        with pytest.raises(KeyError):
+            load_workbook("hidden_sheets.xlsx", sheets=["Missing"])
+
+    def test_names(self, datadir, load_workbook):
+        datadir.chdir()
+        wb = load_workbook("print_settings.xlsx")
+        titles = {ws.title: ws.print_titles for ws in wb}
+        for title, expected in titles.items():
+            wb = load_workbook("print_settings.xlsx", sheets=[title])
+            assert wb[title].print_titles == expected
+
+
+class TestWorkers:
+    def _values(self, wb):
+        return {
+            ws.title: [
+                (c.coordinate, c.value, c.style_id) for row in ws.iter_rows() for c in row
+            ]
+            for ws in wb
+        }
+
+    @pytest.mark.parametrize("lazy_strings", [False, True])
+    @pytest.mark.parametrize(
+        "filename", ["print_settings.xlsx", "contains_chartsheets.xlsx", "pivot.xlsx"]
+    )
+    def test_same_as_sequential(self, datadir, load_workbook, filename, lazy_strings):
+        datadir.chdir()
+        expected = load_workbook(filename, lazy_strings=lazy_strings)
+        wb = load_workbook(filename, lazy_strings=lazy_strings, workers=2)
+        assert wb.sheetnames == expected.sheetnames
+        assert self._values(wb) == self._values(expected)
+
+    def test_fileobj(self, datadir, load_workbook):
+        datadir.chdir()
+        with open("print_settings.xlsx", "rb") as src:
+            wb = load_workbook(src, workers=2)
+        assert wb.sheetnames == load_workbook("print_settings.xlsx").sheetnames
@@ -0,0 +1,79 @@
+# Copyright (c) 2010-2024 openpyxl
+from zipfile import ZIP_DEFLATED
+from zipfile import ZIP_STORED
+from zipfile import ZipFile
+
+import pytest
+
+from ..mapped import MappedArchive
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "archive.zip"
+    with ZipFile(path, "w") as z:
+        z.writestr("stored.xml", b"<stored/>" * 100, ZIP_STORED)
+        z.writestr("deflated.xml", b"<deflated/>" * 100, ZIP_DEFLATED)
+        z.writestr("empty.xml", b"", ZIP_DEFLATED)
+    return path
+
+
+class TestMappedArchive:
+    def test_read(self, archive):
+        with ZipFile(archive) as expected, MappedArchive(archive) as z:
+            for name in expected.namelist():
+                for _ in range(3):
+                    assert z.read(name) == expected.read(name)
+
+    def test_stored(self, archive):
+        with MappedArchive(archive) as z:
+            with z.open("stored.xml") as src:
+                assert src.read(9) == b"<stored/>"
+                assert src.tell() == 9
+                src.seek(-9, 2)
+                assert src.read() == b"<stored/>"
+
+    def test_read_bytes(self, archive):
+        # lxml only parses bytes
+        with MappedArchive(archive) as z, z.open("stored.xml") as src:
+            assert type(src.read(9)) is bytes
+
+    def test_cache(self, archive):
+        with MappedArchive(archive) as z:
+            z.read("deflated.xml")
+            assert z._cache._members == {}
+            z.read("deflated.xml")
+            assert list(z._cache._members) == ["deflated.xml"]
+            with z.open("deflated.xml") as src:
+                assert src.read(11) == b"<deflated/>"
+
+    def test_incomplete_read(self, archive):
+        with MappedArchive(archive) as z:
+            z.read("deflated.xml")
+            with z.open("deflated.xml") as src:
+                src.read(5)
+            assert z._cache._members == {}
+
+    def test_write(self, archive):
+        with MappedArchive(archive) as z:
+            with pytest.raises(ValueError):
+                z.open("new.xml", "w")
+
+
+def test_load_workbook(tmp_path):
+    from openpyxl import Workbook
+    from openpyxl.reader.excel import load_workbook
+
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(10):
+        ws.append([idx, f"value {idx}"])
+    path = tmp_path / "rows.xlsx"
+    wb.save(path)
+
+    wb = load_workbook(path, read_only=True, memory_map=True)
+    assert isinstance(wb._archive, MappedArchive)
+    ws = wb.active
+    assert list(ws.values) == list(ws.values)
+    assert ws["B10"].value == "value 9"
+    wb.close()
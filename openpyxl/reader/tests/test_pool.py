@@ -0,0 +1,73 @@
+# Copyright (c) 2010-2024 openpyxl
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZipFile
+
+import pytest
+
+from ..pool import ArchivePool
+
+
+@pytest.fixture
+def filename(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    for idx in range(4):
+        ws = wb.create_sheet(f"Sheet {idx}")
+        for row in range(200):
+            ws.append([idx, row, f"{idx}-{row}"])
+    path = tmp_path / "sheets.xlsx"
+    wb.save(path)
+    return path
+
+
+class TestArchivePool:
+    def test_owner(self, filename):
+        archive = ZipFile(filename)
+        pool = ArchivePool(archive, filename)
+        assert pool.get() is archive
+
+    def test_threads(self, filename):
+        archive = ZipFile(filename)
+        pool = ArchivePool(archive, filename)
+        with ThreadPoolExecutor(2) as executor:
+            handles = list(executor.map(lambda _: pool.get(), range(10)))
+        assert archive not in handles
+        assert 1 <= len(set(map(id, handles))) <= 2
+        pool.close()
+        assert all(h.fp is None for h in handles)
+
+    def test_shared_cache(self, filename):
+        from ..mapped import MappedArchive
+
+        archive = MappedArchive(filename)
+        pool = ArchivePool(archive, filename)
+        name = "xl/worksheets/sheet2.xml"
+        expected = archive.read(name)
+        archive.read(name)
+        assert list(archive._cache._members) == [name]
+
+        def read(_):
+            handle = pool.get()
+            assert handle._cache is archive._cache
+            return handle.read(name)
+
+        with ThreadPoolExecutor(2) as executor:
+            assert list(executor.map(read, range(4))) == [expected] * 4
+        assert list(archive._cache._members) == [name]
+        pool.close()
+        archive.close()
+
+
+def test_concurrent_sheets(filename):
+    from openpyxl.reader.excel import load_workbook
+
+    wb = load_workbook(filename, read_only=True)
+    expected = [list(ws.values) for ws in wb.worksheets]
+    with ThreadPoolExecutor(4) as executor:
+        result = list(executor.map(lambda ws: list(ws.values), wb.worksheets))
+    assert result == expected
+    handles = wb._archive_pool._handles
+    assert handles
+    wb.close()
+    assert all(h.fp is None for h in handles)
@@ -0,0 +1,140 @@
+# Copyright (c) 2010-2024 openpyxl
+import hashlib
+import io
+import struct
+from zipfile import BadZipFile
+from zipfile import ZIP_DEFLATED
+from zipfile import ZIP_STORED
+from zipfile import ZipFile
+
+import pytest
+
+from ..stream import StreamSpool
+
+
+class Pipe(io.RawIOBase):
+    """
+    A stream that cannot seek and which notes how much has been read
+    """
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        return self.data.readinto(buffer)
+
+    @property
+    def read_so_far(self):
+        return self.data.tell()
+
+
+class Unseekable(io.RawIOBase):
+    # zipfile writes data descriptors when it cannot seek
+    def __init__(self):
+        self.out = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        return self.out.write(b)
+
+
+@pytest.fixture
+def archive():
+    out = io.BytesIO()
+    with ZipFile(out, "w", ZIP_DEFLATED) as z:
+        z.writestr("first.xml", b"<first/>" * 1000)
+        z.writestr("stored.xml", b"<stored/>", ZIP_STORED)
+        # too random to compress
+        z.writestr(
+            "last.xml", b"".join(hashlib.sha256(b"%d" % i).digest() for i in range(8000))
+        )
+    return out.getvalue()
+
+
+class TestStreamSpool:
+    def test_spool(self, archive):
+        spool = StreamSpool(Pipe(archive), max_size=1024)
+        src = spool.spool()
+        assert src.read() == archive
+        assert spool.hexdigest() == hashlib.sha256(archive).hexdigest()
+
+    def test_incomplete_hash(self, archive):
+        spool = StreamSpool(Pipe(archive))
+        with pytest.raises(ValueError):
+            spool.hexdigest()
+
+    def test_entries(self, archive):
+        spool = StreamSpool(Pipe(archive))
+        names = [e.filename for e in spool.entries()]
+        assert names == ["first.xml", "stored.xml", "last.xml"]
+        assert [e.filename for e in spool.entries()] == names
+
+    def test_open(self, archive):
+        spool = StreamSpool(Pipe(archive))
+        with ZipFile(io.BytesIO(archive)) as z:
+            for name in reversed(z.namelist()):
+                assert spool.open(name).read() == z.read(name)
+
+    def test_open_early(self, archive):
+        stream = Pipe(archive)
+        spool = StreamSpool(stream)
+        assert spool.open("first.xml").read(10) == b"<first/><f"
+        assert stream.read_so_far < len(archive)
+
+    def test_missing(self, archive):
+        spool = StreamSpool(Pipe(archive))
+        with pytest.raises(KeyError):
+            spool.open("missing.xml")
+
+    def test_data_descriptors(self):
+        dst = Unseekable()
+        with ZipFile(dst, "w", ZIP_DEFLATED) as z:
+            z.writestr("a.xml", b"a" * 100000)
+            with z.open("b.xml", "w") as f:
+                f.write(b"<b/>" * 1000)
+        spool = StreamSpool(Pipe(dst.out.getvalue()))
+        entries = list(spool.entries())
+        assert [e.compress_size for e in entries] == [None, None]
+        assert spool.open("b.xml").read() == b"<b/>" * 1000
+
+    def test_small_reads(self, archive):
+        spool = StreamSpool(Pipe(archive))
+        src = spool.open("first.xml")
+        data = b""
+        while True:
+            chunk = src.read1(7)
+            if not chunk:
+                break
+            data += chunk
+        assert data == b"<first/>" * 1000
+
+    @pytest.mark.parametrize("name", ["first.xml", "stored.xml"])
+    def test_bad_crc(self, archive, name):
+        with ZipFile(io.BytesIO(archive)) as z:
+            offset = z.getinfo(name).header_offset
+        data = bytearray(archive)
+        # the CRC is 14 bytes into the local header
+        data[offset + 14] ^= 0xFF
+        spool = StreamSpool(Pipe(bytes(data)))
+        with pytest.raises(BadZipFile):
+            spool.open(name).read()
+
+    def test_bad_descriptor_crc(self):
+        dst = Unseekable()
+        with ZipFile(dst, "w", ZIP_DEFLATED) as z:
+            z.writestr("a.xml", b"<a/>" * 1000)
+        data = bytearray(dst.out.getvalue())
+        crc = struct.pack("<L", z.getinfo("a.xml").CRC)
+        pos = data.index(b"PK\x07\x08" + crc)
+        data[pos + 4] ^= 0xFF
+        spool = StreamSpool(Pipe(bytes(data)))
+        with pytest.raises(BadZipFile):
+            spool.open("a.xml").read()
@@ -1,17 +1,24 @@
 # Copyright (c) 2010-2024 openpyxl
+import pickle
+from io import BytesIO
+
+import pytest
+
 from openpyxl.cell.rich_text import CellRichText
 from openpyxl.cell.rich_text import TextBlock
 from openpyxl.cell.text import InlineFont
+from openpyxl.reader.strings import SharedStringTable
 from openpyxl.reader.strings import read_rich_text
 from openpyxl.reader.strings import read_string_table
 from openpyxl.styles.colors import Color
 
 
-def test_read_string_table(datadir):
+@pytest.mark.parametrize("engine", ["lxml", "etree"])
+def test_read_string_table(datadir, engine):
     datadir.chdir()
     src = "sharedStrings.xml"
     with open(src, "rb") as content:
-        assert read_string_table(content) == [
+        assert read_string_table(content, engine) == [
             "This is cell A1 in Sheet 1",
             "This is cell G5",
         ]
@@ -62,3 +69,66 @@ def test_formatted_string_table(datadir):
                 "     let's play ",
             ]
         )
+
+
+class TestSharedStringTable:
+    @pytest.mark.parametrize(
+        "src", ["sharedStrings.xml", "sharedStrings-emptystring.xml"]
+    )
+    def test_strings(self, datadir, src):
+        datadir.chdir()
+        with open(src, "rb") as content:
+            expected = read_string_table(content)
+        with open(src, "rb") as content:
+            table = SharedStringTable(content)
+        assert len(table) == len(expected)
+        assert list(table) == expected
+        assert table[-1] == expected[-1]
+        assert table[:1] == expected[:1]
+        table.close()
+
+    def test_rich_text(self, datadir):
+        datadir.chdir()
+        with open("shared-strings-rich.xml", "rb") as content:
+            expected = read_rich_text(content)
+        with open("shared-strings-rich.xml", "rb") as content:
+            table = SharedStringTable(content, rich_text=True)
+        assert repr(list(table)) == repr(expected)
+
+    def test_prefixed(self):
+        src = BytesIO(
+            b"""<x:sst xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+            <x:si><x:t>a</x:t></x:si><x:si/><x:si><x:t>c</x:t></x:si>
+            </x:sst>"""
+        )
+        table = SharedStringTable(src)
+        assert list(table) == ["a", "", "c"]
+
+    def test_empty(self):
+        table = SharedStringTable(BytesIO())
+        assert len(table) == 0
+
+    def test_out_of_range(self, datadir):
+        datadir.chdir()
+        with open("sharedStrings.xml", "rb") as content:
+            table = SharedStringTable(content)
+        with pytest.raises(IndexError):
+            table[2]
+
+    def test_cached(self, datadir):
+        datadir.chdir()
+        with open("sharedStrings.xml", "rb") as content:
+            table = SharedStringTable(content, cache_size=1)
+        assert table[0] is table[0]
+        table[1]
+        assert table._get.cache_info().currsize == 1
+
+    def test_pickle(self, datadir):
+        datadir.chdir()
+        with open("sharedStrings.xml", "rb") as content:
+            table = SharedStringTable(content, cache_size=1)
+        copy = pickle.loads(pickle.dumps(table))
+        assert list(copy) == list(table)
+        assert copy._get.cache_info().maxsize == 1
+        table.close()
+        assert copy[0] == "This is cell A1 in Sheet 1"
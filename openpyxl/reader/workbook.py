@@ -78,10 +78,15 @@ class WorkbookParser:
                 continue
             yield sheet, self.rels[sheet.id]
 
-    def assign_names(self):
+    def assign_names(self, sheets=None):
         """
         Bind defined names and other definitions to worksheets or the workbook
+
+        `sheets` are the sheets in the order of the source, with None for
+        those that were not read. It defaults to the sheets of the workbook.
         """
+        if sheets is None:
+            sheets = self.wb._sheets
 
         for idx, names in self.defined_names.by_sheet().items():
             if idx == "global":
@@ -89,10 +94,12 @@ class WorkbookParser:
                 continue
 
             try:
-                sheet = self.wb._sheets[idx]
+                sheet = sheets[idx]
             except IndexError:
                 warn(f"Defined names for sheet index {idx} cannot be located")
                 continue
+            if sheet is None:
+                continue
 
             for name, defn in names.items():
                 reserved = defn.is_reserved
@@ -193,17 +193,28 @@ class Stylesheet(Serialisable):
         return tree
 
 
-def apply_stylesheet(archive, wb):
+def read_stylesheet(archive):
     """
-    Add styles to workbook if present
+    Return the stylesheet of an archive or None if there isn't one
     """
     try:
         src = archive.read(ARC_STYLE)
     except KeyError:
-        return wb
+        return
 
     node = fromstring(src)
-    stylesheet = Stylesheet.from_tree(node)
+    return Stylesheet.from_tree(node)
+
+
+def apply_stylesheet(archive, wb, stylesheet=None):
+    """
+    Add styles to workbook if present. A stylesheet that has already been
+    read can be passed in instead.
+    """
+    if stylesheet is None:
+        stylesheet = read_stylesheet(archive)
+    if stylesheet is None:
+        return wb
 
     if stylesheet.cell_styles:
 
@@ -0,0 +1,25 @@
+# Copyright (c) 2010-2024 openpyxl
+import asyncio
+
+from openpyxl import Workbook
+
+
+def test_aload_workbook(tmp_path):
+    from openpyxl.aio import aload_workbook
+
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(100):
+        ws.append([idx, f"value {idx}"])
+    path = tmp_path / "rows.xlsx"
+    wb.save(path)
+
+    async def read():
+        wb = await aload_workbook(path, read_only=True)
+        rows = [row async for row in wb.active.aiter_rows(batch_rows=7, values_only=True)]
+        wb.close()
+        return rows
+
+    rows = asyncio.run(read())
+    assert len(rows) == 100
+    assert rows[-1] == (99, "value 99")
@@ -6,6 +6,9 @@ import numpy
 
 from openpyxl.compat.product import prod
 
+# the largest number of rows read into a dataframe at a time
+BATCH_ROWS = 65536
+
 
 def dataframe_to_rows(df, index=True, header=True):
     """
@@ -87,3 +90,140 @@ def expand_index(index, header=False):
         result = numpy.array(result).transpose().tolist()
         for row in result:
             yield row
+
+
+def _column_data(values):
+    """
+    Convert a masked array into something suitable for a column of a
+    dataframe, using nullable types for integers and booleans with gaps
+    """
+    from pandas.arrays import BooleanArray, IntegerArray
+
+    data = values.data
+    mask = numpy.ma.getmaskarray(values)
+    if not mask.any():
+        return data
+    kind = data.dtype.kind
+    if kind == "b":
+        return BooleanArray(data, mask)
+    if kind in "iu":
+        return IntegerArray(data, mask)
+    if kind == "f":
+        return numpy.where(mask, numpy.nan, data)
+    # dates and times are filled with NaT and objects with None
+    if kind in "mM":
+        return numpy.where(mask, numpy.array("NaT", data.dtype), data)
+    return numpy.where(mask, None, data)
+
+
+def _concatenate(arrays):
+    """
+    Join the arrays of a column from several batches. Batches that are
+    empty do not affect the type of the column.
+    """
+    if len(arrays) == 1:
+        return arrays[0]
+    types = [a.dtype for a in arrays if not numpy.ma.getmaskarray(a).all()]
+    try:
+        dtype = numpy.result_type(*types) if types else arrays[0].dtype
+    except TypeError:
+        dtype = numpy.dtype(object)
+    if dtype.kind in "US":
+        dtype = numpy.dtype(object)
+    data = []
+    for a in arrays:
+        if a.dtype != dtype:
+            if numpy.ma.getmaskarray(a).all():
+                a = numpy.ma.masked_all(len(a), dtype)
+            else:
+                a = a.astype(dtype)
+        data.append(a)
+    return numpy.ma.concatenate(data)
+
+
+def read_sheet_as_dataframe(
+    filename, sheet=None, header_row=1, usecols=None, dtype=None
+):
+    """
+    Read the values of a worksheet into a Pandas dataframe without creating
+    cells or rows. Cells with formulae have the value stored the last time
+    Excel read the sheet.
+
+    :param filename: the path to open or a file-like object
+    :param sheet: the name of the worksheet. Defaults to the active one
+    :param header_row: the row (1-based) containing column names, or None if there is none, in which case columns are named by their letter. Only the rows after it are read
+    :param usecols: the columns to read as names from the header or as 1-based indices. Integers are always indices, so columns with numbers as names are selected by their index
+    :param dtype: the type of all columns or of some columns by name. Other types are inferred
+    """
+    from pandas import DataFrame
+
+    from openpyxl.reader.excel import load_workbook
+    from openpyxl.utils.cell import get_column_letter
+
+    wb = load_workbook(filename, read_only=True, data_only=True)
+    try:
+        ws = wb.active if sheet is None else wb[sheet]
+        min_col = ws.min_column
+        max_col = ws.max_column
+        first_row = ws.min_row
+        header = ()
+        if header_row is not None:
+            header = next(
+                ws.iter_rows(
+                    min_row=header_row,
+                    max_row=header_row,
+                    min_col=min_col,
+                    max_col=max_col,
+                    values_only=True,
+                ),
+                (),
+            )
+            first_row = header_row + 1
+        if max_col is None:
+            if header_row is None:
+                # the columns can only be found by reading the worksheet
+                ws.calculate_dimension(force=True)
+                max_col = ws.max_column
+            else:
+                max_col = min_col + len(header) - 1
+
+        names = {col: get_column_letter(col) for col in range(min_col, max_col + 1)}
+        for col, name in zip(names, header):
+            if name is not None:
+                names[col] = name
+
+        columns = list(names)
+        if usecols is not None:
+            by_name = {name: col for col, name in names.items()}
+            columns = []
+            for key in usecols:
+                col = key if isinstance(key, int) else by_name.get(key)
+                if col not in names:
+                    raise ValueError(f"Column {key!r} is not in the worksheet")
+                columns.append(col)
+
+        dtypes = {}
+        if isinstance(dtype, dict):
+            dtypes = {col: dtype[names[col]] for col in columns if names[col] in dtype}
+        elif dtype is not None:
+            dtypes = {col: dtype for col in columns}
+
+        # small worksheets of known size are read in a single batch. The
+        # size is only declared by the worksheet so larger ones are still
+        # read in batches
+        batch_rows = BATCH_ROWS
+        if ws.max_row is not None:
+            batch_rows = min(max(ws.max_row + 1 - first_row, 1), BATCH_ROWS)
+        batches = list(ws.iter_batches(batch_rows, columns, dtypes, first_row))
+    finally:
+        wb.close()
+
+    data = {}
+    for idx, col in enumerate(columns):
+        arrays = [b[col] for b in batches]
+        if not arrays:
+            arrays = [numpy.ma.masked_all(0, dtypes.get(col, float))]
+        data[idx] = _column_data(_concatenate(arrays))
+    df = DataFrame(data)
+    df.columns = [names[col] for col in columns]
+    return df
@@ -4,6 +4,11 @@ import datetime
 import re
 from math import isnan
 
+from openpyxl.compat.numbers import NUMPY
+
+if NUMPY:
+    import numpy
+
 MAC_EPOCH = datetime.datetime(1904, 1, 1)
 WINDOWS_EPOCH = datetime.datetime(1899, 12, 30)
 CALENDAR_WINDOWS_1900 = 2415018.5  # Julian date of WINDOWS_EPOCH
@@ -11,6 +16,7 @@ CALENDAR_MAC_1904 = 2416480.5  # Julian date of MAC_EPOCH
 CALENDAR_WINDOWS_1900 = WINDOWS_EPOCH
 CALENDAR_MAC_1904 = MAC_EPOCH
 SECS_PER_DAY = 86400
+MS_PER_DAY = SECS_PER_DAY * 1000
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 pattern1 = r"""
@@ -141,3 +147,58 @@ def days_to_time(value):
     mins, seconds = divmod(value.seconds, 60)
     hours, mins = divmod(mins, 60)
     return datetime.time(hours, mins, seconds, value.microseconds)
+
+
+def from_excel_array(values, epoch=WINDOWS_EPOCH, timedelta=False):
+    """
+    Convert an array of Excel serials to datetime64[ms], or timedelta64[ms]
+    if `timedelta` is set, as from_excel() does for single values. NaN
+    becomes NaT.
+
+    Serials of less than a day are times for from_excel() but are returned
+    as datetimes on the day of the epoch.
+    """
+    values = numpy.asarray(values, dtype=float)
+    missing = numpy.isnan(values)
+    if timedelta:
+        us = numpy.where(missing, 0, numpy.round(values * MS_PER_DAY * 1000))
+        # round to millisecond precision, half to even as from_excel() does
+        ms, us = numpy.divmod(us.astype("int64"), 1000)
+        ms += (us > 500) | ((us == 500) & (ms % 2 == 1))
+        result = ms.astype("timedelta64[ms]")
+        result[missing] = numpy.timedelta64("NaT")
+        return result
+
+    day, fraction = numpy.divmod(values, 1)
+    if epoch == WINDOWS_EPOCH:
+        # 1900 is not a leap year but Excel thinks it is
+        day = day + ((values > 0) & (values < 60))
+    ms = day * MS_PER_DAY + numpy.round(fraction * SECS_PER_DAY * 1000)
+    ms = numpy.where(missing, 0, ms).astype("int64")
+    result = numpy.datetime64(epoch, "ms") + ms.astype("timedelta64[ms]")
+    result[missing] = numpy.datetime64("NaT")
+    return result
+
+
+def to_excel_array(values, epoch=WINDOWS_EPOCH):
+    """
+    Convert an array of datetime64 or timedelta64 values to Excel serials
+    as to_excel() does for single values. NaT becomes NaN.
+    """
+    values = numpy.asarray(values)
+    if values.dtype.kind == "m":
+        ms = values.astype("timedelta64[ms]")
+        missing = numpy.isnat(ms)
+        seconds = ms.astype("int64") * 1000 / 10**6
+        return numpy.where(missing, numpy.nan, seconds / SECS_PER_DAY)
+
+    ms = values.astype("datetime64[ms]")
+    missing = numpy.isnat(ms)
+    delta = (ms - numpy.datetime64(epoch, "ms")).astype("int64")
+    days, rest = numpy.divmod(delta, MS_PER_DAY)
+    if epoch == WINDOWS_EPOCH:
+        # 1900 is not a leap year but Excel thinks it is
+        days = days - ((days > 0) & (days <= 60))
+    seconds, ms = numpy.divmod(rest, 1000)
+    serials = days + (seconds + ms * 1000 / 10**6) / SECS_PER_DAY
+    return numpy.where(missing, numpy.nan, serials)
@@ -186,3 +186,126 @@ def test_dataframe_categorical():
 
     rows = list(dataframe_to_rows(df, header=False, index=False))
     assert rows == arrays
+
+
+@pytest.fixture
+def sample_workbook(tmp_path):
+    from datetime import datetime
+
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["id", "amount", "name", "when", "flag"])
+    ws.append([1, 1.5, "a", datetime(2020, 1, 1), True])
+    ws.append([2, None, "b", datetime(2020, 1, 2), None])
+    ws.append([3, 2.5, None, None, False])
+    wb.create_sheet("other").append(["x"])
+    path = tmp_path / "sample.xlsx"
+    wb.save(path)
+    return path
+
+
+@pytest.mark.pandas_required
+class TestReadSheetAsDataframe:
+    def test_read(self, sample_workbook):
+        from ..dataframe import read_sheet_as_dataframe
+
+        df = read_sheet_as_dataframe(sample_workbook)
+        assert list(df.columns) == ["id", "amount", "name", "when", "flag"]
+        assert df["id"].tolist() == [1, 2, 3]
+        assert str(df["id"].dtype) == "int64"
+        assert df["amount"].isna().tolist() == [False, True, False]
+        assert df["when"].dtype.kind == "M"
+        assert df["when"].isna().tolist() == [False, False, True]
+        assert str(df["flag"].dtype) == "boolean"
+
+    def test_usecols(self, sample_workbook):
+        from ..dataframe import read_sheet_as_dataframe
+
+        df = read_sheet_as_dataframe(sample_workbook, usecols=["name", 1])
+        assert list(df.columns) == ["name", "id"]
+
+    def test_usecols_numeric_names(self, tmp_path):
+        from openpyxl import Workbook
+
+        from ..dataframe import read_sheet_as_dataframe
+
+        wb = Workbook()
+        wb.active.append([2, 1])
+        wb.active.append(["a", "b"])
+        path = tmp_path / "numbers.xlsx"
+        wb.save(path)
+        # integers are indices rather than names
+        df = read_sheet_as_dataframe(path, usecols=[1])
+        assert list(df.columns) == [2]
+        assert df[2].tolist() == ["a"]
+
+    def test_batch_rows(self, sample_workbook, monkeypatch):
+        from ..dataframe import read_sheet_as_dataframe
+
+        expected = read_sheet_as_dataframe(sample_workbook)
+        monkeypatch.setattr("openpyxl.utils.dataframe.BATCH_ROWS", 2)
+        df = read_sheet_as_dataframe(sample_workbook)
+        assert df.equals(expected)
+
+    def test_declared_size(self, sample_workbook, monkeypatch):
+        from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+        from ..dataframe import BATCH_ROWS
+        from ..dataframe import read_sheet_as_dataframe
+
+        sizes = []
+        iter_batches = ReadOnlyWorksheet.iter_batches
+
+        def record(self, batch_rows, *args):
+            sizes.append(batch_rows)
+            return iter_batches(self, batch_rows, *args)
+
+        monkeypatch.setattr(ReadOnlyWorksheet, "iter_batches", record)
+        monkeypatch.setattr(ReadOnlyWorksheet, "max_row", 1048576)
+        df = read_sheet_as_dataframe(sample_workbook)
+        assert sizes == [BATCH_ROWS]
+        assert df["id"].tolist() == [1, 2, 3]
+
+    def test_unknown_column(self, sample_workbook):
+        from ..dataframe import read_sheet_as_dataframe
+
+        with pytest.raises(ValueError):
+            read_sheet_as_dataframe(sample_workbook, usecols=["missing"])
+
+    def test_dtype(self, sample_workbook):
+        from ..dataframe import read_sheet_as_dataframe
+
+        df = read_sheet_as_dataframe(sample_workbook, dtype={"id": "float64"})
+        assert str(df["id"].dtype) == "float64"
+
+    def test_no_header(self, sample_workbook):
+        from ..dataframe import read_sheet_as_dataframe
+
+        df = read_sheet_as_dataframe(sample_workbook, "other", header_row=None)
+        assert list(df.columns) == ["A"]
+        assert df["A"].tolist() == ["x"]
+
+    def test_header_only(self, sample_workbook):
+        from ..dataframe import read_sheet_as_dataframe
+
+        df = read_sheet_as_dataframe(sample_workbook, "other")
+        assert list(df.columns) == ["x"]
+        assert len(df) == 0
+
+
+@pytest.mark.numpy_required
+def test_concatenate():
+    import numpy
+
+    from ..dataframe import _concatenate
+
+    arrays = [
+        numpy.ma.MaskedArray([1, 2]),
+        numpy.ma.masked_all(2, float),
+        numpy.ma.MaskedArray([1.5]),
+    ]
+    joined = _concatenate(arrays)
+    assert joined.dtype == "float64"
+    assert joined.tolist() == [1.0, 2.0, None, None, 1.5]
@@ -224,3 +224,90 @@ def test_days_to_time():
     td = timedelta(0, 51320, 1600)
     FUT = days_to_time
     assert FUT(td) == time(14, 15, 20, 1600)
+
+
+@pytest.mark.numpy_required
+class TestArrays:
+    serials = [
+        40167,
+        21980,
+        59,
+        -25063,
+        59.875,
+        60,
+        60.5,
+        61,
+        40372.27616898148,
+        40196.5939815,
+        42126.958333333219,
+        42126.999999999884,
+        0.9999999995,
+        1,
+        -0.25,
+    ]
+
+    @pytest.mark.parametrize("epoch", ["WINDOWS_EPOCH", "MAC_EPOCH"])
+    def test_from_excel_array(self, epoch):
+        import numpy
+
+        from .. import datetime as dt
+
+        epoch = getattr(dt, epoch)
+        result = dt.from_excel_array(self.serials, epoch)
+        assert result.dtype == numpy.dtype("datetime64[ms]")
+        assert result.tolist() == [dt.from_excel(v, epoch) for v in self.serials]
+
+    def test_from_excel_array_timedelta(self):
+        from ..datetime import from_excel
+        from ..datetime import from_excel_array
+
+        values = [0.5, -1.25, 0.0006944328, -0.0006944328, 60.5, 1.0000026378]
+        result = from_excel_array(values, timedelta=True)
+        assert result.tolist() == [from_excel(v, timedelta=True) for v in values]
+
+    def test_from_excel_array_nan(self):
+        import numpy
+
+        from ..datetime import from_excel_array
+
+        result = from_excel_array([numpy.nan, 61])
+        assert numpy.isnat(result[0])
+        assert result[1] == numpy.datetime64("1900-03-01")
+
+    @pytest.mark.parametrize("epoch", ["WINDOWS_EPOCH", "MAC_EPOCH"])
+    def test_to_excel_array(self, epoch):
+        import numpy
+
+        from .. import datetime as dt
+
+        epoch = getattr(dt, epoch)
+        values = [
+            datetime(2009, 12, 20),
+            datetime(1900, 2, 28),
+            datetime(1900, 3, 1),
+            datetime(1900, 1, 1, 12),
+            datetime(1831, 5, 18),
+            datetime(2010, 1, 18, 14, 15, 20, 2000),
+            datetime(1904, 1, 1),
+        ]
+        result = dt.to_excel_array(numpy.array(values, "datetime64[ms]"), epoch)
+        assert result.tolist() == [dt.to_excel(v, epoch) for v in values]
+
+    def test_to_excel_array_timedelta(self):
+        import numpy
+
+        from ..datetime import to_excel
+        from ..datetime import to_excel_array
+
+        values = [timedelta(hours=30), timedelta(minutes=-1), timedelta(0)]
+        result = to_excel_array(numpy.array(values, "timedelta64[ms]"))
+        assert result.tolist() == [to_excel(v) for v in values]
+
+    def test_to_excel_array_nat(self):
+        import numpy
+
+        from ..datetime import to_excel_array
+
+        result = to_excel_array(numpy.array(["NaT", "1900-01-01"], "datetime64[ms]"))
+        assert numpy.isnan(result[0])
+        assert result[1] == 1
@@ -33,7 +33,9 @@ def get_active_sheet(wb):
         raise IndexError("At least one sheet must be visible")
 
     idx = wb._active_sheet_index
-    sheet = wb.active
+    sheet = None
+    if idx < len(wb._sheets):
+        sheet = wb._sheets[idx]
     if sheet and sheet.sheet_state == "visible":
         return idx
 
@@ -87,7 +89,7 @@ class WorkbookWriter:
     def write_names(self):
         defined_names = list(self.wb.defined_names.values())
 
-        for idx, sheet in enumerate(self.wb.worksheets):
+        for idx, sheet in enumerate(self.wb._worksheets()):
             quoted = quote_sheetname(sheet.title)
 
             # local names
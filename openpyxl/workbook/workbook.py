@@ -1,6 +1,9 @@
 # Copyright (c) 2010-2024 openpyxl
 """Workbook is the top-level container for all document information."""
+import os
 from copy import copy
+from io import BytesIO
+from zipfile import ZipFile
 
 from .child import _WorkbookChild
 from .defined_name import DefinedName
@@ -30,11 +33,13 @@ from openpyxl.utils.datetime import MAC_EPOCH
 from openpyxl.utils.datetime import WINDOWS_EPOCH
 from openpyxl.utils.exceptions import ReadOnlyWorkbookException
 from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.worksheet._lazy import LazyWorksheet
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.copier import WorksheetCopy
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.writer.excel import save_workbook
+from openpyxl.writer.strings import MAX_SHARED_STRINGS
 from openpyxl.xml.constants import XLSM
 from openpyxl.xml.constants import XLSX
 from openpyxl.xml.constants import XLTM
@@ -48,10 +53,15 @@ class Workbook:
 
     _read_only = False
     _data_only = False
+    _archive_pool = None
+    _string_table = None
+    # a lazy table of the strings read from the source archive
+    _lazy_strings = None
+    max_shared_strings = MAX_SHARED_STRINGS
     template = False
     path = "/xl/workbook.xml"
 
-    def __init__(self, write_only=False, iso_dates=False):
+    def __init__(self, write_only=False, iso_dates=False, share_strings=False):
         self._sheets = []
         self._pivots = []
         self._active_sheet_index = 0
@@ -72,6 +82,7 @@ class Workbook:
         self.epoch = WINDOWS_EPOCH
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.share_strings = share_strings
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -149,9 +160,10 @@ class Workbook:
         :type: :class:`openpyxl.worksheet.worksheet.Worksheet`
         """
         try:
-            return self._sheets[self._active_sheet_index]
+            sheet = self._sheets[self._active_sheet_index]
         except IndexError:
-            pass
+            return
+        return self._load_sheet(sheet)
 
     @active.setter
     def active(self, value):
@@ -264,9 +276,9 @@ class Workbook:
         :type name: string
 
         """
-        for sheet in self.worksheets + self.chartsheets:
+        for sheet in self._sheets:
             if sheet.title == key:
-                return sheet
+                return self._load_sheet(sheet)
         raise KeyError(f"Worksheet {key} does not exist.")
 
     def __delitem__(self, key):
@@ -286,12 +298,30 @@ class Workbook:
 
         :type: list of :class:`openpyxl.worksheet.worksheet.Worksheet`
         """
+        for s in self._sheets[:]:
+            self._load_sheet(s)
+        return self._worksheets()
+
+    def _worksheets(self):
+        """
+        Worksheets including those that have not been read yet
+        """
         return [
             s
             for s in self._sheets
-            if isinstance(s, (Worksheet, ReadOnlyWorksheet, WriteOnlyWorksheet))
+            if isinstance(
+                s, (Worksheet, ReadOnlyWorksheet, WriteOnlyWorksheet, LazyWorksheet)
+            )
         ]
 
+    def _load_sheet(self, sheet):
+        """
+        Read a worksheet that has not been read yet
+        """
+        if isinstance(sheet, LazyWorksheet):
+            sheet = sheet.load()
+        return sheet
+
     @property
     def chartsheets(self):
         """A list of Chartsheets in this workbook
@@ -351,10 +381,24 @@ class Workbook:
             ct = self.template and XLTM or XLSM
         return ct
 
-    def save(self, filename):
+    def save(
+        self,
+        filename,
+        workers=None,
+        compresslevel=None,
+        threads=None,
+        store_media=False,
+    ):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        Worksheets can be written in `workers` processes, which only helps
+        with several large worksheets.
+
+        The archive is compressed at `compresslevel` in `threads` threads,
+        and images which are already compressed are stored as they are if
+        `store_media` is set.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequent attempts to
@@ -364,7 +408,25 @@ class Workbook:
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
-        save_workbook(self, filename)
+        self._copy_archive(filename)
+        save_workbook(self, filename, workers, compresslevel, threads, store_media)
+
+    def _copy_archive(self, filename):
+        """
+        Worksheets that have not been read are copied from the source archive
+        when saving. Keep the source in memory if it is about to be
+        overwritten.
+        """
+        archive = getattr(self, "_archive", None)
+        if archive is None or not isinstance(filename, (str, os.PathLike)):
+            return
+        if not any(isinstance(ws, LazyWorksheet) for ws in self._sheets):
+            return
+        source = archive.filename
+        if source and os.path.exists(filename) and os.path.samefile(source, filename):
+            with open(source, "rb") as src:
+                self._archive = ZipFile(BytesIO(src.read()))
+            archive.close()
 
     @property
     def style_names(self):
@@ -399,8 +461,19 @@ class Workbook:
         """
         Close workbook file if open. Only affects read-only and write-only modes.
         """
+        if self._string_table is not None:
+            self._string_table.close()
+            self._string_table = None
+        if self._lazy_strings is not None:
+            self._lazy_strings.close()
+            self._lazy_strings = None
         if hasattr(self, "_archive"):
             self._archive.close()
+            if self._archive_pool is not None:
+                self._archive_pool.close()
+            for ws in self._sheets:
+                if isinstance(ws, ReadOnlyWorksheet):
+                    ws.disable_row_index()
 
     def _duplicate_name(self, name):
         """
@@ -408,8 +481,9 @@ class Workbook:
         Names are not case sensitive.
         """
         name = name.lower()
-        for sheet in self.worksheets:
-            for t in sheet.tables:
+        for sheet in self._worksheets():
+            # tables are checked when the worksheet is read
+            for t in getattr(sheet, "tables", ()):
                 if name == t.lower():
                     return True
 
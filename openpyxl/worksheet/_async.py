@@ -0,0 +1,86 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Stream the rows of read-only worksheets to asyncio code. The worksheet is
+read in a separate thread and the rows are handed over in batches through a
+bounded queue, so that a slow consumer holds up the reading instead of
+letting rows pile up in memory.
+"""
+import asyncio
+import threading
+
+# marks the end of the rows
+_DONE = object()
+
+
+class _Failure:
+    """
+    An exception raised while reading, to be raised again in the consumer
+    """
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+def _produce(rows, queue, loop, stop, batch_rows):
+    """
+    Read the rows in batches and put them in the queue, waiting when it is
+    full. Stops early if the consumer goes away.
+    """
+
+    def put(item):
+        if stop.is_set():
+            return False
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        return True
+
+    try:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                if not put(batch):
+                    return
+                batch = []
+        if batch and not put(batch):
+            return
+        put(_DONE)
+    except BaseException as exc:
+        if not stop.is_set():
+            put(_Failure(exc))
+
+
+async def aiter_rows(ws, batch_rows=1000, maxsize=4, **kw):
+    """
+    Yield the rows of a read-only worksheet, as returned by `iter_rows()`
+    with the same arguments, while the worksheet is read in another thread.
+    At most `maxsize` batches of `batch_rows` rows are waiting at any time.
+    """
+    if batch_rows < 1:
+        raise ValueError("A batch must contain at least one row")
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize)
+    stop = threading.Event()
+    rows = ws.iter_rows(**kw)
+    thread = threading.Thread(
+        target=_produce,
+        args=(rows, queue, loop, stop, batch_rows),
+        name="openpyxl-aiter-rows",
+        daemon=True,
+    )
+    thread.start()
+    try:
+        while True:
+            batch = await queue.get()
+            if batch is _DONE:
+                break
+            if isinstance(batch, _Failure):
+                raise batch.exc
+            for row in batch:
+                yield row
+    finally:
+        stop.set()
+        # make room for a batch that may be waiting to be put in the queue
+        # so that the thread can see that it should stop
+        while not queue.empty():
+            queue.get_nowait()
+        await loop.run_in_executor(None, thread.join)
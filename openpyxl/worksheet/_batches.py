@@ -0,0 +1,204 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Read the values of read-only worksheets into NumPy arrays, a batch of rows
+at a time
+"""
+import datetime
+
+from openpyxl.compat.numbers import NUMPY
+from openpyxl.utils.datetime import from_excel
+from openpyxl.utils.datetime import from_excel_array
+
+if NUMPY:
+    import numpy
+
+DATETIME = "datetime64[us]"
+TIMEDELTA = "timedelta64[us]"
+
+
+def _accepts(kind):
+    """
+    Return a check for the values which can be stored in an array of a kind
+    """
+    if kind == "b":
+        return lambda v: isinstance(v, bool)
+    if kind in "iu":
+        return lambda v: (isinstance(v, int) and not isinstance(v, bool)) or (
+            isinstance(v, float) and v.is_integer()
+        )
+    if kind == "f":
+        return lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+    if kind == "M":
+        return lambda v: isinstance(v, (datetime.datetime, datetime.date))
+    if kind == "m":
+        return lambda v: isinstance(v, datetime.timedelta)
+    return lambda v: True
+
+
+def _infer(values):
+    """
+    The narrowest type that can hold all the values of a column
+    """
+    types = {type(v) for v in values if v is not None}
+    if not types:
+        return numpy.dtype(float)
+    if types == {bool}:
+        return numpy.dtype(bool)
+    if types == {int}:
+        return numpy.dtype("int64")
+    if types <= {int, float}:
+        return numpy.dtype("float64")
+    if types <= {datetime.datetime, datetime.date}:
+        return numpy.dtype(DATETIME)
+    if types == {datetime.timedelta}:
+        return numpy.dtype(TIMEDELTA)
+    return numpy.dtype(object)
+
+
+def _fill(dtype):
+    kind = dtype.kind
+    if kind == "M":
+        return numpy.datetime64("NaT")
+    if kind == "m":
+        return numpy.timedelta64("NaT")
+    if kind == "O":
+        return None
+    return dtype.type(0)
+
+
+def to_array(values, dtype=None, column=None, first_row=None):
+    """
+    Convert a list of values into a masked array of the type wanted, or the
+    narrowest type that holds them. Empty cells are masked.
+    """
+    if dtype is None:
+        dtype = _infer(values)
+    else:
+        dtype = numpy.dtype(dtype)
+        accepts = _accepts(dtype.kind)
+        for idx, v in enumerate(values):
+            if v is not None and not accepts(v):
+                raise ValueError(
+                    f"Value {v!r} in row {first_row + idx}, column {column} "
+                    f"cannot be stored as {dtype}"
+                )
+
+    mask = numpy.fromiter((v is None for v in values), bool, len(values))
+    fill = _fill(dtype)
+    if dtype.kind == "O":
+        data = numpy.empty(len(values), dtype)
+        data[:] = values
+    else:
+        data = numpy.array([fill if v is None else v for v in values], dtype)
+    return numpy.ma.MaskedArray(data, mask, fill_value=fill)
+
+
+def _serials(values, serials, dtype, column, first_row, epoch, timedelta_formats):
+    """
+    Convert a column containing the serials of dates and times, with their
+    positions and styles. If all the values are serials of the same kind in
+    the range of from_excel_array() they are converted at once, otherwise
+    one at a time.
+    """
+    timedelta = {style in timedelta_formats for style in serials.values()}
+    if len(timedelta) == 1 and len(serials) == sum(v is not None for v in values):
+        timedelta = timedelta.pop()
+        kind = "m" if timedelta else "M"
+        data = numpy.array([numpy.nan if v is None else v for v in values], float)
+        # from_excel() returns times for serials of less than a day
+        in_range = timedelta or (numpy.nanmin(data) >= 1 and numpy.nanmax(data) < 2e6)
+        if in_range and (dtype is None or numpy.dtype(dtype).kind == kind):
+            result = from_excel_array(data, epoch, timedelta)
+            result = result.astype(dtype or (TIMEDELTA if timedelta else DATETIME))
+            fill = _fill(result.dtype)
+            return numpy.ma.MaskedArray(result, numpy.isnat(result), fill_value=fill)
+
+    values = list(values)
+    for pos, style in serials.items():
+        try:
+            values[pos] = from_excel(values[pos], epoch, style in timedelta_formats)
+        except (OverflowError, ValueError):
+            values[pos] = "#VALUE!"
+    return to_array(values, dtype, column, first_row)
+
+
+def iter_batches(ws, batch_rows, columns, dtypes, min_row, max_row):
+    """
+    Return a generator of dictionaries of masked arrays by column for each
+    batch of rows
+    """
+    if not NUMPY:
+        raise ImportError("You must install NumPy to read worksheets into arrays")
+    if batch_rows < 1:
+        raise ValueError("A batch must contain at least one row")
+    return _batches(ws, batch_rows, columns, dtypes or {}, min_row, max_row)
+
+
+def _batches(ws, batch_rows, columns, dtypes, min_row, max_row):
+
+    wb = ws.parent
+
+    def convert(column, values, serials, first_row, size):
+        dtype = dtypes.get(column)
+        if not serials:
+            return to_array(values[:size], dtype, column, first_row)
+        return _serials(
+            values[:size],
+            serials,
+            dtype,
+            column,
+            first_row,
+            wb.epoch,
+            wb._timedelta_formats,
+        )
+
+    def batch(first_row, values, size):
+        return {
+            column: convert(column, col, serials, first_row, size)
+            for column, col, serials in zip(columns, values, dates)
+        }
+
+    def empty():
+        return [[None] * batch_rows for _ in columns]
+
+    positions = {column: idx for idx, column in enumerate(columns)}
+    first_row = min_row
+    values = empty()
+    # the positions and styles of the serials of dates in each column
+    dates = [{} for _ in columns]
+    last = None
+    with ws._get_source() as src:
+        parser = ws._get_parser(src)
+        parser.columns = set(columns)
+        # dates are converted a column at a time
+        date_formats = parser.date_formats
+        parser.date_formats = ()
+        for idx, row in parser.parse():
+            if idx < first_row:
+                continue
+            if max_row is not None and idx > max_row:
+                # as with iter_rows rows are returned up to max_row if the
+                # worksheet goes beyond it
+                last = max_row
+                break
+            while idx >= first_row + batch_rows:
+                yield batch(first_row, values, batch_rows)
+                first_row += batch_rows
+                values = empty()
+                dates = [{} for _ in columns]
+                last = None
+            pos = idx - first_row
+            for cell in row:
+                column = positions[cell[1]]
+                values[column][pos] = cell[2]
+                if cell[4] in date_formats and cell[3] == "n":
+                    dates[column][pos] = cell[4]
+            last = idx
+
+    while last is not None and last >= first_row + batch_rows:
+        yield batch(first_row, values, batch_rows)
+        first_row += batch_rows
+        values = empty()
+        dates = [{} for _ in columns]
+    if last is not None:
+        yield batch(first_row, values, last + 1 - first_row)
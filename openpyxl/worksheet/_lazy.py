@@ -0,0 +1,194 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Worksheets that are only read from the source archive when they are first
+used. Worksheets that are never used are copied unchanged when the workbook
+is saved.
+"""
+import posixpath
+
+from .worksheet import Worksheet
+from openpyxl.packaging.manifest import Override
+from openpyxl.packaging.relationship import get_dependents
+from openpyxl.packaging.relationship import get_rels_path
+from openpyxl.workbook.child import _WorkbookChild
+from openpyxl.workbook.defined_name import DefinedNameDict
+from openpyxl.worksheet.print_settings import PrintArea
+from openpyxl.xml.constants import SHARED_STRINGS
+from openpyxl.xml.functions import tostring
+
+# relationships that only matter to the part that has them and so can be
+# copied. Anything else, such as tables or pivot tables, refers to things
+# that are numbered or listed across the workbook.
+COPYABLE = frozenset(
+    [
+        "chart",
+        "chartColorStyle",
+        "chartStyle",
+        "chartUserShapes",
+        "comments",
+        "drawing",
+        "hyperlink",
+        "image",
+        "package",
+        "printerSettings",
+        "vmlDrawing",
+    ]
+)
+
+
+class LazyWorksheet:
+    """
+    Stands in for a worksheet until it is read
+    """
+
+    _id = None
+    _path = Worksheet._path
+    _rel_type = Worksheet._rel_type
+    mime_type = Worksheet.mime_type
+    auto_filter = None
+
+    path = _WorkbookChild.path
+    print_titles = Worksheet.print_titles
+    print_area = Worksheet.print_area
+
+    def __init__(self, parent, title, reader, sheet, rel):
+        self.parent = parent
+        self.title = title
+        self.sheet_state = "visible"
+        self.defined_names = DefinedNameDict()
+        self._print_rows = None
+        self._print_cols = None
+        self._print_area = PrintArea()
+        self._reader = reader
+        self._sheet = sheet
+        self._rel = rel
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} "{self.title}">'
+
+    def load(self):
+        """
+        Read the worksheet and put it in place of this one in the workbook
+        """
+        wb = self.parent
+        reader = self._reader
+        # the workbook may have made a copy of its archive before being saved
+        # over the original file
+        reader.archive = wb._archive
+        idx = wb._sheets.index(self)
+        # the worksheet cannot take the title while this one has it
+        del wb._sheets[idx]
+        try:
+            ws = reader.read_worksheet(self._sheet, self._rel)
+        except BaseException:
+            wb._sheets.insert(idx, self)
+            raise
+        ws.title = self.title
+        ws.sheet_state = self.sheet_state
+        ws.defined_names = self.defined_names
+        ws._print_rows = self._print_rows
+        ws._print_cols = self._print_cols
+        ws._print_area = self._print_area
+        wb._sheets.insert(idx, ws)
+        return ws
+
+    def _dependents(self, part):
+        """
+        Return the relationships of a part in the source archive
+        """
+        rels_path = get_rels_path(part)
+        if rels_path in self._reader.valid_files:
+            return get_dependents(self.parent._archive, rels_path)
+
+    def can_copy(self):
+        """
+        Check whether the worksheet and everything it refers to can be copied
+        """
+        todo = [self._rel.target]
+        seen = set(todo)
+        while todo:
+            rels = self._dependents(todo.pop())
+            for r in rels or []:
+                if r.Type.rsplit("/", 1)[-1] not in COPYABLE:
+                    return False
+                if r.TargetMode != "External" and r.target not in seen:
+                    seen.add(r.target)
+                    todo.append(r.target)
+        return True
+
+    def _write(self, archive, manifest, parts):
+        """
+        Copy the worksheet from the source archive. Parts that it refers to
+        are copied under names that are not used yet. `parts` maps the names
+        of parts that have already been copied to their new names.
+        """
+        src = self.parent._archive
+        archive.writestr(self.path[1:], src.read(self._rel.target))
+        self._copy_rels(archive, manifest, parts, self._rel.target, self.path[1:])
+
+    def _copy_rels(self, archive, manifest, parts, source, target):
+        rels = self._dependents(source)
+        if rels is None:
+            return
+        for r in rels:
+            if r.TargetMode != "External":
+                r.target = "/" + self._copy_part(archive, manifest, parts, r.target)
+        archive.writestr(get_rels_path(target), tostring(rels.to_tree()))
+
+    def _copy_part(self, archive, manifest, parts, source):
+        if source in parts:
+            return parts[source]
+
+        names = set(archive.namelist())
+        root, ext = posixpath.splitext(source)
+        target = source
+        counter = 0
+        while target in names:
+            counter += 1
+            target = f"{root}_{counter}{ext}"
+        parts[source] = target
+
+        archive.writestr(target, self.parent._archive.read(source))
+        package = self._reader.package
+        for override in package.Override:
+            if override.PartName == "/" + source:
+                manifest.Override.append(Override("/" + target, override.ContentType))
+        for default in package.Default:
+            if ext and default.Extension.lower() == ext[1:].lower():
+                manifest.add_default(ext[1:], default.ContentType)
+
+        self._copy_rels(archive, manifest, parts, source, target)
+        return target
+
+
+def source_strings(worksheets):
+    """
+    Return the name of the shared strings part of the source archive of
+    worksheets that have not been read, if it has one
+    """
+    if worksheets:
+        ct = worksheets[0]._reader.package.find(SHARED_STRINGS)
+        if ct is not None:
+            return ct.PartName[1:]
+
+
+def write_lazy_worksheets(worksheets, archive, manifest, copy_strings=True):
+    """
+    Copy worksheets that have not been read from their source archive.
+    Return the name of the shared strings part if the worksheets needed it
+    and the names of all the parts that were copied. The part itself is not
+    copied if the strings are written with others.
+    """
+    parts = {}
+    strings = None
+    for ws in worksheets:
+        ws._write(archive, manifest, parts)
+        manifest.append(ws)
+
+    # the worksheets refer to strings in the original table
+    strings = source_strings(worksheets)
+    if strings is not None:
+        if copy_strings:
+            archive.writestr(strings, worksheets[0].parent._archive.read(strings))
+        manifest.Override.append(Override("/" + strings, SHARED_STRINGS))
+    return strings, list(parts.values())
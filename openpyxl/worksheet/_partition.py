@@ -0,0 +1,129 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Split a decompressed worksheet into ranges of rows that can be parsed
+independently of each other.
+"""
+import re
+from html import unescape
+
+from ._row_index import DATA_START
+from ._row_index import ROW_START
+from openpyxl.formula.translate import Translator
+
+DATA_END = re.compile(rb"</(?:[A-Za-z_][\w.-]*:)?sheetData\s*>")
+ROW_NUMBER = re.compile(rb"""\sr\s*=\s*["'](\d+)["']""")
+CELL_REF = re.compile(rb"""\sr\s*=\s*["']([A-Za-z]+\d+)["']""")
+SHARED_FORMULA = re.compile(
+    rb"""<(?:[A-Za-z_][\w.-]*:)?f\s[^>]*?\bt\s*=\s*["']shared["'][^>]*>"""
+)
+SHARED_INDEX = re.compile(rb"""\bsi\s*=\s*["'](\d+)["']""")
+
+
+class Partition:
+    """
+    A range of rows in the decompressed worksheet, the number of the first
+    row if it is known and the shared formulae defined before it
+    """
+
+    __slots__ = ("start", "end", "row", "shared_formulae")
+
+    def __init__(self, start, end, row=None, shared_formulae=None):
+        self.start = start
+        self.end = end
+        self.row = row
+        self.shared_formulae = shared_formulae or {}
+
+
+def _row_number(data, pos):
+    tag = data[pos : data.find(b">", pos) + 1]
+    match = ROW_NUMBER.search(tag)
+    if match is not None:
+        return int(match.group(1))
+
+
+def _shared_formulae(data, end):
+    """
+    Yield the offset, index and translator of each shared formula defined
+    before `end`. Returns None if a formula cannot be placed.
+    """
+    for match in SHARED_FORMULA.finditer(data, 0, end):
+        tag = match.group()
+        if tag.endswith(b"/>"):
+            continue
+        text = data[match.end() : data.find(b"<", match.end())]
+        idx = SHARED_INDEX.search(tag)
+        if not text or idx is None:
+            continue
+        # formulae are the first child of their cell
+        cell = data[data.rfind(b"<", 0, match.start()) : match.start()]
+        ref = CELL_REF.search(cell)
+        if ref is None:
+            raise ValueError("Shared formula in a cell without a reference")
+        value = "=" + unescape(text.decode("utf-8"))
+        yield (
+            match.start(),
+            idx.group(1).decode(),
+            Translator(value, ref.group(1).decode()),
+        )
+
+
+def split_rows(data, parts, shared_formulae=True):
+    """
+    Split the rows of a worksheet into up to `parts` partitions.
+
+    Partitions only start at rows that have a number, because the parser
+    cannot otherwise know which row it is reading. Shared formulae defined
+    in earlier partitions are passed on to later ones. If this is not
+    possible the rows are returned as a single partition.
+
+    Return the worksheet up to the start of the rows, the remainder after
+    them and the partitions.
+    """
+    match = DATA_START.search(data)
+    if match is None:
+        return None, None, []
+    tag_end = data.find(b">", match.start())
+    header = data[: tag_end + 1]
+    if data[tag_end - 1 : tag_end] == b"/":
+        # empty sheetData
+        return header, data[tag_end + 1 :], []
+
+    match = DATA_END.search(data, tag_end)
+    rows_end = match.start() if match is not None else len(data)
+    footer = data[rows_end:]
+    match = ROW_START.search(data, tag_end, rows_end)
+    if match is None:
+        return header, footer, []
+    first = match.start()
+
+    starts = [(first, _row_number(data, first))]
+    size = rows_end - first
+    for n in range(1, parts):
+        pos = max(first + n * size // parts, starts[-1][0] + 1)
+        for match in ROW_START.finditer(data, pos, rows_end):
+            row = _row_number(data, match.start())
+            if row is not None:
+                starts.append((match.start(), row))
+                break
+        else:
+            break
+
+    partitions = []
+    for (start, row), (end, _) in zip(starts, starts[1:] + [(rows_end, None)]):
+        partitions.append(Partition(start, end, row))
+
+    if shared_formulae and len(partitions) > 1:
+        try:
+            defined = list(_shared_formulae(data, partitions[-1].start))
+        except ValueError:
+            return header, footer, [Partition(first, rows_end, starts[0][1])]
+        formulae = {}
+        defined.reverse()
+        for p in partitions:
+            while defined and defined[-1][0] < p.start:
+                _, idx, translator = defined.pop()
+                # as in the parser the first definition of an index is kept
+                formulae.setdefault(idx, translator)
+            p.shared_formulae = dict(formulae)
+
+    return header, footer, partitions
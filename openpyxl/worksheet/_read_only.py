@@ -1,10 +1,15 @@
 # Copyright (c) 2010-2024 openpyxl
 """ Read worksheets on-demand
 """
+from ._async import aiter_rows
+from ._batches import iter_batches
 from ._reader import WorkSheetParser
+from ._reader import compile_schema
+from ._row_index import RowIndex
 from .worksheet import Worksheet
 from openpyxl.cell.read_only import EMPTY_CELL
 from openpyxl.cell.read_only import ReadOnlyCell
+from openpyxl.reader._parallel import map_worksheet
 from openpyxl.utils import get_column_letter
 from openpyxl.workbook.defined_name import DefinedNameDict
 
@@ -18,42 +23,313 @@ class ReadOnlyWorksheet:
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
+    _row_index = None
 
     # from Standard Worksheet
     # Methods from Worksheet
     cell = Worksheet.cell
-    iter_rows = Worksheet.iter_rows
     values = Worksheet.values
     rows = Worksheet.rows
     __getitem__ = Worksheet.__getitem__
     __iter__ = Worksheet.__iter__
 
-    def __init__(self, parent_workbook, title, worksheet_path, shared_strings):
+    def __init__(
+        self,
+        parent_workbook,
+        title,
+        worksheet_path,
+        shared_strings,
+        engine=None,
+        cache=None,
+    ):
         self.parent = parent_workbook
         self.title = title
         self.sheet_state = "visible"
         self._current_row = None
         self._worksheet_path = worksheet_path
         self._shared_strings = shared_strings
+        self._engine = engine
+        self._cache = cache
         self._get_size()
+        if cache is not None:
+            self._row_index = cache.load_index(worksheet_path)
         self.defined_names = DefinedNameDict()
 
     def _get_size(self):
-        src = self._get_source()
-        parser = WorkSheetParser(src, [])
-        dms = parser.parse_dimensions()
-        src.close()
+        cache = self._cache
+        if cache is not None and self._worksheet_path in cache.dimensions:
+            dms = cache.dimensions[self._worksheet_path]
+        else:
+            src = self._get_source()
+            parser = WorkSheetParser(src, [], engine=self._engine)
+            dms = parser.parse_dimensions()
+            src.close()
+            if cache is not None:
+                cache.set_dimensions(self._worksheet_path, dms)
         if dms is not None:
             self._min_column, self._min_row, self._max_column, self._max_row = dms
 
+    def enable_row_index(self, step=1000):
+        """
+        Keep a decompressed copy of the worksheet and a checkpoint every
+        `step` rows the next time it is read in full. Later reads of
+        individual cells or ranges of rows then start from the nearest
+        checkpoint instead of the beginning of the worksheet.
+
+        An index with the same step that has already been built, for instance
+        one loaded from a read cache, is kept.
+        """
+        index = self._row_index
+        if index is not None and index.built and index.step == step:
+            return
+        self.disable_row_index()
+        self._row_index = RowIndex(step)
+
+    def disable_row_index(self):
+        """
+        Discard the row index and its copy of the worksheet
+        """
+        if self._row_index is not None:
+            self._row_index.close()
+        self._row_index = None
+
     def _get_source(self):
         """Parse xml source on demand, must close after use"""
-        return self.parent._archive.open(self._worksheet_path)
+        pool = getattr(self.parent, "_archive_pool", None)
+        archive = pool.get() if pool is not None else self.parent._archive
+        return archive.open(self._worksheet_path)
+
+    def _get_parser(self, src):
+        return WorkSheetParser(
+            src,
+            self._shared_strings,
+            data_only=self.parent.data_only,
+            epoch=self.parent.epoch,
+            date_formats=self.parent._date_formats,
+            timedelta_formats=self.parent._timedelta_formats,
+            engine=self._engine,
+        )
+
+    def iter_rows(
+        self,
+        min_row=None,
+        max_row=None,
+        min_col=None,
+        max_col=None,
+        values_only=False,
+        columns=None,
+        predicate=None,
+        key_columns=None,
+        schema=None,
+        errors=None,
+        lazy=False,
+    ):
+        """
+        Produces cells from the worksheet, by row. Specify the iteration range
+        using indices of rows and columns, or the indices of the columns
+        wanted.
+
+        Cells outside the columns wanted are skipped before their values are
+        converted.
+
+        Rows can be filtered with a predicate which is passed a tuple of the
+        values in the key columns. Only the key cells of rows which are
+        rejected are converted, and rows which are rejected or missing are
+        not returned at all.
+
+        If the types of columns are known they can be given in a schema,
+        which maps column indices to int, float, bool, str, datetime.datetime,
+        datetime.date, or None to skip a column. Their values are then
+        converted without looking at the style of each cell. Cells whose
+        values do not match are returned empty and recorded in `errors` as
+        (row, column, value). If no list is given a ValueError is raised.
+
+        Lazy cells keep the text of their values and only convert it when
+        their value or type is first used, which is cheaper when most cells
+        are never looked at. It has no effect on values_only.
+
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_col: largest column index (1-based index)
+        :type max_col: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param values_only: whether only cell values should be returned
+        :type values_only: bool
+
+        :param columns: unique column indices (1-based) to return in this order. Overrides min_col and max_col
+        :type columns: iterable of int
+
+        :param predicate: called with the values of the key columns of each row, which is returned if the result is true
+        :type predicate: callable
+
+        :param key_columns: column indices (1-based) of the values passed to the predicate
+        :type key_columns: iterable of int
+
+        :param schema: types by column index (1-based)
+        :type schema: dict
+
+        :param errors: a list to which cells that do not match the schema are added
+        :type errors: list
+
+        :param lazy: whether cells convert their values when they are first used
+        :type lazy: bool
+
+        :rtype: generator
+        """
+        lazy = lazy and not values_only
+        if schema is not None:
+            schema = compile_schema(schema)
+        if predicate is not None:
+            if not key_columns:
+                raise ValueError("A predicate needs key columns")
+            key_columns = tuple(key_columns)
+        if columns is None and predicate is None and schema is None and not lazy:
+            return Worksheet.iter_rows(
+                self, min_row, max_row, min_col, max_col, values_only
+            )
+
+        if columns is not None:
+            columns = tuple(columns)
+            if len(set(columns)) != len(columns):
+                raise ValueError("Columns must be unique")
+            min_col = min(columns, default=1)
+            max_col = max(columns, default=1)
+        return self._cells_by_row(
+            min_col or 1,
+            min_row or 1,
+            max_col or self.max_column,
+            max_row or self.max_row,
+            values_only,
+            columns,
+            predicate,
+            key_columns,
+            schema,
+            errors,
+            lazy,
+        )
+
+    def iter_batches(
+        self,
+        batch_rows=65536,
+        columns=None,
+        dtypes=None,
+        min_row=None,
+        max_row=None,
+    ):
+        """
+        Produces the values of the worksheet as NumPy arrays by column, a
+        batch of rows at a time. Each batch is a dictionary of masked arrays
+        by column index in which empty cells are masked. The last batch may
+        be shorter.
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+        The type of each array is taken from `dtypes` or is otherwise the
+        narrowest of bool, int64, float64, datetime64 and timedelta64 which
+        holds the values in the batch. Object arrays are only used for
+        strings and mixed values.
+
+        :param batch_rows: the number of rows in each batch
+        :type batch_rows: int
+
+        :param columns: unique column indices (1-based). Defaults to all the columns of the worksheet
+        :type columns: iterable of int
+
+        :param dtypes: NumPy types by column index
+        :type dtypes: dict
+
+        :rtype: generator
+        """
+        if columns is None:
+            if self.max_column is None:
+                raise ValueError(
+                    "Columns must be given when the dimensions are not known"
+                )
+            columns = range(self.min_column, self.max_column + 1)
+        columns = tuple(columns)
+        if not columns:
+            raise ValueError("At least one column must be given")
+        if len(set(columns)) != len(columns):
+            raise ValueError("Columns must be unique")
+        return iter_batches(
+            self, batch_rows, columns, dtypes, min_row or 1, max_row or self.max_row
+        )
+
+    def parallel_map(
+        self,
+        func,
+        workers=None,
+        min_row=None,
+        max_row=None,
+        min_col=None,
+        max_col=None,
+    ):
+        """
+        Apply a function to the values of each row, as returned by
+        `iter_rows(values_only=True)`, in a pool of processes and return the
+        results in row order.
+
+        The worksheet is decompressed into a temporary file and split into
+        partitions of rows, each of which is parsed in another process. The
+        function must be picklable, for instance defined at module level.
+
+        :param func: called with a tuple of values for each row
+        :type func: callable
+
+        :param workers: the number of processes. Defaults to the number of CPUs
+        :type workers: int
+
+        :rtype: generator
+        """
+        return map_worksheet(
+            self,
+            func,
+            workers,
+            min_row or 1,
+            max_row or self.max_row,
+            min_col or 1,
+            max_col or self.max_column,
+        )
+
+    def aiter_rows(self, batch_rows=1000, maxsize=4, **kw):
+        """
+        Produces the same rows as `iter_rows()` for use with `async for`.
+        The worksheet is read in another thread which hands the rows over in
+        batches. When `maxsize` batches are waiting to be used the thread
+        waits as well.
+
+        :param batch_rows: the number of rows in each batch
+        :type batch_rows: int
+
+        :param maxsize: the number of batches that can be waiting
+        :type maxsize: int
+
+        :rtype: asynchronous generator
+        """
+        return aiter_rows(self, batch_rows, maxsize, **kw)
+
+    def _cells_by_row(
+        self,
+        min_col,
+        min_row,
+        max_col,
+        max_row,
+        values_only=False,
+        columns=None,
+        predicate=None,
+        key_columns=None,
+        schema=None,
+        errors=None,
+        lazy=False,
+    ):
         """
         The source worksheet file may have columns or rows missing.
-        Missing cells will be created.
+        Missing cells will be created, unless rows are filtered.
         """
         filler = EMPTY_CELL
         if values_only:
@@ -62,37 +338,88 @@ class ReadOnlyWorksheet:
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
         empty_row = []
-        if max_col is not None:
+        if columns is not None:
+            empty_row = (filler,) * len(columns)
+            columns = {column: idx for idx, column in enumerate(columns)}
+        elif max_col is not None:
             empty_row = (filler,) * (max_col + 1 - min_col)
 
         counter = min_row
         idx = 1
-        with self._get_source() as src:
-            parser = WorkSheetParser(
-                src,
-                self._shared_strings,
-                data_only=self.parent.data_only,
-                epoch=self.parent.epoch,
-                date_formats=self.parent._date_formats,
-                timedelta_formats=self.parent._timedelta_formats,
-            )
+        index = self._row_index
+        checkpoint = None
+        if index is not None and index.built:
+            checkpoint = index.find(min_row)
+        # rows which are filtered out cannot be matched to the source
+        building = (
+            index is not None
+            and predicate is None
+            and not (index.built or index.building)
+        )
 
-            for idx, row in parser.parse():
-                if max_row is not None and idx > max_row:
-                    break
+        if checkpoint is not None:
+            src = index.open(checkpoint)
+        else:
+            src = self._get_source()
 
-                # some rows are missing
-                for _ in range(counter, idx):
-                    counter += 1
-                    yield empty_row
+        with src:
+            if building:
+                src = index.start(src)
+            parser = self._get_parser(src)
+            if checkpoint is not None:
+                parser.row_counter = checkpoint.previous
+                parser.shared_formulae = dict(checkpoint.shared_formulae)
+            # only convert the cells which will be returned
+            if min_col > 1:
+                parser.min_col = min_col
+            parser.max_col = max_col
+            if columns is not None:
+                parser.columns = set(columns)
+            if predicate is not None:
+                parser.predicate = predicate
+                parser.key_columns = key_columns
+            if schema is not None:
+                parser.schema = schema
+                parser.mismatches = errors
+            parser.lazy = lazy
 
-                # return cells from a row
-                if counter <= idx:
-                    row = self._get_row(row, min_col, max_col, values_only)
-                    counter += 1
-                    yield row
+            rows = previous = 0
+            try:
+                for idx, row in parser.parse():
+                    if building:
+                        index.record(rows, parser, previous)
+                        previous = idx
+                    rows += 1
+                    if max_row is not None and idx > max_row:
+                        break
 
-        if max_row is not None and max_row < idx:
+                    # rows which have been filtered out are not padded
+                    if predicate is not None:
+                        counter = max(counter, idx)
+
+                    # some rows are missing
+                    for _ in range(counter, idx):
+                        counter += 1
+                        yield empty_row
+
+                    # return cells from a row
+                    if counter <= idx:
+                        if columns is not None:
+                            row = self._get_columns(row, columns, values_only)
+                        else:
+                            row = self._get_row(row, min_col, max_col, values_only)
+                        counter += 1
+                        yield row
+                else:
+                    if building:
+                        index.finish(rows)
+                        if index.built and self._cache is not None:
+                            self._cache.save_index(self._worksheet_path, index)
+            finally:
+                if building and not index.built:
+                    index.close()
+
+        if max_row is not None and max_row < idx and predicate is None:
             for _ in range(counter, max_row + 1):
                 yield empty_row
 
@@ -104,7 +431,7 @@ class ReadOnlyWorksheet:
         if not row and not max_col:
             return ()
 
-        max_col = max_col or row[-1]["column"]
+        max_col = max_col or row[-1][1]
         row_width = max_col + 1 - min_col
 
         new_row = [EMPTY_CELL] * row_width
@@ -112,12 +439,32 @@ class ReadOnlyWorksheet:
             new_row = [None] * row_width
 
         for cell in row:
-            counter = cell["column"]
+            counter = cell[1]
             if min_col <= counter <= max_col:
                 idx = counter - min_col  # position in list of cells returned
-                new_row[idx] = cell["value"]
-                if not values_only:
-                    new_row[idx] = ReadOnlyCell(self, **cell)
+                if values_only:
+                    new_row[idx] = cell[2]
+                else:
+                    new_row[idx] = ReadOnlyCell(self, *cell)
+
+        return tuple(new_row)
+
+    def _get_columns(self, row, columns, values_only=False):
+        """
+        Return the cells or values in a row for a mapping of column index to
+        position
+        """
+        new_row = [EMPTY_CELL] * len(columns)
+        if values_only:
+            new_row = [None] * len(columns)
+
+        for cell in row:
+            idx = columns.get(cell[1])
+            if idx is not None:
+                if values_only:
+                    new_row[idx] = cell[2]
+                else:
+                    new_row[idx] = ReadOnlyCell(self, *cell)
 
         return tuple(new_row)
 
@@ -152,6 +499,9 @@ class ReadOnlyWorksheet:
 
         self._max_row = cell.row
         self._max_column = max_col
+        if self._cache is not None:
+            dms = (self._min_column, self._min_row, self._max_column, self._max_row)
+            self._cache.set_dimensions(self._worksheet_path, dms)
 
     def reset_dimensions(self):
         """
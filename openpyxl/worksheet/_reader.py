@@ -1,8 +1,8 @@
 # Copyright (c) 2010-2024 openpyxl
 """Reader for a single worksheet."""
+import datetime
 from copy import copy
 from warnings import warn
-from xml.etree.ElementTree import iterparse
 
 from .datavalidation import DataValidationList
 from .dimensions import SheetDimension
@@ -25,6 +25,7 @@ from .table import TablePartList
 from .views import SheetViewList
 from openpyxl.cell import Cell
 from openpyxl.cell import MergedCell
+from openpyxl.cell.read_only import RawValue
 from openpyxl.cell.rich_text import CellRichText
 from openpyxl.cell.text import Text
 from openpyxl.descriptors.excel import ExtensionList
@@ -40,6 +41,8 @@ from openpyxl.worksheet.dimensions import RowDimension
 from openpyxl.worksheet.dimensions import SheetFormatProperties
 from openpyxl.xml.constants import EXT_TYPES
 from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import get_engine
+from openpyxl.xml.functions import iterelements
 
 CELL_TAG = f"{{{SHEET_MAIN_NS}}}c"
 VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
@@ -78,6 +81,86 @@ def _cast_number(value):
     return int(value)
 
 
+def _typed_int(parser, value, data_type):
+    if data_type != "n":
+        raise TypeError
+    number = _cast_number(value)
+    if isinstance(number, float):
+        if not number.is_integer():
+            raise ValueError
+        number = int(number)
+    return number, "n"
+
+
+def _typed_float(parser, value, data_type):
+    if data_type != "n":
+        raise TypeError
+    return float(value), "n"
+
+
+def _typed_bool(parser, value, data_type):
+    if data_type != "b":
+        raise TypeError
+    return bool(int(value)), "b"
+
+
+def _typed_str(parser, value, data_type):
+    if data_type == "s":
+        return parser.shared_strings[int(value)], "s"
+    if data_type in ("str", "inlineStr"):
+        return value, "s"
+    raise TypeError
+
+
+def _typed_datetime(parser, value, data_type):
+    if data_type == "n":
+        value = from_excel(float(value), parser.epoch)
+    elif data_type == "d":
+        value = from_ISO8601(value)
+    else:
+        raise TypeError
+    if not isinstance(value, datetime.datetime):
+        raise TypeError
+    return value, "d"
+
+
+def _typed_date(parser, value, data_type):
+    value, data_type = _typed_datetime(parser, value, data_type)
+    return value.date(), data_type
+
+
+# converters for the types which can be given in a schema, None skips a column
+SCHEMA_TYPES = {
+    int: _typed_int,
+    float: _typed_float,
+    bool: _typed_bool,
+    str: _typed_str,
+    datetime.datetime: _typed_datetime,
+    datetime.date: _typed_date,
+    None: None,
+    "int": _typed_int,
+    "float": _typed_float,
+    "bool": _typed_bool,
+    "str": _typed_str,
+    "datetime": _typed_datetime,
+    "date": _typed_date,
+    "skip": None,
+}
+
+
+def compile_schema(schema):
+    """
+    Map the types of columns in a schema to converters
+    """
+    compiled = {}
+    for column, kind in schema.items():
+        try:
+            compiled[column] = SCHEMA_TYPES[kind]
+        except (KeyError, TypeError):
+            raise ValueError(f"{kind!r} is not a valid column type")
+    return compiled
+
+
 def parse_richtext_string(element):
     """
     Parse inline string and preserve rich text formatting
@@ -99,8 +182,15 @@ class WorkSheetParser:
         date_formats=set(),
         timedelta_formats=set(),
         rich_text=False,
+        engine=None,
     ):
-        self.min_row = self.min_col = None
+        self.min_row = self.min_col = self.max_col = None
+        self.columns = None
+        self.predicate = None
+        self.key_columns = ()
+        self.schema = None
+        self.mismatches = None
+        self.lazy = False
         self.epoch = epoch
         self.source = src
         self.shared_strings = shared_strings
@@ -121,6 +211,7 @@ class WorkSheetParser:
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
         self.rich_text = rich_text
+        self.engine = get_engine(engine)
 
     def parse(self):
         dispatcher = {
@@ -150,10 +241,16 @@ class WorkSheetParser:
             MERGE_TAG: ("merged_cells", MergeCells),
         }
 
+        tags = (ROW_TAG, *dispatcher, *properties)
         # add a finaliser to close the source when this becomes possible
-        it = iterparse(self.source)
+        it = iterelements(
+            self.source,
+            tags,
+            self.engine,
+            prune=(ROW_TAG, COL_TAG),
+        )
 
-        for _, element in it:
+        for element in it:
             tag_name = element.tag
             if tag_name in dispatcher:
                 dispatcher[tag_name](element)
@@ -164,6 +261,9 @@ class WorkSheetParser:
                 setattr(self, prop[0], obj)
                 element.clear()
             elif tag_name == ROW_TAG:
+                if self.predicate is not None and not self.accept_row(element):
+                    element.clear()
+                    continue
                 row = self.parse_row(element)
                 element.clear()
                 yield row
@@ -172,86 +272,239 @@ class WorkSheetParser:
         """
         Get worksheet dimensions if they are provided.
         """
-        it = iterparse(self.source)
+        it = iterelements(
+            self.source,
+            (DIMENSION_TAG, DATA_TAG),
+            self.engine,
+            events=("start",),
+        )
 
-        for _event, element in it:
+        for element in it:
             if element.tag == DIMENSION_TAG:
                 dim = SheetDimension.from_tree(element)
                 return dim.boundaries
-
-            elif element.tag == DATA_TAG:
-                # Dimensions missing
-                break
-            element.clear()
+            # Dimensions missing
+            break
 
     def parse_cell(self, element):
-        data_type = element.get("t", "n")
+        """
+        Return a record of (row, column, value, data_type, style_id) for a cell
+        """
         coordinate = element.get("r")
+        if coordinate:
+            row, column = coordinate_to_tuple(coordinate)
+            self.col_counter = column
+        else:
+            self.col_counter += 1
+            row, column = self.row_counter, self.col_counter
+
+        if (
+            self.min_col or self.max_col or self.columns is not None
+        ) and self.skip_column(column):
+            self.skip_cell(element)
+            return
+
+        return self.convert(element, row, column)
+
+    def convert(self, element, row, column):
+        """
+        Convert the value of a cell using the schema if there is one
+        """
+        if self.schema is not None and column in self.schema:
+            converter = self.schema[column]
+            if converter is None:
+                self.skip_cell(element)
+                return
+            return self.convert_typed(element, row, column, converter)
+        if self.lazy:
+            return self.defer_cell(element, row, column)
+        return self.convert_cell(element, row, column)
+
+    def convert_typed(self, element, row, column, converter):
+        """
+        Convert the value of a cell to the type given in the schema without
+        looking at its style. Values that cannot be converted are reported
+        as mismatches.
+        """
+        data_type = element.get("t", "n")
         style_id = element.get("s", 0)
         if style_id:
             style_id = int(style_id)
 
+        value = formula = inline_string = None
+        for child in element:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING:
+                inline_string = child
+
+        if formula is not None and not self.data_only:
+            return self.convert_cell(element, row, column)
+
         if data_type == "inlineStr":
             value = None
-        else:
-            value = element.findtext(VALUE_TAG, None) or None
+            if inline_string is not None:
+                value = Text.from_tree(inline_string).content
+        elif not value:
+            value = None
 
-        if coordinate:
-            row, column = coordinate_to_tuple(coordinate)
-            self.col_counter = column
-        else:
-            self.col_counter += 1
-            row, column = self.row_counter, self.col_counter
+        if value is not None:
+            try:
+                value, data_type = converter(self, value, data_type)
+            except (ValueError, TypeError, KeyError, IndexError, OverflowError):
+                self.report_mismatch(row, column, value)
+                value = None
+
+        return row, column, value, data_type, style_id
 
-        if not self.data_only and element.find(FORMULA_TAG) is not None:
+    def report_mismatch(self, row, column, value):
+        if self.mismatches is None:
+            coordinate = f"{get_column_letter(column)}{row}"
+            raise ValueError(f"Cell {coordinate} value {value!r} does not match the schema")
+        self.mismatches.append((row, column, value))
+
+    def convert_cell(self, element, row, column):
+        """
+        Convert the value of a cell
+        """
+        coordinate = element.get("r")
+        data_type = element.get("t", "n")
+        style_id = element.get("s", 0)
+        if style_id:
+            style_id = int(style_id)
+
+        # a single pass over the children is much cheaper than find() with lxml
+        value = formula = inline_string = None
+        for child in element:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING:
+                inline_string = child
+
+        if data_type == "inlineStr" or not value:
+            value = None
+
+        if not self.data_only and formula is not None:
             data_type = "f"
-            value = self.parse_formula(element)
+            value = self.parse_formula(element, row, column)
 
         elif value is not None:
-            if data_type == "n":
-                value = _cast_number(value)
-                if style_id in self.date_formats:
-                    data_type = "d"
-                    try:
-                        value = from_excel(
-                            value,
-                            self.epoch,
-                            timedelta=style_id in self.timedelta_formats,
-                        )
-                    except (OverflowError, ValueError):
-                        msg = f"""Cell {coordinate} is marked as a date but the serial value {value} is outside the limits for dates. The cell will be treated as an error."""
-                        warn(msg)
-                        data_type = "e"
-                        value = "#VALUE!"
-            elif data_type == "s":
-                value = self.shared_strings[int(value)]
-            elif data_type == "b":
-                value = bool(int(value))
-            elif data_type == "str":
-                data_type = "s"
-            elif data_type == "d":
-                value = from_ISO8601(value)
+            value, data_type = self.decode_value(value, data_type, style_id, coordinate)
 
+        elif data_type == "inlineStr" and inline_string is not None:
+            value, data_type = self.decode_value(
+                inline_string, data_type, style_id, coordinate
+            )
+
+        return row, column, value, data_type, style_id
+
+    def decode_value(self, value, data_type, style_id, coordinate):
+        """
+        Convert the text of a cell's value, or the element of an inline
+        string, according to its type and style
+        """
+        if data_type == "n":
+            value = _cast_number(value)
+            if style_id in self.date_formats:
+                data_type = "d"
+                try:
+                    value = from_excel(
+                        value,
+                        self.epoch,
+                        timedelta=style_id in self.timedelta_formats,
+                    )
+                except (OverflowError, ValueError):
+                    msg = f"""Cell {coordinate} is marked as a date but the serial value {value} is outside the limits for dates. The cell will be treated as an error."""
+                    warn(msg)
+                    data_type = "e"
+                    value = "#VALUE!"
+        elif data_type == "s":
+            value = self.shared_strings[int(value)]
+        elif data_type == "b":
+            value = bool(int(value))
+        elif data_type == "str":
+            data_type = "s"
+        elif data_type == "d":
+            value = from_ISO8601(value)
         elif data_type == "inlineStr":
-            child = element.find(INLINE_STRING)
-            if child is not None:
-                data_type = "s"
-                if self.rich_text:
-                    value = parse_richtext_string(child)
-                else:
-                    value = Text.from_tree(child).content
-
-        return {
-            "row": row,
-            "column": column,
-            "value": value,
-            "data_type": data_type,
-            "style_id": style_id,
-        }
+            data_type = "s"
+            if self.rich_text:
+                value = parse_richtext_string(value)
+            else:
+                value = Text.from_tree(value).content
+        return value, data_type
+
+    def defer_cell(self, element, row, column):
+        """
+        Keep the text of a cell's value so that it is only converted when it
+        is used. Formulae other than those shared with an earlier cell are
+        converted straight away.
+        """
+        data_type = element.get("t", "n")
+        value = formula = inline_string = None
+        for child in element:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING:
+                inline_string = child
+
+        style_id = element.get("s", 0)
+        if style_id:
+            style_id = int(style_id)
+
+        if not self.data_only and formula is not None:
+            coordinate = element.get("r")
+            trans = self.shared_formulae.get(formula.get("si"))
+            if formula.get("t") != "shared" or trans is None or not coordinate:
+                return self.convert_cell(element, row, column)
+            offset = (trans, row - trans.row, column - trans.col)
+            raw = RawValue(self, None, "f", style_id, None, offset)
+            return row, column, raw, "f", style_id
+
+        if data_type == "inlineStr":
+            # the element is kept instead of the text
+            value = inline_string
+        if value is None or value == "":
+            return row, column, None, data_type, style_id
+        raw = RawValue(self, value, data_type, style_id, element.get("r"))
+        return row, column, raw, data_type, style_id
+
+    def skip_column(self, column):
+        """
+        Whether a column is outside the window or set of columns wanted
+        """
+        if self.columns is not None:
+            return column not in self.columns
+        if self.min_col and column < self.min_col:
+            return True
+        return bool(self.max_col and column > self.max_col)
 
-    def parse_formula(self, element):
+    def skip_cell(self, element):
+        """
+        Cells in columns which are not wanted are not converted but any shared
+        formula they define is still needed for the cells which use it
+        """
+        if self.data_only:
+            return
+        for child in element:
+            if child.tag == FORMULA_TAG and child.get("t") == "shared" and child.text:
+                self.parse_formula(element)
+
+    def parse_formula(self, element, row=None, column=None):
         """
         possible formulae types: shared, array, datatable
+
+        The row and column of the cell can be given if they are known, to save
+        working them out again for shared formulae
         """
         formula = element.find(FORMULA_TAG)
         formula_type = formula.get("t")
@@ -267,7 +520,12 @@ class WorkSheetParser:
             idx = formula.get("si")
             if idx in self.shared_formulae:
                 trans = self.shared_formulae[idx]
-                value = trans.translate_formula(coordinate)
+                if coordinate and row is not None:
+                    value = trans.translate_formula(
+                        row_delta=row - trans.row, col_delta=column - trans.col
+                    )
+                else:
+                    value = trans.translate_formula(coordinate)
             elif value != "=":
                 self.shared_formulae[idx] = Translator(value, coordinate)
 
@@ -282,18 +540,66 @@ class WorkSheetParser:
         attrs["index"] = column
         self.column_dimensions[column] = attrs
 
+    def accept_row(self, row):
+        """
+        Convert only the cells in the key columns and pass their values to
+        the predicate. The other cells of rows which are rejected are not
+        converted, but rows are still counted and any shared formulae they
+        define are kept.
+        """
+        previous = self.row_counter
+        if "r" in row.attrib:
+            self.parse_row_number(row.attrib["r"])
+        else:
+            self.row_counter += 1
+
+        keys = {column: idx for idx, column in enumerate(self.key_columns)}
+        values = [None] * len(keys)
+        counter = 0
+        # mismatches are reported when rows which are accepted are parsed
+        mismatches, self.mismatches = self.mismatches, []
+        # the predicate is passed values rather than deferred ones
+        lazy, self.lazy = self.lazy, False
+        try:
+            for element in row:
+                coordinate = element.get("r")
+                if coordinate:
+                    counter = coordinate_to_tuple(coordinate)[1]
+                else:
+                    counter += 1
+                idx = keys.get(counter)
+                if idx is not None:
+                    cell = self.convert(element, self.row_counter, counter)
+                    if cell is not None:
+                        values[idx] = cell[2]
+        finally:
+            self.mismatches = mismatches
+            self.lazy = lazy
+
+        if self.predicate(tuple(values)):
+            # the row is parsed in full from the start
+            self.row_counter = previous
+            return True
+
+        for element in row:
+            self.skip_cell(element)
+        return False
+
+    def parse_row_number(self, value):
+        try:
+            self.row_counter = int(value)
+        except ValueError:
+            val = float(value)
+            if val.is_integer():
+                self.row_counter = int(val)
+            else:
+                raise ValueError(f"{value} is not a valid row number")
+
     def parse_row(self, row):
         attrs = dict(row.attrib)
 
         if "r" in attrs:
-            try:
-                self.row_counter = int(attrs["r"])
-            except ValueError:
-                val = float(attrs["r"])
-                if val.is_integer():
-                    self.row_counter = int(val)
-                else:
-                    raise ValueError(f"{attrs['r']} is not a valid row number")
+            self.parse_row_number(attrs["r"])
         else:
             self.row_counter += 1
         self.col_counter = 0
@@ -304,6 +610,8 @@ class WorkSheetParser:
             self.row_dimensions[str(self.row_counter)] = attrs
 
         cells = [self.parse_cell(el) for el in row]
+        if self.min_col or self.max_col or self.columns is not None or self.schema:
+            cells = [cell for cell in cells if cell is not None]
         return self.row_counter, cells
 
     def parse_formatting(self, element):
@@ -352,7 +660,15 @@ class WorksheetReader:
     Create a parser and apply it to a workbook
     """
 
-    def __init__(self, ws, xml_source, shared_strings, data_only, rich_text):
+    def __init__(
+        self,
+        ws,
+        xml_source,
+        shared_strings,
+        data_only,
+        rich_text,
+        engine=None,
+    ):
         self.ws = ws
         self.parser = WorkSheetParser(
             xml_source,
@@ -362,22 +678,26 @@ class WorksheetReader:
             ws.parent._date_formats,
             ws.parent._timedelta_formats,
             rich_text,
+            engine,
         )
         self.tables = []
 
-    def bind_cells(self):
-        for idx, row in self.parser.parse():
-            for cell in row:
-                style = self.ws.parent._cell_styles[cell["style_id"]]
+    def bind_cells(self, rows=None):
+        cells = self.ws._cells
+        styles = self.ws.parent._cell_styles
+        if rows is None:
+            rows = self.parser.parse()
+        for idx, row in rows:
+            for row_idx, col_idx, value, data_type, style_id in row:
                 c = Cell(
                     self.ws,
-                    row=cell["row"],
-                    column=cell["column"],
-                    style_array=style,
+                    row=row_idx,
+                    column=col_idx,
+                    style_array=styles[style_id],
                 )
-                c._value = cell["value"]
-                c.data_type = cell["data_type"]
-                self.ws._cells[(cell["row"], cell["column"])] = c
+                c._value = value
+                c.data_type = data_type
+                cells[(row_idx, col_idx)] = c
 
         if self.ws._cells:
             self.ws._current_row = self.ws.max_row  # use cells not row dimensions
@@ -472,8 +792,8 @@ class WorksheetReader:
             if v is not None:
                 setattr(self.ws, k, v)
 
-    def bind_all(self):
-        self.bind_cells()
+    def bind_all(self, rows=None):
+        self.bind_cells(rows)
         self.bind_merged_cells()
         self.bind_hyperlinks()
         self.bind_formatting()
@@ -0,0 +1,202 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Checkpoints into a decompressed copy of a worksheet so that read-only
+worksheets can start parsing close to the rows wanted instead of at the
+beginning of the sheet.
+"""
+import re
+import threading
+from bisect import bisect_right
+from tempfile import TemporaryFile
+
+ROW_START = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?row[\s/>]")
+DATA_START = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?sheetData[\s/>]")
+CHUNK_SIZE = 1024 * 1024
+
+
+class SpillReader:
+    """
+    Copy everything read from a source into a spill file
+    """
+
+    def __init__(self, src, spill):
+        self.src = src
+        self.spill = spill
+
+    def read(self, size=-1):
+        data = self.src.read(size)
+        self.spill.write(data)
+        return data
+
+
+class ResumedReader:
+    """
+    Present the start of a worksheet followed by everything after a
+    checkpoint as a single stream. Readers of the same index share its
+    spill file, so each keeps its own position and holds the lock of the
+    index while it reads.
+    """
+
+    def __init__(self, header, spill, offset, lock):
+        self.header = header
+        self.spill = spill
+        self.pos = offset
+        self.lock = lock
+
+    def read(self, size=-1):
+        if self.header:
+            if size < 0:
+                size = len(self.header)
+            data, self.header = self.header[:size], self.header[size:]
+            return data
+        with self.lock:
+            self.spill.seek(self.pos)
+            data = self.spill.read(size)
+        self.pos += len(data)
+        return data
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Checkpoint:
+    """
+    Where a row starts in the decompressed worksheet and the state the
+    parser needs to carry on from there
+    """
+
+    __slots__ = ("row", "previous", "offset", "shared_formulae")
+
+    def __init__(self, row, previous, offset=None, shared_formulae=None):
+        self.row = row
+        self.previous = previous
+        self.offset = offset
+        self.shared_formulae = shared_formulae
+
+
+class RowIndex:
+    """
+    Built during the first full scan of a worksheet. A checkpoint is kept
+    every `step` rows.
+    """
+
+    def __init__(self, step=1000):
+        if step < 1:
+            raise ValueError("The step between checkpoints must be positive")
+        self.step = step
+        self.spill = None
+        self.header = None
+        self.checkpoints = []
+        self._pending = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self):
+        return self.header is not None
+
+    @property
+    def building(self):
+        return self._pending is not None
+
+    def start(self, src):
+        """
+        Start building the index from a worksheet source
+        """
+        self.close()
+        self.spill = TemporaryFile(prefix="openpyxl.")
+        self._pending = []
+        return SpillReader(src, self.spill)
+
+    def record(self, ordinal, parser, previous):
+        """
+        Remember the parser state after a row has been parsed
+        """
+        if ordinal and not ordinal % self.step:
+            cp = Checkpoint(
+                parser.row_counter,
+                previous,
+                shared_formulae=dict(parser.shared_formulae),
+            )
+            self._pending.append((ordinal, cp))
+
+    def finish(self, rows):
+        """
+        Find where each checkpoint starts once the source has been read in
+        full. The index is discarded if the rows cannot be matched to those
+        that were parsed.
+        """
+        header, offsets = self._scan()
+        if header is None or len(offsets) != rows:
+            self.close()
+            return
+        for ordinal, cp in self._pending:
+            cp.offset = offsets[ordinal]
+            self.checkpoints.append(cp)
+        self.header = header
+        self._pending = None
+
+    def _scan(self):
+        """
+        Return the source up to the start of the rows and the offset of
+        each row
+        """
+        spill = self.spill
+        spill.seek(0)
+        buf = b""
+        base = pos = 0
+        header = None
+        offsets = []
+        while True:
+            chunk = spill.read(CHUNK_SIZE)
+            buf += chunk
+            if header is None:
+                match = DATA_START.search(buf)
+                end = -1
+                if match is not None:
+                    end = buf.find(b">", match.start())
+                if end < 0:
+                    if not chunk:
+                        break
+                    continue
+                header = buf[: end + 1]
+                pos = end + 1
+
+            for match in ROW_START.finditer(buf, pos):
+                offsets.append(base + match.start())
+            if not chunk:
+                break
+
+            # the end of the buffer may hold the start of a tag
+            cut = max(len(buf) - 64, pos)
+            if offsets:
+                cut = max(cut, offsets[-1] - base + 1)
+            base += cut
+            buf = buf[cut:]
+            pos = 0
+        return header, offsets
+
+    def find(self, min_row):
+        """
+        Return the last checkpoint at or before a row
+        """
+        rows = [cp.row for cp in self.checkpoints]
+        idx = bisect_right(rows, min_row)
+        if idx:
+            return self.checkpoints[idx - 1]
+
+    def open(self, checkpoint):
+        return ResumedReader(self.header, self.spill, checkpoint.offset, self._lock)
+
+    def close(self):
+        if self.spill is not None:
+            self.spill.close()
+        self.spill = None
+        self.header = None
+        self.checkpoints = []
+        self._pending = None
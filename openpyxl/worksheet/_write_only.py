@@ -1,13 +1,50 @@
 # Copyright (c) 2010-2024 openpyxl
 """Write worksheets to xml representations in an optimized way"""
+import datetime
+from decimal import Decimal
 from inspect import isgenerator
 
 from ._writer import WorksheetWriter
 from .worksheet import Worksheet
 from openpyxl.cell import Cell
 from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell._writer import raw_bool
+from openpyxl.cell._writer import raw_date_writer
+from openpyxl.cell._writer import raw_float
+from openpyxl.cell._writer import raw_int
+from openpyxl.cell._writer import raw_number
+from openpyxl.cell._writer import raw_shared_string_writer
+from openpyxl.cell._writer import raw_string
+from openpyxl.cell.cell import get_time_format
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.exceptions import WorkbookAlreadySaved
 from openpyxl.workbook.child import _WorkbookChild
+from openpyxl.writer.strings import get_string_table
+
+# rows of markup written at once
+RAW_ROWS = 1000
+
+RAW_WRITERS = {
+    int: raw_int,
+    float: raw_float,
+    bool: raw_bool,
+    str: raw_string,
+    Decimal: raw_number,
+}
+DATE_TYPES = (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)
+NUMERIC_TYPES = (int, float, Decimal)
+
+
+def _is_type(value, typ):
+    """
+    Whether a value can be written in a column of the type given. Numbers
+    can be written in any numeric column but booleans only in their own.
+    """
+    if isinstance(value, bool):
+        return typ is bool
+    if typ in NUMERIC_TYPES:
+        return isinstance(value, NUMERIC_TYPES)
+    return isinstance(value, typ)
 
 
 class WriteOnlyWorksheet(_WorkbookChild):
@@ -21,6 +58,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
     __saved = False
     _writer = None
     _rows = None
+    _raw_writers = None
     _rel_type = Worksheet._rel_type
     _path = Worksheet._path
     mime_type = Worksheet.mime_type
@@ -60,13 +98,16 @@ class WriteOnlyWorksheet(_WorkbookChild):
             self._already_saved()
 
         with xf.element("sheetData"):
-            row_idx = 1
             try:
                 while True:
                     row = yield
-                    row = self._values_to_row(row, row_idx)
-                    self._writer.write_row(xf, row, row_idx)
-                    row_idx += 1
+                    if row.__class__ is bytes:
+                        # rows which have already been serialised
+                        self._writer.write_raw(xf, row)
+                        continue
+                    self._max_row += 1
+                    row = self._values_to_row(row, self._max_row)
+                    self._writer.write_row(xf, row, self._max_row)
             except GeneratorExit:
                 pass
 
@@ -74,6 +115,8 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
     def _get_writer(self):
         if self._writer is None:
+            # rows are written straight away so the table must exist
+            get_string_table(self.parent)
             self._writer = WorksheetWriter(self)
             self._writer.write_top()
 
@@ -110,6 +153,135 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
         self._rows.send(row)
 
+    def append_values(self, row, types=None):
+        """
+        Append a row of numbers, strings, booleans, dates or None.
+
+        See `append_many()`.
+
+        :param row: iterable containing values to append
+        :type row: iterable
+
+        :param types: types by column index (1-based)
+        :type types: dict
+        """
+        self.append_many((row,), types)
+
+    def append_many(self, rows, types=None):
+        """
+        Append rows of numbers, strings, booleans, dates or None. The markup
+        of each row is written directly instead of going through cells,
+        which is much faster and gives the same result as `append()`.
+
+        The type of each value is looked up unless its column is in `types`,
+        in which case all of its values must be of that type or None, or a
+        TypeError is raised. Rows containing other values, such as cells, are
+        passed to `append()`.
+
+        :param rows: iterable of rows of values to append
+        :type rows: iterable
+
+        :param types: types by column index (1-based)
+        :type types: dict
+        """
+        self._get_writer()
+
+        if self._rows is None:
+            self._rows = self._write_rows()
+            next(self._rows)
+
+        if self._raw_writers is None:
+            self._raw_writers = dict(RAW_WRITERS)
+            strings = get_string_table(self.parent)
+            if strings is not None:
+                self._raw_writers[str] = raw_shared_string_writer(strings)
+        writers = self._raw_writers
+        hints = {}
+        for column, typ in (types or {}).items():
+            writer = self._get_raw_writer(typ)
+            if writer is None:
+                raise ValueError(f"{typ!r} is not a valid column type")
+            hints[column - 1] = (typ, writer)
+        letters = []
+        dims = self.row_dimensions
+        chunk = []
+
+        try:
+            for row in rows:
+                if isgenerator(row) or isinstance(row, range):
+                    row = tuple(row)
+                elif not isinstance(row, (list, tuple)):
+                    self._invalid_row(row)
+                row_idx = self._max_row + 1
+                markup = None
+                # rows with dimensions are written as usual
+                if row_idx not in dims:
+                    markup = self._raw_row(row, row_idx, writers, hints, letters)
+                if markup is None:
+                    self._send_raw(chunk)
+                    self._rows.send(row)
+                    continue
+                chunk.append(markup)
+                self._max_row = row_idx
+                if len(chunk) >= RAW_ROWS:
+                    self._send_raw(chunk)
+        finally:
+            self._send_raw(chunk)
+
+    def _send_raw(self, chunk):
+        """
+        Send the markup of rows to the writer and empty the list
+        """
+        if chunk:
+            self._rows.send("".join(chunk).encode("ascii", "xmlcharrefreplace"))
+            chunk.clear()
+
+    def _get_raw_writer(self, typ):
+        """
+        Return the function for the markup of cells holding a type of value,
+        or None if there is none. Dates use the same style as cells holding
+        them, which is only added when it is first needed.
+        """
+        writer = self._raw_writers.get(typ)
+        if writer is None and typ in DATE_TYPES:
+            cell = WriteOnlyCell(self)
+            cell.number_format = get_time_format(typ)
+            wb = self.parent
+            writer = raw_date_writer(cell.style_id, wb.epoch, wb.iso_dates)
+            self._raw_writers[typ] = writer
+        return writer
+
+    def _raw_row(self, row, row_idx, writers, hints, letters):
+        """
+        Return the markup for a row, or None if it contains values which
+        must be converted to cells
+        """
+        while len(letters) < len(row):
+            letters.append(get_column_letter(len(letters) + 1))
+
+        parts = [f'<row r="{row_idx}">']
+        suffix = str(row_idx)
+        for idx, value in enumerate(row):
+            if value is None:
+                continue
+            hint = hints.get(idx)
+            if hint is not None:
+                typ, writer = hint
+                if value.__class__ is not typ and not _is_type(value, typ):
+                    raise TypeError(
+                        f"Row {row_idx} column {idx + 1} holds {value!r} "
+                        f"but its type is {typ.__name__}"
+                    )
+            else:
+                writer = writers.get(value.__class__)
+            if writer is None:
+                writer = self._get_raw_writer(value.__class__)
+                if writer is None:
+                    return
+            parts.append(writer(letters[idx] + suffix, value))
+        parts.append("</row>")
+        return "".join(parts)
+
     def _values_to_row(self, values, row_idx):
         """
         Convert whatever has been appended into a form suitable for work_rows
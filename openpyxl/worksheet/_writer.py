@@ -262,19 +262,36 @@ class WorksheetWriter:
             self.xf.send(tables.to_tree())
 
     def get_stream(self):
-        with xmlfile(self.out) as xf:
-            with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
-                try:
-                    while True:
-                        el = yield
-                        if el is True:
-                            yield xf
-                        elif el is None:  # et_xmlfile chokes
-                            continue
-                        else:
-                            xf.write(el)
-                except GeneratorExit:
-                    pass
+        # the file is opened here so that markup can also be written to it directly
+        stream = self.out
+        if not hasattr(stream, "write"):
+            stream = open(stream, "wb")
+        self._stream = stream
+        try:
+            with xmlfile(stream) as xf:
+                with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
+                    try:
+                        while True:
+                            el = yield
+                            if el is True:
+                                yield xf
+                            elif el is None:  # et_xmlfile chokes
+                                continue
+                            else:
+                                xf.write(el)
+                    except GeneratorExit:
+                        pass
+        finally:
+            if stream is not self.out:
+                stream.close()
+
+    def write_raw(self, xf, markup):
+        """
+        Write markup which has already been serialised, such as rows, in
+        place
+        """
+        xf.flush()
+        self._stream.write(markup)
 
     def write_tail(self):
         """
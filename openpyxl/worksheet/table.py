@@ -372,3 +372,7 @@ class TableList(dict):
 
     def items(self):
         return [(name, table.ref) for name, table in super().items()]
+
+    def __reduce__(self):
+        # items() does not return the tables
+        return self.__class__, (), None, None, iter(super().items())
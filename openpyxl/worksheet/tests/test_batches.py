@@ -0,0 +1,43 @@
+# Copyright (c) 2010-2024 openpyxl
+import datetime
+
+import pytest
+
+from .._batches import to_array
+
+
+@pytest.mark.numpy_required
+class TestToArray:
+    @pytest.mark.parametrize(
+        "values, dtype",
+        [
+            ([True, None, False], "bool"),
+            ([1, None, 3], "int64"),
+            ([1, 2.5, None], "float64"),
+            ([datetime.datetime(2020, 1, 1), None], "datetime64[us]"),
+            ([datetime.timedelta(hours=1), None], "timedelta64[us]"),
+            (["a", None, 1], "object"),
+            ([None, None], "float64"),
+        ],
+    )
+    def test_infer(self, values, dtype):
+        array = to_array(values)
+        assert array.dtype == dtype
+        assert array.mask.tolist() == [v is None for v in values]
+
+    def test_dtype(self):
+        array = to_array([1, None, 3.0], "int64")
+        assert array.dtype == "int64"
+        assert array.tolist() == [1, None, 3]
+
+    def test_dates(self):
+        array = to_array([datetime.date(2020, 1, 2)], "datetime64[D]")
+        assert str(array[0]) == "2020-01-02"
+
+    @pytest.mark.parametrize(
+        "value, dtype",
+        [(1.5, "int64"), ("1", "float64"), (True, "float64"), (1, "datetime64[us]")],
+    )
+    def test_mismatch(self, value, dtype):
+        with pytest.raises(ValueError):
+            to_array([None, value], dtype, column=2, first_row=5)
@@ -0,0 +1,140 @@
+# Copyright (c) 2010-2024 openpyxl
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+from openpyxl.reader.excel import load_workbook
+from openpyxl.worksheet.table import Table
+from openpyxl.worksheet.worksheet import Worksheet
+
+from .._lazy import LazyWorksheet
+
+
+@pytest.fixture
+def source(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "values"
+    for idx in range(10):
+        ws.append([idx, f"value {idx}"])
+
+    ws = wb.create_sheet("comments")
+    ws["A1"] = "commented"
+    ws["A1"].comment = Comment("A comment", "Author")
+    ws.print_area = "A1:B2"
+
+    ws = wb.create_sheet("table")
+    ws.append(["Name", "Value"])
+    ws.append(["a", 1])
+    ws.add_table(Table(displayName="Table1", ref="A1:B2"))
+
+    path = tmp_path / "source.xlsx"
+    wb.save(path)
+    return path
+
+
+class TestLazyWorksheet:
+    def test_load_workbook(self, source):
+        wb = load_workbook(source, lazy_sheets=True)
+        assert wb.sheetnames == ["values", "comments", "table"]
+        assert all(isinstance(ws, LazyWorksheet) for ws in wb._sheets)
+        wb.close()
+
+    def test_getitem(self, source):
+        wb = load_workbook(source, lazy_sheets=True)
+        ws = wb["comments"]
+        assert isinstance(ws, Worksheet)
+        assert ws["A1"].comment.text == "A comment"
+        assert ws.print_area == "'comments'!$A$1:$B$2"
+        assert wb._sheets[1] is ws
+        assert isinstance(wb._sheets[0], LazyWorksheet)
+        assert wb["comments"] is ws
+        wb.close()
+
+    def test_active(self, source):
+        wb = load_workbook(source, lazy_sheets=True)
+        ws = wb.active
+        assert ws.title == "values"
+        assert ws["B10"].value == "value 9"
+        wb.close()
+
+    def test_worksheets(self, source):
+        wb = load_workbook(source, lazy_sheets=True)
+        assert [ws.title for ws in wb.worksheets] == ["values", "comments", "table"]
+        assert not any(isinstance(ws, LazyWorksheet) for ws in wb._sheets)
+        wb.close()
+
+    def test_can_copy(self, source):
+        wb = load_workbook(source, lazy_sheets=True)
+        assert [ws.can_copy() for ws in wb._sheets] == [True, True, False]
+        wb.close()
+
+    def test_save_untouched(self, source, tmp_path):
+        wb = load_workbook(source, lazy_sheets=True)
+        wb["values"]["A1"] = "changed"
+        out = tmp_path / "out.xlsx"
+        wb.save(out)
+        wb.close()
+
+        with ZipFile(source) as src, ZipFile(out) as dst:
+            assert dst.read("xl/worksheets/sheet2.xml") == src.read(
+                "xl/worksheets/sheet2.xml"
+            )
+
+        wb = load_workbook(out)
+        assert wb["values"]["A1"].value == "changed"
+        ws = wb["comments"]
+        assert ws["A1"].value == "commented"
+        assert ws["A1"].comment.text == "A comment"
+        assert ws.print_area == "'comments'!$A$1:$B$2"
+        assert list(wb["table"].tables) == ["Table1"]
+
+    def test_save_unknown_extension(self, source, tmp_path):
+        from openpyxl.packaging.manifest import mimetypes
+        from openpyxl.xml.constants import PKG_REL_NS
+        from openpyxl.xml.constants import REL_NS
+
+        # a part whose content type is only given by extension
+        path = tmp_path / "unknown.xlsx"
+        with ZipFile(source) as src, ZipFile(path, "w") as dst:
+            for name in src.namelist():
+                data = src.read(name)
+                if name == "[Content_Types].xml":
+                    data = data.replace(
+                        b"<Default",
+                        b'<Default Extension="foo" ContentType="application/x-foo"/>'
+                        b"<Default",
+                        1,
+                    )
+                dst.writestr(name, data)
+            dst.writestr(
+                "xl/worksheets/_rels/sheet1.xml.rels",
+                f'<Relationships xmlns="{PKG_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{REL_NS}/image" Target="/xl/extra.foo"/>'
+                "</Relationships>",
+            )
+            dst.writestr("xl/extra.foo", b"foo")
+
+        wb = load_workbook(path, lazy_sheets=True)
+        out = tmp_path / "out.xlsx"
+        wb.save(out)
+        wb.close()
+
+        assert ".foo" not in mimetypes.types_map[True]
+        with ZipFile(out) as dst:
+            assert dst.read("xl/extra.foo") == b"foo"
+            types = dst.read("[Content_Types].xml")
+        assert types.count(b'Extension="foo"') == 1
+        assert b'<Default Extension="foo" ContentType="application/x-foo"' in types
+
+    def test_save_over_source(self, source):
+        wb = load_workbook(source, lazy_sheets=True)
+        wb["values"]["A1"] = "changed"
+        wb.save(source)
+        wb.close()
+
+        wb = load_workbook(source)
+        assert wb["values"]["A1"].value == "changed"
+        assert wb["comments"]["A1"].comment.text == "A comment"
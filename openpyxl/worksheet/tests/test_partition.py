@@ -0,0 +1,64 @@
+# Copyright (c) 2010-2024 openpyxl
+import pytest
+
+from .._partition import split_rows
+
+
+def make_sheet(rows):
+    return (
+        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        b'<dimension ref="A1:B10"/><sheetData>' + rows + b"</sheetData>"
+        b'<mergeCells count="0"/></worksheet>'
+    )
+
+
+class TestSplitRows:
+    def test_partitions(self):
+        rows = b"".join(
+            b'<row r="%d"><c r="A%d"><v>1</v></c></row>' % (i, i) for i in range(1, 11)
+        )
+        data = make_sheet(rows)
+        header, footer, partitions = split_rows(data, 3)
+        assert header.endswith(b"<sheetData>")
+        assert footer.startswith(b"</sheetData>")
+        numbers = [p.row for p in partitions]
+        assert len(numbers) == 3
+        assert numbers[0] == 1
+        assert numbers == sorted(numbers)
+        assert b"".join(data[p.start : p.end] for p in partitions) == rows
+
+    def test_unnumbered_rows(self):
+        rows = b'<row r="1"/>' + b"<row/>" * 9
+        header, footer, partitions = split_rows(make_sheet(rows), 3)
+        assert [p.row for p in partitions] == [1]
+
+    @pytest.mark.parametrize("sheet_data", [b"<sheetData></sheetData>", b"<sheetData/>"])
+    def test_no_rows(self, sheet_data):
+        data = make_sheet(b"").replace(b"<sheetData></sheetData>", sheet_data)
+        header, footer, partitions = split_rows(data, 3)
+        assert partitions == []
+
+    def test_shared_formulae(self):
+        rows = (
+            b'<row r="1"><c r="B1"><f t="shared" ref="B1:B4" si="0">A1&amp;"x"</f></c></row>'
+            b'<row r="2"><c r="B2"><f t="shared" si="0"/></c></row>'
+            b'<row r="3"><c r="B3"><f t="shared" ref="B3:B4" si="1">A3</f></c></row>'
+            b'<row r="4"><c r="B4"><f t="shared" si="0"/></c></row>'
+        )
+        header, footer, partitions = split_rows(make_sheet(rows), 4)
+        assert [sorted(p.shared_formulae) for p in partitions] == [
+            [],
+            ["0"],
+            ["0"],
+            ["0", "1"],
+        ]
+        trans = partitions[1].shared_formulae["0"]
+        assert trans.translate_formula("B2") == '=A2&"x"'
+
+    def test_shared_formula_without_reference(self):
+        rows = (
+            b'<row r="1"><c><f t="shared" ref="A1:A2" si="0">1</f></c></row>'
+            b'<row r="2"><c><f t="shared" si="0"/></c></row>'
+        )
+        header, footer, partitions = split_rows(make_sheet(rows), 2)
+        assert len(partitions) == 1
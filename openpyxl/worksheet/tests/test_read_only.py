@@ -6,6 +6,7 @@ from zipfile import ZipFile
 import pytest
 
 from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.cell.read_only import RawValue
 from openpyxl.cell.read_only import ReadOnlyCell
 from openpyxl.reader.excel import load_workbook
 from openpyxl.styles.styleable import StyleArray
@@ -72,31 +73,31 @@ class TestReadOnlyWorksheet:
         assert cell is EMPTY_CELL
 
     def test_empty_cell(self, ReadOnlyWorksheet):
-        row = [{"column": 4, "value": None, "row": 1}]
+        row = [(1, 4, None, "n", 0)]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, max_col=4, values_only=True)
         assert cells == (None, None, None, None)
 
     def test_pad_row_left(self, ReadOnlyWorksheet):
-        row = [{"column": 4, "value": 4}, {"column": 8, "value": 8}]
+        row = [(1, 4, 4, "n", 0), (1, 8, 8, "n", 0)]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, max_col=4, values_only=True)
         assert cells == (None, None, None, 4)
 
     def test_pad_row(self, ReadOnlyWorksheet):
-        row = [{"column": 4, "value": 4}, {"column": 8, "value": 8}]
+        row = [(1, 4, 4, "n", 0), (1, 8, 8, "n", 0)]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=4, max_col=8, values_only=True)
         assert cells == (4, None, None, None, 8)
 
     def test_pad_row_right(self, ReadOnlyWorksheet):
-        row = [{"column": 4, "value": 4}, {"column": 8, "value": 8}]
+        row = [(1, 4, 4, "n", 0), (1, 8, 8, "n", 0)]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=6, max_col=10, values_only=True)
         assert cells == (None, None, 8, None, None)
 
     def test_pad_row_cells(self, ReadOnlyWorksheet):
-        row = [{"column": 4, "value": 4, "row": 2}, {"column": 8, "value": 8, "row": 2}]
+        row = [(2, 4, 4, "n", 0), (2, 8, 8, "n", 0)]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=6, max_col=10)
         assert cells == (
@@ -171,6 +172,60 @@ class TestReadOnlyWorksheet:
         )
         assert list(rows) == [(None, None, None), (None, None, None), (7, 8, 9)]
 
+    def test_iter_rows_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(min_row=2, max_row=4, columns=[3, 1], values_only=True)
+        assert list(rows) == [(3, 1), (6, 4), (9, 7)]
+
+    def test_iter_rows_columns_cells(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(min_row=4, max_row=5, columns=[2, 5])
+        assert list(rows) == [
+            (ReadOnlyCell(ws, 4, 2, 8, "n", 0), EMPTY_CELL),
+            (EMPTY_CELL, EMPTY_CELL),
+        ]
+
+    def test_iter_rows_no_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(min_row=2, max_row=3, columns=[], values_only=True)
+        assert list(rows) == [(), ()]
+
+    def test_iter_rows_duplicate_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            ws.iter_rows(columns=[1, 1])
+
+    def test_row_index(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        ws.enable_row_index(step=2)
+        expected = list(ws.values)
+        index = ws._row_index
+        assert index.built
+        assert [cp.row for cp in index.checkpoints] == [3, 10]
+
+        def source():
+            raise AssertionError("The archive should not be read")
+
+        ws._get_source = source
+        assert ws.cell(row=10, column=2).value == 8
+        assert list(ws.iter_rows(min_row=4, values_only=True)) == expected[3:]
+
+    def test_row_index_incomplete_scan(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        ws.enable_row_index(step=2)
+        rows = ws.iter_rows()
+        next(rows)
+        rows.close()
+        assert not ws._row_index.built
+        assert not ws._row_index.building
+
+    def test_disable_row_index(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        ws.enable_row_index(step=2)
+        list(ws.values)
+        ws.disable_row_index()
+        assert ws._row_index is None
+
     def test_calculate_dimension(self, ReadOnlyWorksheet):
         ws = ReadOnlyWorksheet
         assert ws.calculate_dimension(True) == "A1:C10"
@@ -209,6 +264,221 @@ class TestReadOnlyWorksheet:
 
         assert src.closed
 
+    def test_iter_rows_predicate(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(
+            predicate=lambda values: values[0] == 7, key_columns=[1], values_only=True
+        )
+        assert list(rows) == [(7, 8, 9), (7, 8, 9)]
+
+    def test_iter_rows_predicate_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(
+            max_row=9,
+            columns=[3],
+            predicate=lambda values: values == (8, 7),
+            key_columns=[2, 1],
+        )
+        assert list(rows) == [(ReadOnlyCell(ws, 4, 3, 9, "n", 0),)]
+
+    def test_iter_rows_predicate_without_keys(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            ws.iter_rows(predicate=bool)
+
+    def test_iter_rows_schema(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        errors = []
+        rows = ws.iter_rows(
+            max_row=3,
+            schema={1: int, 2: float, 3: None},
+            errors=errors,
+            values_only=True,
+        )
+        assert list(rows) == [(None, None), (1, 2.0), (4, 5.0)]
+        assert errors == [(1, 1, "col1"), (1, 2, "col2")]
+
+    def test_iter_rows_lazy(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = list(ws.iter_rows(lazy=True))
+        cell = rows[1][0]
+        assert cell._value.__class__ is RawValue
+        assert cell.value == 1
+        assert cell._value == 1
+        assert rows == list(ws.iter_rows())
+
+    def test_iter_rows_lazy_shared_formulae(self, DummyWorkbook, ReadOnlyWorksheet):
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1"><c r="A1"><v>1</v></c><c r="B1"><f t="shared" ref="B1:B3" si="0">A1*2</f><v>2</v></c></row>
+          <row r="2"><c r="A2"><v>2</v></c><c r="B2"><f t="shared" si="0"/><v>4</v></c></row>
+          <row r="3"><c r="A3" t="str"><v>x</v></c><c r="B3"><f t="shared" si="0"/></c></row>
+        </sheetData>
+        </worksheet>
+        """
+        DummyWorkbook._archive.writestr("sheet2.xml", src)
+        ws = ReadOnlyWorksheet
+        ws._worksheet_path = "sheet2.xml"
+        ws.reset_dimensions()
+        rows = list(ws.iter_rows(lazy=True))
+        assert rows[2][1].data_type == "f"
+        assert rows[2][1].value == "=A3*2"
+        assert rows == list(ws.iter_rows())
+
+    def test_iter_rows_lazy_predicate(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(
+            predicate=lambda values: values[0] == 7, key_columns=[1], lazy=True
+        )
+        assert [[c.value for c in row] for row in rows] == [[7, 8, 9], [7, 8, 9]]
+
+    @pytest.mark.numpy_required
+    def test_iter_batches(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        batches = list(ws.iter_batches(batch_rows=4, columns=[1, 3]))
+        assert [len(b[1]) for b in batches] == [4, 4, 2]
+        first, empty, last = batches
+        assert first[1].dtype == object
+        assert list(first[1]) == ["col1", 1, 4, 7]
+        assert empty[3].mask.all()
+        assert last[3].dtype == "int64"
+        assert last[3].tolist() == [None, 9]
+
+    @pytest.mark.numpy_required
+    def test_iter_batches_dtypes(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        batches = list(ws.iter_batches(columns=[2], dtypes={2: "float64"}, min_row=2))
+        assert len(batches) == 1
+        values = batches[0][2]
+        assert values.dtype == "float64"
+        assert values.compressed().tolist() == [2.0, 5.0, 8.0, 8.0]
+
+    @pytest.mark.numpy_required
+    def test_iter_batches_mismatch(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            list(ws.iter_batches(columns=[2], dtypes={2: "int64"}))
+
+    @pytest.mark.numpy_required
+    def test_iter_batches_dates(self, DummyWorkbook, ReadOnlyWorksheet):
+        from openpyxl.utils.datetime import WINDOWS_EPOCH
+
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1"><c r="A1" s="1"><v>60</v></c><c r="B1" s="1"><v>0.5</v></c><c r="C1" s="2"><v>1.5</v></c></row>
+          <row r="3"><c r="A3" s="1"><v>61.25</v></c><c r="B3"><v>2</v></c><c r="C3" s="2"><v>0.25</v></c></row>
+        </sheetData>
+        </worksheet>
+        """
+        DummyWorkbook._archive.writestr("sheet2.xml", src)
+        DummyWorkbook.epoch = WINDOWS_EPOCH
+        DummyWorkbook._date_formats = {1, 2}
+        DummyWorkbook._timedelta_formats = {2}
+        ws = ReadOnlyWorksheet
+        ws._worksheet_path = "sheet2.xml"
+        (batch,) = ws.iter_batches(columns=[1, 2, 3])
+        assert batch[1].dtype == "datetime64[us]"
+        assert batch[1].tolist() == [
+            datetime.datetime(1900, 2, 28),
+            None,
+            datetime.datetime(1900, 3, 1, 6),
+        ]
+        assert batch[2].dtype == object
+        assert batch[2].tolist() == [datetime.time(12), None, 2]
+        assert batch[3].dtype == "timedelta64[us]"
+        assert batch[3].tolist() == [
+            datetime.timedelta(hours=36),
+            None,
+            datetime.timedelta(hours=6),
+        ]
+
+    def test_iter_batches_duplicate_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            ws.iter_batches(columns=[1, 1])
+
+    def test_iter_batches_no_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            ws.iter_batches(columns=[])
+
+    @pytest.mark.parametrize(
+        "window",
+        [{}, {"min_row": 4, "max_row": 8}, {"min_col": 2, "max_col": 2}, {"max_row": 12}],
+    )
+    def test_parallel_map(self, ReadOnlyWorksheet, window):
+        ws = ReadOnlyWorksheet
+        expected = [tuple(row) for row in ws.iter_rows(values_only=True, **window)]
+        assert list(ws.parallel_map(tuple, workers=2, **window)) == expected
+
+    @pytest.mark.parametrize("batch_rows", [1, 3, 1000])
+    def test_aiter_rows(self, ReadOnlyWorksheet, batch_rows):
+        import asyncio
+
+        ws = ReadOnlyWorksheet
+        expected = list(ws.iter_rows(min_row=2, values_only=True))
+
+        async def read():
+            return [
+                row
+                async for row in ws.aiter_rows(
+                    batch_rows=batch_rows, maxsize=1, min_row=2, values_only=True
+                )
+            ]
+
+        assert asyncio.run(read()) == expected
+
+    def test_aiter_rows_stop(self, ReadOnlyWorksheet):
+        import asyncio
+        import threading
+
+        ws = ReadOnlyWorksheet
+
+        async def read():
+            rows = ws.aiter_rows(batch_rows=1, maxsize=1, values_only=True)
+            async for row in rows:
+                break
+            await rows.aclose()
+            return row
+
+        assert asyncio.run(read()) == ("col1", "col2", "col3")
+        assert not any(t.name == "openpyxl-aiter-rows" for t in threading.enumerate())
+
+    def test_aiter_rows_error(self, ReadOnlyWorksheet):
+        import asyncio
+
+        ws = ReadOnlyWorksheet
+
+        def fail(values):
+            raise KeyError(values)
+
+        async def read():
+            return [row async for row in ws.aiter_rows(predicate=fail, key_columns=[1])]
+
+        with pytest.raises(KeyError):
+            asyncio.run(read())
+
+    def test_parallel_map_shared_formulae(self, DummyWorkbook, ReadOnlyWorksheet):
+        rows = "".join(
+            f'<row r="{idx}"><c r="A{idx}"><v>{idx}</v></c>'
+            f'<c r="B{idx}"><f t="shared" si="0"/></c></row>'
+            for idx in range(2, 200)
+        )
+        src = f"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1"><c r="A1"><v>1</v></c><c r="B1"><f t="shared" ref="B1:B199" si="0">A1&amp;"x"</f></c></row>
+          {rows}
+        </sheetData>
+        </worksheet>
+        """
+        DummyWorkbook._archive.writestr("sheet2.xml", src)
+        ws = ReadOnlyWorksheet
+        ws._worksheet_path = "sheet2.xml"
+        ws.reset_dimensions()
+        values = list(ws.parallel_map(tuple, workers=2))
+        assert values == list(ws.values)
+        assert values[-1] == (199, '=A199&"x"')
+
 
 def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
     from ..worksheet import Worksheet
@@ -256,7 +526,9 @@ def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
 
     ro = ReadOnlyWorksheet
     ro_attrs = set(ro.__dict__)
-    ro_only = set(["_worksheet_path", "parent", "title", "_shared_strings"])
+    ro_only = set(
+        ["_worksheet_path", "parent", "title", "_shared_strings", "_engine", "_cache"]
+    )
     assert std_attrs > std_only
     assert ro_attrs > ro_only
     assert not ro_attrs - ro_only - std_attrs
@@ -271,3 +543,15 @@ def test_read_datetime(datadir):
     ws = wb.active
     assert type(ws["A1"].value) == datetime.timedelta
     assert type(ws["A2"].value) == datetime.datetime
+
+
+def test_read_datetime_lazy(datadir):
+    datadir.chdir()
+    wb = load_workbook("test_datetime.xlsx", read_only=True)
+    ws = wb.active
+    rows = list(ws.iter_rows(lazy=True))
+    assert [c.is_date for row in rows for c in row] == [
+        c.is_date for row in ws.iter_rows() for c in row
+    ]
+    assert rows == list(ws.iter_rows())
+    assert type(rows[1][0].value) == datetime.datetime
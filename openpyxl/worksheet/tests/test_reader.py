@@ -266,13 +266,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "f",
-            "row": 1,
-            "style_id": 0,
-            "value": '=IF(TRUE, "y", "n")',
-        }
+        assert cell == (1, 1, '=IF(TRUE, "y", "n")', "f", 0)
 
     def test_formula_data_only(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -287,13 +281,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "n",
-            "row": 1,
-            "style_id": 0,
-            "value": 3,
-        }
+        assert cell == (1, 1, 3, "n", 0)
 
     def test_string_formula_data_only(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -308,13 +296,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "s",
-            "row": 1,
-            "style_id": 0,
-            "value": "y",
-        }
+        assert cell == (1, 1, "y", "s", 0)
 
     def test_number(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -327,13 +309,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "n",
-            "row": 1,
-            "style_id": 0,
-            "value": 1,
-        }
+        assert cell == (1, 1, 1, "n", 0)
 
     def test_datetime(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -346,13 +322,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "d",
-            "row": 1,
-            "style_id": 0,
-            "value": datetime.datetime(2011, 12, 25, 14, 23, 55),
-        }
+        assert cell == (1, 1, datetime.datetime(2011, 12, 25, 14, 23, 55), "d", 0)
 
     def test_timedelta(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -365,13 +335,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "d",
-            "row": 1,
-            "style_id": 30,
-            "value": datetime.timedelta(days=1, hours=6),
-        }
+        assert cell == (1, 1, datetime.timedelta(days=1, hours=6), "d", 30)
 
     def test_mac_date(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -385,13 +349,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "d",
-            "row": 1,
-            "style_id": 29,
-            "value": datetime.datetime(2016, 10, 3, 0, 0),
-        }
+        assert cell == (1, 1, datetime.datetime(2016, 10, 3, 0, 0), "d", 29)
 
     @pytest.mark.parametrize("value", [-693595, 2958466])
     def test_out_of_range_datetime(self, WorkSheetParser, recwarn, value):
@@ -418,13 +376,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "s",
-            "row": 1,
-            "style_id": 0,
-            "value": "a",
-        }
+        assert cell == (1, 1, "a", "s", 0)
 
     def test_boolean(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -437,13 +389,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "b",
-            "row": 1,
-            "style_id": 0,
-            "value": True,
-        }
+        assert cell == (1, 1, True, "b", 0)
 
     def test_inline_string(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -458,13 +404,7 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {
-            "column": 1,
-            "data_type": "s",
-            "row": 1,
-            "style_id": 0,
-            "value": "ID",
-        }
+        assert cell == (1, 1, "ID", "s", 0)
 
     def test_inline_richtext(self, WorkSheetParser):
         parser = WorkSheetParser
@@ -490,13 +430,7 @@ class TestWorksheetParser:
                 text="11 de September de 2014",
             )
         )
-        assert cell == {
-            "column": 18,
-            "data_type": "s",
-            "row": 2,
-            "style_id": 4,
-            "value": expected,
-        }
+        assert cell == (2, 18, expected, "s", 4)
 
     def test_parse_richtext(self):
         from .._reader import parse_richtext_string
@@ -659,6 +593,169 @@ class TestWorksheetParser:
         assert parser.row_counter == 1
         assert parser.col_counter == 5
 
+    def test_row_with_column_window(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.min_col = 2
+        parser.max_col = 3
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1" t="s"><v>99</v></c>
+          <c><v>2</v></c>
+          <c r="C1"><v>3</v></c>
+          <c r="D1" t="s"><v>99</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        max_row, cells = parser.parse_row(element)
+        assert cells == [(1, 2, 2, "n", 0), (1, 3, 3, "n", 0)]
+
+    def test_row_with_columns(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = {1, 3}
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1"><v>1</v></c>
+          <c r="B1" t="s"><v>99</v></c>
+          <c r="C1"><v>3</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        max_row, cells = parser.parse_row(element)
+        assert cells == [(1, 1, 1, "n", 0), (1, 3, 3, "n", 0)]
+
+    def test_row_with_no_columns(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = set()
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1"><v>1</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        max_row, cells = parser.parse_row(element)
+        assert cells == []
+
+    def test_skipped_shared_formula(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = {2}
+        src = """
+        <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <row r="1">
+            <c r="A1"><f t="shared" ref="A1:B1" si="0">C1*2</f><v>2</v></c>
+            <c r="B1"><f t="shared" si="0" /><v>4</v></c>
+          </row>
+        </sheetData>
+        """
+        element = fromstring(src)
+        max_row, cells = parser.parse_row(element[0])
+        assert cells == [(1, 2, "=D1*2", "f", 0)]
+
+    def test_accept_row(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.predicate = lambda values: values == ("a",)
+        parser.key_columns = (2,)
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1" t="s"><v>99</v></c>
+          <c r="B1" t="s"><v>0</v></c>
+        </row>
+        """
+        assert parser.accept_row(fromstring(src))
+
+    def test_reject_row(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.predicate = lambda values: values == (None, 5)
+        parser.key_columns = (4, 2)
+        src = """
+        <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <row r="3">
+            <c r="A3" t="s"><v>99</v></c>
+            <c r="B3"><f t="shared" ref="B3:B4" si="0">A3*2</f><v>4</v></c>
+          </row>
+        </sheetData>
+        """
+        # the string in A3 would be out of range if it were converted
+        assert not parser.accept_row(fromstring(src)[0])
+        assert parser.row_counter == 3
+        assert "0" in parser.shared_formulae
+
+    def test_parse_with_predicate(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.predicate = lambda values: values[0] > 1
+        parser.key_columns = (1,)
+        parser.source = BytesIO(
+            b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+            <sheetData>
+              <row><c><v>1</v></c><c t="s"><v>99</v></c></row>
+              <row><c><v>2</v></c><c t="s"><v>0</v></c></row>
+            </sheetData>
+            </worksheet>"""
+        )
+        assert list(parser.parse()) == [(2, [(2, 1, 2, "n", 0), (2, 2, "a", "s", 0)])]
+
+    def test_schema(self, WorkSheetParser):
+        from .._reader import compile_schema
+
+        parser = WorkSheetParser
+        parser.schema = compile_schema(
+            {1: int, 2: "float", 3: str, 4: datetime.date, 5: bool, 6: None}
+        )
+        parser.mismatches = []
+        src = """
+        <row r="2" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A2"><v>3.0</v></c>
+          <c r="B2"><v>3</v></c>
+          <c r="C2" t="s"><v>0</v></c>
+          <c r="D2"><v>43831</v></c>
+          <c r="E2" t="b"><v>1</v></c>
+          <c r="F2" t="s"><v>99</v></c>
+        </row>
+        """
+        max_row, cells = parser.parse_row(fromstring(src))
+        assert cells == [
+            (2, 1, 3, "n", 0),
+            (2, 2, 3.0, "n", 0),
+            (2, 3, "a", "s", 0),
+            (2, 4, datetime.date(2020, 1, 1), "d", 0),
+            (2, 5, True, "b", 0),
+        ]
+        assert parser.mismatches == []
+
+    def test_schema_mismatch(self, WorkSheetParser):
+        from .._reader import compile_schema
+
+        parser = WorkSheetParser
+        parser.schema = compile_schema({1: int, 2: datetime.datetime})
+        parser.mismatches = []
+        src = """
+        <row r="2" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A2"><v>3.5</v></c>
+          <c r="B2" t="str"><v>soon</v></c>
+        </row>
+        """
+        max_row, cells = parser.parse_row(fromstring(src))
+        assert cells == [(2, 1, None, "n", 0), (2, 2, None, "str", 0)]
+        assert parser.mismatches == [(2, 1, "3.5"), (2, 2, "soon")]
+
+    def test_schema_mismatch_raises(self, WorkSheetParser):
+        from .._reader import compile_schema
+
+        parser = WorkSheetParser
+        parser.schema = compile_schema({1: bool})
+        src = """
+        <row r="2" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A2"><v>3</v></c>
+        </row>
+        """
+        with pytest.raises(ValueError):
+            parser.parse_row(fromstring(src))
+
+    def test_invalid_schema(self):
+        from .._reader import compile_schema
+
+        with pytest.raises(ValueError):
+            compile_schema({1: list})
+
     def test_row_and_cell_without_coordinates(self, WorkSheetParser):
         parser = WorkSheetParser
         src = """
@@ -677,9 +774,9 @@ class TestWorksheetParser:
         element = fromstring(src)
         max_row, cells = parser.parse_row(element)
         expected = [
-            {"column": 1, "row": 1, "data_type": "n", "value": 2, "style_id": 0},
-            {"column": 2, "row": 1, "data_type": "n", "value": 4, "style_id": 0},
-            {"column": 3, "row": 1, "data_type": "n", "value": 3, "style_id": 0},
+            (1, 1, 2, "n", 0),
+            (1, 2, 4, "n", 0),
+            (1, 3, 3, "n", 0),
         ]
         for expected_cell, cell in zip(expected, cells):
             assert expected_cell == cell
@@ -705,10 +802,10 @@ class TestWorksheetParser:
         element = fromstring(src)
         _, cells = parser.parse_row(element)
         expected = [
-            {"column": 1, "row": 1, "data_type": "n", "value": 1, "style_id": 0},
-            {"column": 4, "row": 1, "data_type": "n", "value": 2, "style_id": 0},
-            {"column": 5, "row": 1, "data_type": "n", "value": 3, "style_id": 0},
-            {"column": 7, "row": 1, "data_type": "n", "value": 4, "style_id": 0},
+            (1, 1, 1, "n", 0),
+            (1, 4, 2, "n", 0),
+            (1, 5, 3, "n", 0),
+            (1, 7, 4, "n", 0),
         ]
         assert len(cells) == len(expected)
         for expected_cell, cell in zip(expected, cells):
@@ -727,7 +824,7 @@ class TestWorksheetParser:
         parser.parse_row(element)
         max_row, cells = parser.parse_row(element)
         expected = [
-            {"column": 1, "row": 2, "data_type": "n", "value": 2, "style_id": 0},
+            (2, 1, 2, "n", 0),
         ]
         for expected_cell, cell in zip(expected, cells):
             assert expected_cell == cell
@@ -937,6 +1034,18 @@ class TestWorksheetParser:
         parser.parse_legacy(element)
         assert parser.legacy_drawing == "rId3"
 
+    @pytest.mark.parametrize("engine", ["lxml", "etree"])
+    def test_engines(self, WorkSheetParser, datadir, engine):
+        datadir.chdir()
+        parser = WorkSheetParser
+        parser.engine = engine
+        parser.shared_strings = ["a"] * 30
+        parser.source = "complex-styles-worksheet.xml"
+        rows = list(parser.parse())
+        assert len(rows) == 26
+        assert rows[0][0] == 1
+        assert set(parser.column_dimensions) == set(["A", "C", "E", "I", "G"])
+
     def test_custom_views_breaks(self, WorkSheetParser):
         src = b"""
         <sheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
@@ -0,0 +1,121 @@
+# Copyright (c) 2010-2024 openpyxl
+from io import BytesIO
+
+import pytest
+
+from openpyxl.xml.constants import SHEET_MAIN_NS
+
+
+def make_sheet(rows, prefix=""):
+    tag = f"{prefix}:" if prefix else ""
+    ns = f"xmlns:{prefix}" if prefix else "xmlns"
+    body = "".join(
+        f'<{tag}row r="{idx}"><{tag}c r="A{idx}"><{tag}v>{idx}</{tag}v></{tag}c></{tag}row>'
+        for idx in range(1, rows + 1)
+    )
+    xml = f'<{tag}worksheet {ns}="{SHEET_MAIN_NS}"><{tag}sheetData>{body}</{tag}sheetData></{tag}worksheet>'
+    return xml.encode()
+
+
+@pytest.fixture
+def RowIndex():
+    from .._row_index import RowIndex
+
+    return RowIndex
+
+
+class DummyParser:
+
+    row_counter = 0
+    shared_formulae = {}
+
+
+def build(RowIndex, src, rows, step):
+    index = RowIndex(step)
+    reader = index.start(BytesIO(src))
+    while reader.read(7):
+        pass
+    parser = DummyParser()
+    previous = 0
+    for ordinal in range(rows):
+        parser.row_counter = ordinal + 1
+        index.record(ordinal, parser, previous)
+        previous = ordinal + 1
+    index.finish(rows)
+    return index
+
+
+class TestRowIndex:
+
+    def test_invalid_step(self, RowIndex):
+        with pytest.raises(ValueError):
+            RowIndex(0)
+
+    @pytest.mark.parametrize("prefix", ["", "x"])
+    def test_checkpoints(self, RowIndex, prefix):
+        src = make_sheet(10, prefix)
+        index = build(RowIndex, src, 10, 3)
+        assert index.built
+        assert [(cp.row, cp.previous) for cp in index.checkpoints] == [
+            (4, 3),
+            (7, 6),
+            (10, 9),
+        ]
+        tag = f"<{prefix}:row" if prefix else "<row"
+        for cp in index.checkpoints:
+            assert src[cp.offset :].startswith(tag.encode())
+
+    def test_split_chunks(self, RowIndex, monkeypatch):
+        from .. import _row_index
+
+        monkeypatch.setattr(_row_index, "CHUNK_SIZE", 5)
+        src = make_sheet(10)
+        index = build(RowIndex, src, 10, 1)
+        offsets = [cp.offset for cp in index.checkpoints]
+        assert offsets == [src.index(f'<row r="{idx}"'.encode()) for idx in range(2, 11)]
+
+    def test_mismatch(self, RowIndex):
+        index = build(RowIndex, make_sheet(10), 9, 3)
+        assert not index.built
+        assert index.spill is None
+
+    def test_find(self, RowIndex):
+        index = build(RowIndex, make_sheet(10), 10, 3)
+        assert index.find(3) is None
+        assert index.find(4).row == 4
+        assert index.find(9).row == 7
+        assert index.find(100).row == 10
+
+    def test_open(self, RowIndex):
+        src = make_sheet(10)
+        index = build(RowIndex, src, 10, 5)
+        reader = index.open(index.find(6))
+        out = b""
+        while True:
+            data = reader.read(11)
+            if not data:
+                break
+            out += data
+        assert out.startswith(src[: src.index(b"<row")])
+        assert out.endswith(src[src.index(b'<row r="6"') :])
+
+    def test_interleaved(self, RowIndex):
+        src = make_sheet(10)
+        index = build(RowIndex, src, 10, 3)
+        first, second = index.checkpoints[0], index.checkpoints[-1]
+        first, second = index.open(first), index.open(second)
+        out = [b"", b""]
+        while True:
+            data = [first.read(11), second.read(13)]
+            if not any(data):
+                break
+            out = [a + b for a, b in zip(out, data)]
+        rows = [index.checkpoints[0].row, index.checkpoints[-1].row]
+        for data, row in zip(out, rows):
+            assert data.endswith(src[src.index(b'<row r="%d"' % row) :])
+
+    def test_close(self, RowIndex):
+        index = build(RowIndex, make_sheet(10), 10, 3)
+        index.close()
+        assert not index.built
+        assert index.checkpoints == []
@@ -207,3 +207,93 @@ def test_hyperlink(WriteOnlyWorksheet):
     ws.append([cell])
     assert cell.hyperlink.ref == "A2"
     ws.close()
+
+
+def _sheet_data(ws):
+    with open(ws._writer.out, "rb") as src:
+        xml = src.read()
+    return xml[xml.index(b"<sheetData") : xml.index(b"</sheetData>")]
+
+
+@pytest.mark.parametrize("iso_dates", [False, True])
+def test_append_many(iso_dates):
+    from .._write_only import WriteOnlyWorksheet
+
+    rows = [
+        [1, 2.5, float("nan"), True, False, -0.0, 10**20, None, "s"],
+        [],
+        [None],
+        ["a&<>\"\r\n\tb", " pad ", "", "=A1*2", "#N/A", "é€😀", "x" * 40000],
+        [datetime.date(2001, 1, 1), datetime.datetime(2020, 1, 2, 3, 4, 5, 6)],
+        (datetime.time(1, 2, 3), datetime.timedelta(hours=30)),
+        range(3),
+    ]
+    sheets = []
+    for method in ("append", "append_values"):
+        wb = DummyWorkbook()
+        wb.iso_dates = iso_dates
+        ws = WriteOnlyWorksheet(wb, title="TestWorksheet")
+        for row in rows:
+            getattr(ws, method)(row)
+        getattr(ws, method)(i for i in [4, 5])
+        ws.close()
+        sheets.append((_sheet_data(ws), list(wb._cell_styles)))
+    assert sheets[0] == sheets[1]
+
+
+def test_append_many_fallback(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    ws.row_dimensions[3].height = 20
+    cell = WriteOnlyCell(ws, value=5)
+    cell.number_format = "0.00"
+    ws.append_many([[1], [cell, 2], [3], (i for i in [4])])
+    ws.close()
+    xml = _sheet_data(ws)
+    assert xml.count(b"<row ") == 4
+    assert b'<c r="A2" s="1" t="n"><v>5</v></c>' in xml
+    assert b'<row r="3" ht="20" customHeight="1">' in xml
+    assert b'<c r="A4" t="n"><v>4</v></c>' in xml
+
+
+def test_append_many_types(WriteOnlyWorksheet):
+    from openpyxl.cell._writer import EMPTY_VALUE
+
+    ws = WriteOnlyWorksheet
+    ws.append_many([[1, "=1"], [None, "x"]], types={1: float, 2: str})
+    ws.close()
+    assert _sheet_data(ws) == (
+        b'<sheetData><row r="1"><c r="A1" t="n"><v>1</v></c><c r="B1"><f>1</f>'
+        + EMPTY_VALUE.encode()
+        + b'</c></row>'
+        b'<row r="2"><c r="B2" t="inlineStr"><is><t>x</t></is></c></row>'
+    )
+
+
+def test_append_many_invalid_type(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    with pytest.raises(ValueError):
+        ws.append_many([[1]], types={1: list})
+
+
+@pytest.mark.parametrize(
+    "value, typ",
+    [
+        ("x", int),
+        (1, str),
+        (True, float),
+        (1, bool),
+        ("2024-01-01", datetime.date),
+    ],
+)
+def test_append_many_wrong_type(WriteOnlyWorksheet, value, typ):
+    ws = WriteOnlyWorksheet
+    with pytest.raises(TypeError, match="Row 2 column 2"):
+        ws.append_many([[1, None], [1, value]], types={2: typ})
+
+
+def test_append_many_illegal_character(WriteOnlyWorksheet):
+    from openpyxl.utils.exceptions import IllegalCharacterError
+
+    ws = WriteOnlyWorksheet
+    with pytest.raises(IllegalCharacterError):
+        ws.append_values(["\x01"])
@@ -0,0 +1,53 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Write members of an archive as a stream, dated when they are written and
+compressed at the level of the archive like those added with `writestr()`.
+
+Before Python 3.13 the compression level cannot be given to a ZipInfo, so
+unless the archive applies its own level to every member, members of archives
+with a level are written to a temporary file which is then copied into the
+archive.
+"""
+import os
+import time
+from contextlib import contextmanager
+from zipfile import ZipInfo
+
+from .threaded import ThreadedArchive
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
+from openpyxl.worksheet._writer import create_temporary_file
+
+
+def can_stream(archive):
+    """
+    Whether members can be written straight into an archive
+    """
+    return (
+        hasattr(ZipInfo, "compress_level")
+        or archive.compresslevel is None
+        or isinstance(archive, ThreadedArchive)
+    )
+
+
+@contextmanager
+def open_member(archive, name, force_zip64=False):
+    """
+    Open a member of an archive for writing
+    """
+    if not can_stream(archive):
+        path = create_temporary_file()
+        try:
+            with open(path, "wb") as out:
+                yield out
+            archive.write(path, name)
+        finally:
+            os.remove(path)
+            ALL_TEMP_FILES.remove(path)
+        return
+
+    zinfo = ZipInfo(name, time.localtime()[:6])
+    zinfo.compress_type = archive.compression
+    if hasattr(zinfo, "compress_level"):
+        zinfo.compress_level = archive.compresslevel
+    with archive.open(zinfo, "w", force_zip64=force_zip64) as out:
+        yield out
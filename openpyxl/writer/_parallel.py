@@ -0,0 +1,158 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Serialise worksheets in other processes. Each worksheet is sent without its
+workbook, which is replaced by the parts of it that the writer needs, and
+is written to a temporary file. Everything else that writing a worksheet
+changes is sent back and applied to the worksheet in the parent, which
+assembles the archive in the usual order.
+
+Styles are numbered in the order in which worksheets use them, so they are
+added to the workbook beforehand, in the same order as when worksheets are
+written one after the other.
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from openpyxl.cell.cell import Cell
+from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.worksheet._writer import create_temporary_file
+
+
+class _Workbook:
+    """
+    The parts of a workbook used to write its worksheets
+    """
+
+    _string_table = None
+
+    def __init__(self, workbook):
+        self._cell_styles = workbook._cell_styles
+        self._differential_styles = workbook._differential_styles
+        self.epoch = workbook.epoch
+        self.iso_dates = workbook.iso_dates
+        self.encoding = workbook.encoding
+
+
+def add_styles(ws):
+    """
+    Add the styles used by a worksheet to its workbook in the order in which
+    writing it would
+    """
+    ws.column_dimensions.to_tree()
+
+    rows = {}
+    for row, col in sorted(ws._cells):
+        rows.setdefault(row, []).append(ws._cells[row, col])
+    dims = ws.row_dimensions
+    for row in sorted(rows.keys() | dims.keys()):
+        if row in dims:
+            dict(dims[row])
+        for cell in rows.get(row, ()):
+            if cell.has_style:
+                cell.style_id
+
+    df = DifferentialStyle()
+    wb = ws.parent
+    for cf in ws.conditional_formatting:
+        for rule in cf.rules:
+            if rule.dxf and rule.dxf != df:
+                rule.dxfId = wb._differential_styles.add(rule.dxf)
+
+
+def dump_worksheet(ws, workbook):
+    """
+    Pickle a worksheet with a stand-in for its workbook. Cells are sent as
+    tuples, which is much quicker. Charts, images and pivot tables are
+    written separately, so only their number is sent.
+    """
+    records = []
+    others = {}
+    for key, cell in ws._cells.items():
+        if cell.__class__ is not Cell:
+            others[key] = cell
+            continue
+        style_id = cell.style_id if cell.has_style else None
+        records.append(
+            (
+                cell.row,
+                cell.column,
+                cell._value,
+                cell.data_type,
+                style_id,
+                cell._hyperlink,
+                cell._comment,
+            )
+        )
+
+    attrs = ("_parent", "_cells", "_charts", "_images", "_pivots")
+    saved = [getattr(ws, attr) for attr in attrs]
+    ws._parent = workbook
+    ws._cells = others
+    ws._charts = [None] * len(ws._charts)
+    ws._images = [None] * len(ws._images)
+    ws._pivots = []
+    try:
+        return pickle.dumps((ws, records), pickle.HIGHEST_PROTOCOL)
+    finally:
+        for attr, value in zip(attrs, saved):
+            setattr(ws, attr, value)
+
+
+def load_worksheet(data):
+    """
+    Unpickle a worksheet and its cells
+    """
+    ws, records = pickle.loads(data)
+    styles = ws.parent._cell_styles
+    cells = ws._cells
+    for row, column, value, data_type, style_id, hyperlink, comment in records:
+        cell = Cell(ws, row, column)
+        cell._value = value
+        cell.data_type = data_type
+        if style_id is not None:
+            cell._style = styles[style_id]
+        cell._hyperlink = hyperlink
+        cell._comment = comment
+        cells[row, column] = cell
+    return ws
+
+
+def write_worksheet(data, path):
+    """
+    Write a pickled worksheet to a file and return what else writing it
+    changed: the relationships, comments and the columns, filters and
+    relationships of its tables
+    """
+    ws = load_worksheet(data)
+    writer = WorksheetWriter(ws, path)
+    writer.write()
+    tables = {
+        table.name: (table.tableColumns, table.autoFilter, table._rel_id)
+        for table in ws.tables.values()
+    }
+    return writer._rels, ws._comments, tables
+
+
+def write_worksheets(worksheets, workers):
+    """
+    Write worksheets in a pool of processes to temporary files and return
+    the paths of the files and the results in the same order
+    """
+    workbook = _Workbook(worksheets[0].parent)
+    for ws in worksheets:
+        add_styles(ws)
+    # the stand-in is pickled with each worksheet once all styles are known
+    data = [dump_worksheet(ws, workbook) for ws in worksheets]
+    paths = [create_temporary_file() for _ in data]
+    try:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(write_worksheet, data, paths))
+    except BaseException:
+        for path in paths:
+            os.remove(path)
+            ALL_TEMP_FILES.remove(path)
+        raise
+    return list(zip(paths, results))
@@ -1,29 +1,44 @@
 # Copyright (c) 2010-2024 openpyxl
 import datetime
+import os
 import re
+import shutil
+from functools import partial
 from zipfile import ZIP_DEFLATED
 from zipfile import ZipFile
 
+from ._member import open_member
+from ._parallel import write_worksheets
 from .theme import theme_xml
+from .threaded import ThreadedArchive
 from openpyxl.comments.comment_sheet import CommentSheet
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.packaging.manifest import Manifest
+from openpyxl.packaging.manifest import Override
 from openpyxl.packaging.relationship import get_rels_path
 from openpyxl.packaging.relationship import Relationship
 from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.styles.stylesheet import write_stylesheet
 from openpyxl.utils.exceptions import InvalidFileException
 from openpyxl.workbook._writer import WorkbookWriter
+from openpyxl.worksheet._lazy import LazyWorksheet
+from openpyxl.worksheet._lazy import source_strings
+from openpyxl.worksheet._lazy import write_lazy_worksheets
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
 from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.writer.strings import SharedStringWriter
 from openpyxl.xml.constants import ARC_APP
 from openpyxl.xml.constants import ARC_CORE
 from openpyxl.xml.constants import ARC_CUSTOM
 from openpyxl.xml.constants import ARC_ROOT_RELS
+from openpyxl.xml.constants import ARC_SHARED_STRINGS
 from openpyxl.xml.constants import ARC_STYLE
 from openpyxl.xml.constants import ARC_THEME
 from openpyxl.xml.constants import ARC_WORKBOOK
 from openpyxl.xml.constants import ARC_WORKBOOK_RELS
 from openpyxl.xml.constants import CPROPS_TYPE
+from openpyxl.xml.constants import SHARED_STRINGS
 from openpyxl.xml.functions import fromstring
 from openpyxl.xml.functions import tostring
 
@@ -31,8 +46,9 @@ from openpyxl.xml.functions import tostring
 class ExcelWriter:
     """Write a workbook object to an Excel file."""
 
-    def __init__(self, workbook, archive):
+    def __init__(self, workbook, archive, workers=None):
         self._archive = archive
+        self.workers = workers
         self.workbook = workbook
         self.manifest = Manifest()
         self.vba_modified = set()
@@ -42,6 +58,8 @@ class ExcelWriter:
         self._drawings = []
         self._comments = []
         self._pivots = []
+        self._lazy = []
+        self._shared_strings = None
 
     def write_data(self):
         from openpyxl.packaging.extended import ExtendedProperties
@@ -78,6 +96,8 @@ class ExcelWriter:
         self._write_charts()
 
         self._write_external_links()
+        self._write_lazy_worksheets()
+        self._write_shared_strings()
 
         stylesheet = write_stylesheet(self.workbook)
         archive.writestr(ARC_STYLE, tostring(stylesheet))
@@ -85,6 +105,9 @@ class ExcelWriter:
         writer = WorkbookWriter(self.workbook)
         archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
         archive.writestr(ARC_WORKBOOK, writer.write())
+        if self._shared_strings is not None:
+            rel = Relationship(type="sharedStrings", Target="/" + self._shared_strings)
+            writer.rels.append(rel)
         archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
 
         self._merge_vba()
@@ -187,31 +210,93 @@ class ExcelWriter:
         comment_rel = Relationship(Id="comments", type=cs._rel_type, Target=cs.path)
         ws._rels.append(comment_rel)
 
-    def write_worksheet(self, ws):
+    def write_worksheet(self, ws, written=None):
         ws._drawing = SpreadsheetDrawing()
         ws._drawing.charts = ws._charts
         ws._drawing.images = ws._images
-        if self.workbook.write_only:
-            if not ws.closed:
-                ws.close()
-            writer = ws._writer
-        else:
-            writer = WorksheetWriter(ws)
-            writer.write()
-
+        if written is not None:
+            # written in another process
+            path, (rels, comments, tables) = written
+            ws._rels = rels
+            ws._comments = comments
+            for name, (columns, auto_filter, rel_id) in tables.items():
+                table = ws.tables[name]
+                table.tableColumns = columns
+                table.autoFilter = auto_filter
+                table._rel_id = rel_id
+            # copied as a serial save writes it
+            try:
+                with open(path, "rb") as src, open_member(
+                    self._archive, ws.path[1:], force_zip64=True
+                ) as out:
+                    shutil.copyfileobj(src, out)
+            finally:
+                os.remove(path)
+                ALL_TEMP_FILES.remove(path)
+            self.manifest.append(ws)
+            return
+
+        if not self.workbook.write_only:
+            # written straight into the archive, whose size is not known
+            # until it has been written
+            with open_member(self._archive, ws.path[1:], force_zip64=True) as out:
+                writer = WorksheetWriter(ws, out)
+                writer.write()
+            ws._rels = writer._rels
+            self.manifest.append(ws)
+            return
+
+        # rows of write-only worksheets can be appended to several worksheets
+        # in turn, so each is written to a temporary file
+        if not ws.closed:
+            ws.close()
+        writer = ws._writer
         ws._rels = writer._rels
         self._archive.write(writer.out, ws.path[1:])
         self.manifest.append(ws)
         writer.cleanup()
 
+    def _write_parallel(self):
+        """
+        Write worksheets in other processes if asked to. Return the results
+        by worksheet.
+        """
+        wb = self.workbook
+        if not self.workers or wb.write_only or wb.share_strings:
+            return {}
+        worksheets = [ws for ws in wb._worksheets() if isinstance(ws, Worksheet)]
+        if len(worksheets) < 2:
+            return {}
+        written = write_worksheets(worksheets, self.workers)
+        return dict(zip(map(id, worksheets), written))
+
     def _write_worksheets(self):
 
         pivot_caches = set()
 
-        for idx, ws in enumerate(self.workbook.worksheets, 1):
+        # worksheets that cannot be copied from the source must be read
+        for ws in self.workbook._worksheets():
+            if isinstance(ws, LazyWorksheet) and not ws.can_copy():
+                ws.load()
+
+        wb = self.workbook
+        if wb.share_strings and not wb.write_only:
+            # strings of worksheets which are copied keep their indices
+            lazy = [ws for ws in wb._worksheets() if isinstance(ws, LazyWorksheet)]
+            source = source_strings(lazy)
+            if source is not None:
+                source = partial(wb._archive.open, source)
+            wb._string_table = SharedStringWriter(wb.max_shared_strings, source)
+
+        written = self._write_parallel()
+        for idx, ws in enumerate(self.workbook._worksheets(), 1):
 
             ws._id = idx
-            self.write_worksheet(ws)
+            if isinstance(ws, LazyWorksheet):
+                self._lazy.append(ws)
+                continue
+
+            self.write_worksheet(ws, written.get(id(ws)))
 
             if ws._drawing:
                 self._write_drawing(ws._drawing)
@@ -255,6 +340,33 @@ class ExcelWriter:
                 rels_path = get_rels_path(ws.path)[1:]
                 self._archive.writestr(rels_path, tostring(tree))
 
+    def _write_lazy_worksheets(self):
+        """Copy worksheets that have not been read from the source archive"""
+        strings, parts = write_lazy_worksheets(
+            self._lazy,
+            self._archive,
+            self.manifest,
+            copy_strings=self.workbook._string_table is None,
+        )
+        self._shared_strings = strings
+        self.vba_modified.update(parts)
+
+    def _write_shared_strings(self):
+        """Write the strings shared by cells"""
+        strings = self.workbook._string_table
+        if strings is None:
+            return
+        try:
+            if len(strings):
+                name = self._shared_strings or ARC_SHARED_STRINGS
+                strings.write(self._archive, name)
+                if self._shared_strings is None:
+                    self.manifest.Override.append(Override("/" + name, SHARED_STRINGS))
+                    self._shared_strings = name
+        finally:
+            strings.close()
+            self.workbook._string_table = None
+
     def _write_external_links(self):
         # delegate to object
         """Write links to external workbooks"""
@@ -276,7 +388,14 @@ class ExcelWriter:
         self._archive.close()
 
 
-def save_workbook(workbook, filename):
+def save_workbook(
+    workbook,
+    filename,
+    workers=None,
+    compresslevel=None,
+    threads=None,
+    store_media=False,
+):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -285,12 +404,32 @@ def save_workbook(workbook, filename):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param workers: the number of processes used to write worksheets. Not used in write-only mode or when strings are shared
+    :type workers: int
+
+    :param compresslevel: the zlib compression level, from 0 to 9
+    :type compresslevel: int
+
+    :param threads: the number of threads used to compress the archive
+    :type threads: int
+
+    :param store_media: store images which are already compressed, such as PNG and JPEG, without compressing them again
+    :type store_media: bool
+
     :rtype: bool
 
     """
-    archive = ZipFile(filename, "w", ZIP_DEFLATED, allowZip64=True)
+    if threads is None and not store_media:
+        archive = ZipFile(
+            filename, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=compresslevel
+        )
+    else:
+        archive = ThreadedArchive(filename, compresslevel, threads, store_media)
     dt = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
     workbook.properties.modified = dt
-    writer = ExcelWriter(workbook, archive)
-    writer.save()
+    writer = ExcelWriter(workbook, archive, workers)
+    try:
+        writer.save()
+    finally:
+        archive.close()
     return True
@@ -0,0 +1,176 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Collect the strings of cells in a shared string table when saving.
+
+Each string is written to the table once, and cells refer to it by its
+index. The strings are looked up in a dictionary which is limited to a
+number of strings, above which new strings are written inline. The table
+itself is kept in a temporary file which is moved to disk when it grows.
+
+The strings of a source table are streamed: they are indexed when the table
+is created and copied as they are when it is written, before the new ones.
+"""
+import re
+import shutil
+from tempfile import SpooledTemporaryFile
+
+from ._member import open_member
+from openpyxl.cell._writer import _escape
+from openpyxl.xml.constants import ARC_SHARED_STRINGS
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import iterelements
+
+# the number of different strings that can be shared
+MAX_SHARED_STRINGS = 2**20
+# bytes of the table kept in memory before spooling to disk
+SPOOL_SIZE = 16 * 1024**2
+
+STRING_TAG = f"{{{SHEET_MAIN_NS}}}si"
+TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+
+CHUNK_SIZE = 64 * 1024
+# the start tag of the root element, after any declaration or comments
+ROOT_RE = re.compile(rb"<(?![?!])([^\s/>]+)([^>]*?)(/?)>")
+ATTR_RE = r"""(\s{}\s*=\s*)(["'])(\d*)\2"""
+
+
+def get_string_table(workbook):
+    """
+    Return the table for the strings of a workbook if they are shared,
+    creating it when it is first needed
+    """
+    if not getattr(workbook, "share_strings", False):
+        return
+    if workbook._string_table is None:
+        workbook._string_table = SharedStringWriter(workbook.max_shared_strings)
+    return workbook._string_table
+
+
+class SharedStringWriter:
+    """
+    Assign indices to strings and write the table.
+
+    If worksheets which are copied from a source archive refer to its table,
+    a function which opens the source table is given, and its strings are
+    kept at the start of the table.
+    """
+
+    def __init__(self, max_strings=MAX_SHARED_STRINGS, source=None):
+        self.max_strings = max_strings
+        self.strings = {}
+        self.added = 0
+        self.count = 0
+        self.file = SpooledTemporaryFile(max_size=SPOOL_SIZE)
+        self.source = source
+        self.offset = 0
+        if source is not None:
+            with source() as src:
+                for idx, item in enumerate(
+                    iterelements(src, (STRING_TAG,), prune=(STRING_TAG,))
+                ):
+                    self.offset += 1
+                    # plain strings in the source are shared as well
+                    if len(item) == 1 and item[0].tag == TEXT_TAG:
+                        text = item[0].text or ""
+                        if text and "_x" not in text:
+                            self.strings.setdefault(text, idx)
+                    item.clear()
+
+    def __len__(self):
+        return self.offset + self.added
+
+    def add(self, value):
+        """
+        Return the index of a string, adding it to the table if necessary,
+        or None if the table is full
+        """
+        idx = self.strings.get(value)
+        if idx is None:
+            if self.added >= self.max_strings:
+                return
+            idx = self.offset + self.added
+            self.strings[value] = idx
+            self.added += 1
+            space = ""
+            if value != value.strip():
+                space = ' xml:space="preserve"'
+            self.file.write(f"<si><t{space}>{_escape(value)}</t></si>".encode("utf-8"))
+        self.count += 1
+        return idx
+
+    def write(self, archive, name=ARC_SHARED_STRINGS):
+        """
+        Write the table to an archive
+        """
+        self.file.seek(0)
+        with open_member(archive, name) as out:
+            if self.source is None:
+                out.write(
+                    f'<sst xmlns="{SHEET_MAIN_NS}" count="{self.count}" '
+                    f'uniqueCount="{len(self)}">'.encode("utf-8")
+                )
+                shutil.copyfileobj(self.file, out)
+                out.write(b"</sst>")
+                return
+
+            with self.source() as src:
+                end_tag = self._copy_source(src, out)
+                shutil.copyfileobj(self.file, out)
+                out.write(end_tag)
+
+    def _root_tag(self, tag, attrs):
+        """
+        The start tag of the source table with the counts of the new one.
+        Strings that are added are in the default namespace.
+        """
+        attrs = attrs.decode("utf-8")
+        count = re.search(ATTR_RE.format("count"), attrs)
+        if count is not None:
+            total = int(count.group(3) or 0) + self.count
+            attrs = re.sub(
+                ATTR_RE.format("count"), rf"\g<1>\g<2>{total}\g<2>", attrs
+            )
+        unique = ATTR_RE.format("uniqueCount")
+        if re.search(unique, attrs):
+            attrs = re.sub(unique, rf"\g<1>\g<2>{len(self)}\g<2>", attrs)
+        else:
+            attrs += f' uniqueCount="{len(self)}"'
+        if not re.search(r"\sxmlns\s*=", attrs):
+            attrs += f' xmlns="{SHEET_MAIN_NS}"'
+        return b"<" + tag + attrs.encode("utf-8") + b">"
+
+    def _copy_source(self, src, out):
+        """
+        Copy the source table up to the end of its strings, and return the
+        end tag of its root element
+        """
+        head = b""
+        match = None
+        while match is None:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                raise ValueError("The source shared string table has no root element")
+            head += chunk
+            match = ROOT_RE.search(head)
+        tag, attrs, empty = match.groups()
+        out.write(head[: match.start()])
+        out.write(self._root_tag(tag, attrs))
+        if empty:
+            return b"</" + tag + b">"
+
+        # the end tag is held back until the whole source has been read
+        buffer = head[match.end() :]
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+            if len(buffer) > 2 * CHUNK_SIZE:
+                out.write(buffer[:-CHUNK_SIZE])
+                buffer = buffer[-CHUNK_SIZE:]
+        idx = buffer.rindex(b"</")
+        out.write(buffer[:idx])
+        return buffer[idx:]
+
+    def close(self):
+        self.file.close()
@@ -203,3 +203,154 @@ def test_modified(tmpdir):
     dest_filename = "empty_book.xlsx"
     save_workbook(wb, dest_filename)
     assert wb.properties.modified > modified
+
+
+@pytest.mark.parametrize(
+    "write_only, method",
+    [(False, "append"), (True, "append"), (True, "append_values")],
+)
+def test_share_strings(tmpdir, write_only, method):
+    from openpyxl.reader.excel import load_workbook
+
+    tmpdir.chdir()
+    wb = Workbook(write_only=write_only, share_strings=True)
+    ws = wb.create_sheet() if write_only else wb.active
+    rows = [["a", 1, "b"], ["a", "c", None]]
+    for row in rows:
+        getattr(ws, method)(row)
+    wb.save("shared.xlsx")
+
+    archive = ZipFile("shared.xlsx")
+    assert b'uniqueCount="3"' in archive.read("xl/sharedStrings.xml")
+    wb = load_workbook("shared.xlsx")
+    assert [list(row) for row in wb.active.values] == rows
+
+
+def test_share_strings_lazy(tmpdir):
+    from openpyxl.reader.excel import load_workbook
+
+    tmpdir.chdir()
+    wb = Workbook(share_strings=True)
+    wb.active.append(["a", "b"])
+    wb.create_sheet("other").append(["c"])
+    wb.save("source.xlsx")
+
+    wb = load_workbook("source.xlsx", lazy_sheets=True)
+    wb.share_strings = True
+    wb["other"].append(["b", "d"])
+    wb.save("copy.xlsx")
+
+    archive = ZipFile("copy.xlsx")
+    assert b'uniqueCount="4"' in archive.read("xl/sharedStrings.xml")
+    wb = load_workbook("copy.xlsx")
+    assert list(wb.active.values) == [("a", "b")]
+    assert list(wb["other"].values) == [("c", None), ("b", "d")]
+
+
+def test_write_parallel(tmpdir, monkeypatch):
+    import struct
+    import time
+
+    from openpyxl.formatting.rule import CellIsRule
+    from openpyxl.styles import Font
+
+    tmpdir.chdir()
+    # members are dated when they are written
+    now = time.struct_time((2024, 1, 2, 3, 4, 5, 1, 2, 0))
+    monkeypatch.setattr(time, "localtime", lambda *args: now)
+
+    def make_workbook():
+        wb = Workbook()
+        for idx in range(3):
+            ws = wb.active if idx == 0 else wb.create_sheet()
+            ws.append(["Name", "Value"])
+            ws.append([f"row{idx}", idx])
+            ws["B2"].font = Font(size=10 + idx)
+            ws["A2"].comment = Comment(f"comment{idx}", "author")
+            ws["A2"].hyperlink = f"http://example.com/{idx}"
+            ws.row_dimensions[4].height = 20 + idx
+            ws.add_table(Table(displayName=f"Table{idx}", ref="A1:B2"))
+            ws.conditional_formatting.add(
+                "B1:B2",
+                CellIsRule(operator="greaterThan", formula=["1"], font=Font(italic=True)),
+            )
+            chart = BarChart()
+            ws.add_chart(chart, "D1")
+        return wb
+
+    make_workbook().save("serial.xlsx")
+    make_workbook().save("parallel.xlsx", workers=2)
+
+    serial = ZipFile("serial.xlsx")
+    parallel = ZipFile("parallel.xlsx")
+    assert parallel.namelist() == serial.namelist()
+    with open("serial.xlsx", "rb") as src:
+        serial_data = src.read()
+    with open("parallel.xlsx", "rb") as src:
+        parallel_data = src.read()
+    # only the time of the properties differs
+    infos = serial.infolist()
+    for info, other in zip(infos, parallel.infolist()):
+        assert other.header_offset == info.header_offset
+        if info.filename != "docProps/core.xml":
+            start = info.header_offset
+            # the local header is followed by the name and extra fields
+            sizes = serial_data[start + 26 : start + 30]
+            end = start + 30 + sum(struct.unpack("<2H", sizes)) + info.compress_size
+            assert parallel_data[start:end] == serial_data[start:end], info.filename
+
+
+def test_write_worksheet_to_archive(ExcelWriter, archive):
+    from openpyxl.worksheet._writer import ALL_TEMP_FILES
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["streamed"])
+    temp_files = list(ALL_TEMP_FILES)
+
+    writer = ExcelWriter(wb, archive)
+    ws._id = 1
+    writer.write_worksheet(ws)
+
+    assert ALL_TEMP_FILES == temp_files
+    assert b"streamed" in archive.read("xl/worksheets/sheet1.xml")
+    # ZIP64 extensions in case the worksheet is larger than 4GB
+    assert archive.getinfo("xl/worksheets/sheet1.xml").extract_version == 45
+
+
+@pytest.mark.parametrize("compresslevel", [None, 0, 9])
+def test_streamed_members(tmp_path, compresslevel):
+    wb = Workbook(share_strings=True)
+    for idx in range(1000):
+        wb.active.append([idx, f"row {idx % 10}"])
+    path = tmp_path / "levels.xlsx"
+    wb.save(path, compresslevel=compresslevel)
+
+    with ZipFile(path) as z:
+        members = [
+            z.getinfo(name)
+            for name in ("xl/worksheets/sheet1.xml", "xl/sharedStrings.xml")
+        ]
+    for info in members:
+        assert info.date_time > (1980, 1, 1, 0, 0, 0)
+    if compresslevel == 0:
+        assert members[0].compress_size >= members[0].file_size
+
+
+def test_write_parallel_failure(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from openpyxl.worksheet._writer import ALL_TEMP_FILES
+    from openpyxl.writer import _parallel
+
+    class FailingExecutor(ThreadPoolExecutor):
+        def map(self, *args):
+            raise RuntimeError("worker failed")
+
+    monkeypatch.setattr(_parallel, "ProcessPoolExecutor", FailingExecutor)
+    wb = Workbook()
+    wb.create_sheet()
+    temp_files = list(ALL_TEMP_FILES)
+    with pytest.raises(RuntimeError):
+        _parallel.write_worksheets(wb.worksheets, 2)
+    assert ALL_TEMP_FILES == temp_files
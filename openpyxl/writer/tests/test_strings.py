@@ -0,0 +1,133 @@
+# Copyright (c) 2010-2024 openpyxl
+from functools import partial
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl.tests.helper import compare_xml
+
+
+@pytest.fixture
+def SharedStringWriter():
+    from ..strings import SharedStringWriter
+
+    return SharedStringWriter
+
+
+class TestSharedStringWriter:
+
+    def test_add(self, SharedStringWriter):
+        strings = SharedStringWriter()
+        assert [strings.add(v) for v in ["a", "b", "a"]] == [0, 1, 0]
+        assert len(strings) == 2
+        assert strings.count == 3
+
+    def test_full(self, SharedStringWriter):
+        strings = SharedStringWriter(max_strings=1)
+        assert [strings.add(v) for v in ["a", "b", "a"]] == [0, None, 0]
+        assert strings.count == 2
+
+    def test_write(self, SharedStringWriter):
+        strings = SharedStringWriter()
+        for value in ["a", " b ", "<&>", "a"]:
+            strings.add(value)
+        archive = ZipFile(BytesIO(), "w")
+        strings.write(archive)
+        xml = archive.read("xl/sharedStrings.xml")
+        expected = """
+        <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="4" uniqueCount="3">
+          <si><t>a</t></si>
+          <si><t xml:space="preserve"> b </t></si>
+          <si><t>&lt;&amp;&gt;</t></si>
+        </sst>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+    def test_source(self, SharedStringWriter):
+        source = b"""
+        <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="5" uniqueCount="2">
+          <si><t>a</t></si>
+          <si><r><t>rich</t></r></si>
+        </sst>
+        """
+        strings = SharedStringWriter(source=partial(BytesIO, source))
+        assert [strings.add(v) for v in ["a", "rich", "c"]] == [0, 2, 3]
+        archive = ZipFile(BytesIO(), "w")
+        strings.write(archive)
+        xml = archive.read("xl/sharedStrings.xml")
+        expected = """
+        <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="8" uniqueCount="4">
+          <si><t>a</t></si>
+          <si><r><t>rich</t></r></si>
+          <si><t>rich</t></si>
+          <si><t>c</t></si>
+        </sst>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+    @pytest.mark.parametrize(
+        "root, end",
+        [
+            (b'<sst xmlns="{ns}" uniqueCount="1">', b"</sst>"),
+            (b"<x:sst xmlns:x='{ns}' count='3' uniqueCount='1'>", b"</x:sst>"),
+        ],
+    )
+    def test_source_copied(self, SharedStringWriter, root, end):
+        from openpyxl.xml.constants import SHEET_MAIN_NS
+
+        root = root.replace(b"{ns}", SHEET_MAIN_NS.encode())
+        prefix = b"x:" if end.startswith(b"</x:") else b""
+        item = b"<%ssi><%st>a &amp; b</%st></%ssi>" % (prefix, prefix, prefix, prefix)
+        source = b'<?xml version="1.0"?>\n' + root + item + end + b"\n"
+        strings = SharedStringWriter(source=partial(BytesIO, source))
+        assert [strings.add(v) for v in ["a & b", "c"]] == [0, 1]
+        archive = ZipFile(BytesIO(), "w")
+        strings.write(archive)
+        xml = archive.read("xl/sharedStrings.xml")
+        # the strings of the source are copied as they are
+        assert item in xml
+        assert xml.rstrip().endswith(b"<si><t>c</t></si>" + end)
+        diff = compare_xml(
+            xml,
+            f"""
+            <sst xmlns="{SHEET_MAIN_NS}" uniqueCount="2" {'count="5"' if prefix else ''}>
+              <si><t>a &amp; b</t></si>
+              <si><t>c</t></si>
+            </sst>
+            """,
+        )
+        assert diff is None, diff
+
+    def test_empty_source(self, SharedStringWriter):
+        from openpyxl.xml.constants import SHEET_MAIN_NS
+
+        source = f'<sst xmlns="{SHEET_MAIN_NS}" count="0" uniqueCount="0"/>'.encode()
+        strings = SharedStringWriter(source=partial(BytesIO, source))
+        strings.add("a")
+        archive = ZipFile(BytesIO(), "w")
+        strings.write(archive)
+        assert archive.read("xl/sharedStrings.xml") == (
+            f'<sst xmlns="{SHEET_MAIN_NS}" count="1" uniqueCount="1">'
+            "<si><t>a</t></si></sst>"
+        ).encode()
+
+    def test_large_source(self, SharedStringWriter, monkeypatch):
+        from openpyxl.writer import strings as module
+        from openpyxl.xml.constants import SHEET_MAIN_NS
+
+        monkeypatch.setattr(module, "CHUNK_SIZE", 16)
+        items = b"".join(b"<si><t>%d</t></si>" % idx for idx in range(100))
+        source = f'<sst xmlns="{SHEET_MAIN_NS}" uniqueCount="100">'.encode()
+        strings = SharedStringWriter(source=partial(BytesIO, source + items + b"</sst>"))
+        assert strings.add("99") == 99
+        assert strings.add("new") == 100
+        archive = ZipFile(BytesIO(), "w")
+        strings.write(archive)
+        assert archive.read("xl/sharedStrings.xml") == (
+            f'<sst xmlns="{SHEET_MAIN_NS}" uniqueCount="101">'.encode()
+            + items
+            + b"<si><t>new</t></si></sst>"
+        )
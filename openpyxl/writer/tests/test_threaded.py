@@ -0,0 +1,161 @@
+# Copyright (c) 2010-2024 openpyxl
+import zlib
+from io import BytesIO
+from zipfile import ZIP_DEFLATED
+from zipfile import ZIP_STORED
+from zipfile import ZipFile
+
+import pytest
+
+from ..threaded import ThreadedArchive
+from ..threaded import deflate
+
+DATA = b"".join(b'<row r="%d"><c><v>%d</v></c></row>' % (i, i * 7) for i in range(5000))
+
+
+class Unseekable(BytesIO):
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise OSError("not seekable")
+
+
+def test_deflate():
+    chunks = [DATA[:1000], DATA[1000:5000], DATA[5000:]]
+    compressed = deflate(chunks[0], 6)
+    compressed += deflate(chunks[1], 6, chunks[0])
+    compressed += deflate(chunks[2], 6, chunks[1], last=True)
+    assert zlib.decompress(compressed, -zlib.MAX_WBITS) == DATA
+
+
+class TestThreadedArchive:
+    @pytest.mark.parametrize("out", [BytesIO, Unseekable])
+    def test_write(self, out):
+        buf = out()
+        with ThreadedArchive(buf, threads=2, chunk_size=4096) as z:
+            z.writestr("data.xml", DATA)
+            z.writestr("empty.xml", b"")
+            with z.open("stream.xml", "w") as dest:
+                for idx in range(0, len(DATA), 1000):
+                    dest.write(DATA[idx : idx + 1000])
+
+        with ZipFile(BytesIO(buf.getvalue())) as z:
+            assert z.testzip() is None
+            assert z.read("data.xml") == DATA
+            assert z.read("empty.xml") == b""
+            assert z.read("stream.xml") == DATA
+            assert z.getinfo("data.xml").compress_type == ZIP_DEFLATED
+
+    @pytest.mark.parametrize(
+        "store_media, compress_type", [(False, ZIP_DEFLATED), (True, ZIP_STORED)]
+    )
+    def test_store_media(self, store_media, compress_type):
+        buf = BytesIO()
+        with ThreadedArchive(buf, store_media=store_media) as z:
+            z.writestr("xl/media/image1.png", b"\x89PNG" * 10)
+        with ZipFile(buf) as z:
+            assert z.getinfo("xl/media/image1.png").compress_type == compress_type
+            assert z.read("xl/media/image1.png") == b"\x89PNG" * 10
+
+    @pytest.mark.parametrize("out", [BytesIO, Unseekable])
+    def test_force_zip64(self, out):
+        buf = out()
+        with ThreadedArchive(buf, threads=2, chunk_size=4096) as z:
+            with z.open("data.xml", "w", force_zip64=True) as dest:
+                dest.write(DATA)
+        with ZipFile(BytesIO(buf.getvalue())) as z:
+            assert z.read("data.xml") == DATA
+
+    @pytest.mark.parametrize("out", [BytesIO, Unseekable])
+    def test_zip64(self, out, monkeypatch):
+        from .. import threaded
+
+        # offsets and sizes beyond the limit are moved to ZIP64 extensions
+        monkeypatch.setattr(threaded, "ZIP64_LIMIT", 1000)
+        buf = out()
+        with ThreadedArchive(buf) as z:
+            for name in ("first.xml", "second.xml"):
+                with z.open(name, "w", force_zip64=True) as dest:
+                    dest.write(DATA)
+        with ZipFile(BytesIO(buf.getvalue())) as z:
+            assert z.testzip() is None
+            assert z.getinfo("second.xml").header_offset > 1000
+            assert z.read("second.xml") == DATA
+
+    def test_too_large(self, monkeypatch):
+        from .. import threaded
+
+        monkeypatch.setattr(threaded, "ZIP64_LIMIT", 1000)
+        with ThreadedArchive(BytesIO()) as z:
+            with pytest.raises(RuntimeError):
+                with z.open("data.xml", "w") as dest:
+                    dest.write(DATA)
+
+    def test_names(self):
+        buf = BytesIO()
+        with ThreadedArchive(buf) as z:
+            z.writestr("xl/données.xml", b"<x/>")
+            z.writestr("stored.xml", b"<x/>", ZIP_STORED)
+            assert z.namelist() == ["xl/données.xml", "stored.xml"]
+        with ZipFile(buf) as z:
+            assert z.read("xl/données.xml") == b"<x/>"
+            assert z.getinfo("stored.xml").compress_type == ZIP_STORED
+
+    def test_write_file(self, tmp_path):
+        path = tmp_path / "data.xml"
+        path.write_bytes(DATA)
+        buf = BytesIO()
+        with ThreadedArchive(buf, threads=2, chunk_size=4096) as z:
+            z.write(path, "xl/data.xml")
+        with ZipFile(buf) as z:
+            assert z.read("xl/data.xml") == DATA
+
+    def test_read(self):
+        with ThreadedArchive(BytesIO()) as z:
+            with pytest.raises(ValueError):
+                z.open("data.xml", "r")
+
+    def test_one_member_at_a_time(self):
+        with ThreadedArchive(BytesIO()) as z:
+            with z.open("first.xml", "w"):
+                with pytest.raises(ValueError):
+                    z.open("second.xml", "w")
+
+    def test_compresslevel(self):
+        sizes = []
+        for level in (0, 9):
+            buf = BytesIO()
+            with ThreadedArchive(buf, compresslevel=level) as z:
+                z.writestr("data.xml", DATA)
+            sizes.append(ZipFile(buf).getinfo("data.xml").compress_size)
+        assert sizes[0] > sizes[1]
+
+
+def test_save_workbook(tmp_path):
+    from openpyxl import Workbook
+    from openpyxl.reader.excel import load_workbook
+
+    wb = Workbook()
+    for idx in range(100):
+        wb.active.append([idx, f"row {idx}"])
+    path = tmp_path / "threaded.xlsx"
+    wb.save(path, threads=2, compresslevel=1, store_media=True)
+
+    wb = load_workbook(path)
+    assert list(wb.active.values)[-1] == (99, "row 99")
+
+
+def test_save_write_only(tmp_path):
+    from openpyxl import Workbook
+    from openpyxl.reader.excel import load_workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for idx in range(100):
+        ws.append([idx, f"row {idx}"])
+    path = tmp_path / "threaded.xlsx"
+    wb.save(path, threads=2)
+
+    wb = load_workbook(path)
+    assert list(wb.active.values)[-1] == (99, "row 99")
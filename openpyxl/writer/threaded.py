@@ -0,0 +1,433 @@
+# Copyright (c) 2010-2024 openpyxl
+"""
+Compress the members of an archive in a pool of threads.
+
+Members are split into chunks which are compressed as raw deflate streams
+at the same time, because zlib releases the GIL. Every chunk but the last
+ends on a byte boundary so that the chunks can be joined into a single
+stream, and each is primed with the end of the previous chunk so that
+little is lost by compressing them separately. The joined stream is written
+to the archive as the member's compressed data.
+
+The archive is written here rather than by ZipFile, which cannot be given
+data which is already compressed. Members are written in turn, followed by
+the central directory when the archive is closed. The CRC and sizes of each
+member are written in its local header once they are known, or after its
+data if the file cannot seek. ZIP64 extensions are used when they are
+needed, or asked for.
+
+Media which is already compressed, such as PNG or JPEG images, can be stored
+as it is.
+"""
+import io
+import os
+import shutil
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZIP64_LIMIT
+from zipfile import ZIP_DEFLATED
+from zipfile import ZIP_STORED
+from zipfile import ZipInfo
+
+CHUNK_SIZE = 1024**2
+# the size of the deflate window, which is carried over between chunks
+WINDOW_SIZE = 32 * 1024
+
+COMPRESSED_MEDIA = (".png", ".jpeg", ".jpg", ".gif")
+
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+END_RECORD = struct.Struct("<4s4H2LH")
+ZIP64_END_RECORD = struct.Struct("<4sQ2H2L4Q")
+ZIP64_LOCATOR = struct.Struct("<4sLQL")
+LOCAL_SIGNATURE = b"PK\x03\x04"
+CENTRAL_SIGNATURE = b"PK\x01\x02"
+END_SIGNATURE = b"PK\x05\x06"
+ZIP64_END_SIGNATURE = b"PK\x06\x06"
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+
+# members of archives which cannot seek are followed by a data descriptor
+HAS_DESCRIPTOR = 0x08
+UTF8_NAME = 0x800
+ZIP64_EXTRA = 0x0001
+DEFAULT_VERSION = 20
+ZIP64_VERSION = 45
+ZIP64_COUNT = 0xFFFF
+
+
+def deflate(data, level, primer=b"", last=False):
+    """
+    Compress a chunk as raw deflate data. Chunks other than the last end on
+    a byte boundary.
+    """
+    options = {"zdict": primer} if primer else {}
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, **options)
+    flush = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return compressor.compress(data) + compressor.flush(flush)
+
+
+class ChunkedCompressor:
+    """
+    A compressor for a member of an archive which compresses chunks of it in
+    threads and returns the compressed data in order
+    """
+
+    def __init__(self, executor, level, threads, chunk_size=CHUNK_SIZE):
+        self.executor = executor
+        self.level = level
+        self.threads = threads
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+        self.primer = b""
+        self.pending = deque()
+
+    def _submit(self, data, last=False):
+        future = self.executor.submit(deflate, data, self.level, self.primer, last)
+        self.pending.append(future)
+        self.primer = data[-WINDOW_SIZE:]
+
+    def compress(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.chunk_size:
+            chunk = bytes(self.buffer[: self.chunk_size])
+            del self.buffer[: self.chunk_size]
+            self._submit(chunk)
+
+        done = []
+        # limit the number of chunks kept in memory
+        while self.pending and (
+            self.pending[0].done() or len(self.pending) > 2 * self.threads
+        ):
+            done.append(self.pending.popleft().result())
+        return b"".join(done)
+
+    def flush(self):
+        self._submit(bytes(self.buffer), last=True)
+        self.buffer = bytearray()
+        done = [future.result() for future in self.pending]
+        self.pending.clear()
+        return b"".join(done)
+
+
+class ThreadedArchive:
+    """
+    An archive for writing which deflates members in a pool of threads and
+    can store compressed media without compressing it again. Members are
+    added with the same methods as to a ZipFile.
+    """
+
+    compression = ZIP_DEFLATED
+
+    def __init__(
+        self,
+        file,
+        compresslevel=None,
+        threads=None,
+        store_media=False,
+        chunk_size=CHUNK_SIZE,
+    ):
+        self.compresslevel = compresslevel
+        self.threads = threads or os.cpu_count() or 1
+        self.store_media = store_media
+        self.chunk_size = chunk_size
+        self._owns_file = isinstance(file, (str, os.PathLike))
+        if self._owns_file:
+            file = open(file, "wb")
+        self.fp = file
+        try:
+            self._seekable = file.seekable()
+        except AttributeError:
+            self._seekable = False
+        self._pos = file.tell() if self._seekable else 0
+        self._members = []
+        self._writing = False
+        self._executor = ThreadPoolExecutor(self.threads)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def namelist(self):
+        return [zinfo.filename for zinfo in self._members]
+
+    def infolist(self):
+        return list(self._members)
+
+    def _write(self, data):
+        self.fp.write(data)
+        self._pos += len(data)
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        zinfo = zinfo_or_arcname
+        if not isinstance(zinfo, ZipInfo):
+            zinfo = ZipInfo(zinfo, time.localtime(time.time())[:6])
+            zinfo.compress_type = self.compression
+        if compress_type is not None:
+            zinfo.compress_type = compress_type
+        zinfo.file_size = len(data)
+        with self.open(zinfo, "w") as dest:
+            dest.write(data)
+
+    def write(self, filename, arcname=None):
+        zinfo = ZipInfo.from_file(filename, arcname)
+        zinfo.compress_type = self.compression
+        with open(filename, "rb") as src, self.open(zinfo, "w") as dest:
+            shutil.copyfileobj(src, dest, CHUNK_SIZE)
+
+    def open(self, name, mode="w", *, force_zip64=False):
+        """
+        Return a file to which the data of a member is written. It must be
+        closed before another member is opened.
+        """
+        if mode != "w":
+            raise ValueError("Members of a ThreadedArchive can only be written")
+        if self.fp is None:
+            raise ValueError("Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to the ZIP file while there is another write handle open on it"
+            )
+
+        zinfo = name
+        if not isinstance(name, ZipInfo):
+            zinfo = ZipInfo(name, time.localtime(time.time())[:6])
+            zinfo.compress_type = self.compression
+        if self.store_media and zinfo.filename.lower().endswith(COMPRESSED_MEDIA):
+            zinfo.compress_type = ZIP_STORED
+        if zinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            raise NotImplementedError("That compression method is not supported")
+
+        compressor = None
+        if zinfo.compress_type == ZIP_DEFLATED:
+            # ZipInfo.compress_level is public from Python 3.13
+            level = getattr(zinfo, "compress_level", None)
+            if level is None:
+                level = self.compresslevel
+            if level is None:
+                level = zlib.Z_DEFAULT_COMPRESSION
+            compressor = ChunkedCompressor(
+                self._executor, level, self.threads, self.chunk_size
+            )
+
+        # compressed data can be larger than the original
+        file_size = getattr(zinfo, "file_size", 0)
+        zip64 = force_zip64 or file_size * 1.05 > ZIP64_LIMIT
+        zinfo.flag_bits = 0 if self._seekable else HAS_DESCRIPTOR
+        if not zinfo.filename.isascii():
+            zinfo.flag_bits |= UTF8_NAME
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+        zinfo.CRC = zinfo.compress_size = zinfo.file_size = 0
+        zinfo.header_offset = self._pos
+        self._write(self._local_header(zinfo, zip64))
+        self._writing = True
+        return _MemberWriter(self, zinfo, compressor, zip64)
+
+    def _local_header(self, zinfo, zip64):
+        compress_size, file_size = zinfo.compress_size, zinfo.file_size
+        extra = b""
+        version = DEFAULT_VERSION
+        if zip64:
+            extra = struct.pack("<2H2Q", ZIP64_EXTRA, 16, file_size, compress_size)
+            compress_size = file_size = 0xFFFFFFFF
+            version = ZIP64_VERSION
+        name = _encode_name(zinfo)
+        dostime, dosdate = _dos_time(zinfo.date_time)
+        header = LOCAL_HEADER.pack(
+            LOCAL_SIGNATURE,
+            version,
+            0,
+            zinfo.flag_bits,
+            zinfo.compress_type,
+            dostime,
+            dosdate,
+            zinfo.CRC,
+            compress_size,
+            file_size,
+            len(name),
+            len(extra),
+        )
+        return header + name + extra
+
+    def _finish_member(self, zinfo, zip64):
+        """
+        Write the CRC and sizes of a member whose data has been written
+        """
+        if zinfo.flag_bits & HAS_DESCRIPTOR:
+            fmt = "<4sL2Q" if zip64 else "<4s3L"
+            self._write(
+                struct.pack(
+                    fmt,
+                    DESCRIPTOR_SIGNATURE,
+                    zinfo.CRC,
+                    zinfo.compress_size,
+                    zinfo.file_size,
+                )
+            )
+        else:
+            self.fp.seek(zinfo.header_offset)
+            self.fp.write(self._local_header(zinfo, zip64))
+            self.fp.seek(self._pos)
+        self._members.append(zinfo)
+
+    def _write_central_directory(self):
+        start = self._pos
+        for zinfo in self._members:
+            file_size, compress_size = zinfo.file_size, zinfo.compress_size
+            header_offset = zinfo.header_offset
+            extra = []
+            if file_size > ZIP64_LIMIT or compress_size > ZIP64_LIMIT:
+                extra += [file_size, compress_size]
+                file_size = compress_size = 0xFFFFFFFF
+            if header_offset > ZIP64_LIMIT:
+                extra.append(header_offset)
+                header_offset = 0xFFFFFFFF
+            version = DEFAULT_VERSION
+            extra_data = b""
+            if extra:
+                version = ZIP64_VERSION
+                extra_data = struct.pack(
+                    f"<2H{len(extra)}Q", ZIP64_EXTRA, 8 * len(extra), *extra
+                )
+            name = _encode_name(zinfo)
+            dostime, dosdate = _dos_time(zinfo.date_time)
+            header = CENTRAL_HEADER.pack(
+                CENTRAL_SIGNATURE,
+                max(version, zinfo.create_version),
+                zinfo.create_system,
+                version,
+                0,
+                zinfo.flag_bits,
+                zinfo.compress_type,
+                dostime,
+                dosdate,
+                zinfo.CRC,
+                compress_size,
+                file_size,
+                len(name),
+                len(extra_data),
+                0,
+                0,
+                zinfo.internal_attr,
+                zinfo.external_attr,
+                header_offset,
+            )
+            self._write(header + name + extra_data)
+
+        count = len(self._members)
+        size = self._pos - start
+        offset = start
+        if count > ZIP64_COUNT or size > ZIP64_LIMIT or offset > ZIP64_LIMIT:
+            end = self._pos
+            self._write(
+                ZIP64_END_RECORD.pack(
+                    ZIP64_END_SIGNATURE,
+                    ZIP64_END_RECORD.size - 12,
+                    ZIP64_VERSION,
+                    ZIP64_VERSION,
+                    0,
+                    0,
+                    count,
+                    count,
+                    size,
+                    offset,
+                )
+            )
+            self._write(ZIP64_LOCATOR.pack(ZIP64_LOCATOR_SIGNATURE, 0, end, 1))
+            count = min(count, ZIP64_COUNT)
+            size = min(size, 0xFFFFFFFF)
+            offset = min(offset, 0xFFFFFFFF)
+        self._write(END_RECORD.pack(END_SIGNATURE, 0, 0, count, count, size, offset, 0))
+
+    def close(self):
+        if self.fp is None:
+            return
+        try:
+            if self._writing:
+                raise ValueError(
+                    "Can't close the ZIP file while there is an open writing handle on it"
+                )
+            self._write_central_directory()
+            self.fp.flush()
+        finally:
+            fp = self.fp
+            self.fp = None
+            self._executor.shutdown()
+            if self._owns_file:
+                fp.close()
+
+
+def _encode_name(zinfo):
+    if zinfo.flag_bits & UTF8_NAME:
+        return zinfo.filename.encode("utf-8")
+    return zinfo.filename.encode("ascii")
+
+
+def _dos_time(date_time):
+    year, month, day, hour, minute, second = date_time
+    return (
+        hour << 11 | minute << 5 | second // 2,
+        (year - 1980) << 9 | month << 5 | day,
+    )
+
+
+class _MemberWriter(io.BufferedIOBase):
+    """
+    A member of a ThreadedArchive being written. Its CRC and sizes are
+    written when it is closed.
+    """
+
+    def __init__(self, archive, zinfo, compressor, zip64):
+        self.archive = archive
+        self.zinfo = zinfo
+        self.compressor = compressor
+        self.zip64 = zip64
+        self.crc = 0
+        self.file_size = 0
+        self.compress_size = 0
+
+    def writable(self):
+        return True
+
+    def _write(self, data):
+        self.compress_size += len(data)
+        self.archive._write(data)
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if not isinstance(data, (bytes, bytearray)):
+            data = memoryview(data).cast("B")
+        self.file_size += len(data)
+        self.crc = zlib.crc32(data, self.crc)
+        if self.compressor is None:
+            self._write(data)
+        else:
+            self._write(self.compressor.compress(data))
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        archive = self.archive
+        zinfo = self.zinfo
+        try:
+            super().close()
+            if self.compressor is not None:
+                self._write(self.compressor.flush())
+            zinfo.CRC = self.crc
+            zinfo.file_size = self.file_size
+            zinfo.compress_size = self.compress_size
+            if not self.zip64 and max(self.file_size, self.compress_size) > ZIP64_LIMIT:
+                raise RuntimeError(f"{zinfo.filename} is too large without force_zip64")
+            archive._finish_member(zinfo, self.zip64)
+        finally:
+            archive._writing = False
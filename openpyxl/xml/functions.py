@@ -4,6 +4,9 @@ XML compatibility functions
 """
 import re
 from functools import partial
+from xml.etree.ElementTree import iterparse as etree_iterparse
+
+from lxml.etree import iterparse as lxml_iterparse
 
 from openpyxl import DEFUSEDXML
 from openpyxl import LXML
@@ -68,3 +71,43 @@ def whitespace(node):
     stripped = node.text.strip()
     if stripped and node.text != stripped:
         node.set(f"{{{XML_NS}}}space", "preserve")
+
+
+XML_ENGINES = ("lxml", "etree")
+
+
+def get_engine(engine=None):
+    """
+    Return the name of the engine used to stream large XML parts.
+    lxml is preferred if it is available.
+    """
+    if engine is None:
+        engine = "lxml" if LXML else "etree"
+    if engine not in XML_ENGINES:
+        raise ValueError(
+            f"{engine!r} is not a valid XML engine, use one of {XML_ENGINES}"
+        )
+    return engine
+
+
+def iterelements(source, tags, engine=None, events=("end",), prune=()):
+    """
+    Stream the elements of source whose tag is in tags.
+
+    lxml filters the tags itself. Elements whose tag is in prune are removed
+    from their parent once the caller is finished with them, so that memory
+    use does not grow with the size of the source.
+    """
+    if get_engine(engine) == "lxml":
+        it = lxml_iterparse(source, events=events, tag=tags, resolve_entities=False)
+        for _, element in it:
+            yield element
+            if element.tag in prune:
+                parent = element.getparent()
+                while element.getprevious() is not None:
+                    del parent[0]
+        return
+
+    for _, element in etree_iterparse(source, events):
+        if element.tag in tags:
+            yield element
@@ -91,3 +91,36 @@ def test_whitespace(value, preserve):
     whitespace(el)
     check = f"{{{XML_NS}}}space" in el.attrib
     assert check is preserve
+
+
+def test_default_engine():
+    from openpyxl import LXML
+
+    from ..functions import get_engine
+
+    assert get_engine() == ("lxml" if LXML else "etree")
+
+
+def test_invalid_engine():
+    from ..functions import get_engine
+
+    with pytest.raises(ValueError):
+        get_engine("sax")
+
+
+@pytest.mark.parametrize("engine", ["lxml", "etree"])
+def test_iterelements(engine):
+    from ..functions import iterelements
+
+    src = b"<root><a>1</a><b /><a>2</a><c><a>3</a></c></root>"
+    values = [el.text for el in iterelements(BytesIO(src), ("a",), engine)]
+    assert values == ["1", "2", "3"]
+
+
+def test_iterelements_prune():
+    from ..functions import iterelements
+
+    src = b"<root><a>1</a><a>2</a><a>3</a></root>"
+    for el in iterelements(BytesIO(src), ("a",), "lxml", prune=("a",)):
+        root = el.getparent()
+    assert [el.text for el in root] == ["3"]